@@ -0,0 +1,35 @@
+"""add job checkpoints
+
+Revision ID: 5f8a2c71d9e3
+Revises: b7d3e91c4a26
+Create Date: 2026-10-19 11:40:27.508196
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f8a2c71d9e3'
+down_revision: Union[str, Sequence[str], None] = 'b7d3e91c4a26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'job_checkpoints',
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('fingerprint', sa.String(length=64), nullable=False),
+        sa.Column('last_id', sa.Integer(), nullable=False),
+        sa.Column('processed', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('name'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('job_checkpoints')
@@ -0,0 +1,45 @@
+"""add item tag scores
+
+Revision ID: 9d4e6b2a8c17
+Revises: 5f8a2c71d9e3
+Create Date: 2026-10-19 14:05:51.730912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4e6b2a8c17'
+down_revision: Union[str, Sequence[str], None] = '5f8a2c71d9e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Existing items keep their links and have no scores until the re-tagging
+    job classifies them.
+    """
+    op.add_column(
+        'items', sa.Column('scores_version', sa.String(length=64), nullable=True)
+    )
+    op.create_table(
+        'item_tag_scores',
+        sa.Column('item_id', sa.Integer(), nullable=False),
+        sa.Column('tag_id', sa.Integer(), nullable=False),
+        sa.Column('score', sa.Integer(), nullable=False),
+        sa.Column('vetoed', sa.Boolean(), server_default='0', nullable=False),
+        sa.ForeignKeyConstraint(['item_id'], ['items.id'], ),
+        sa.ForeignKeyConstraint(['tag_id'], ['weather_tags.id'], ),
+        sa.PrimaryKeyConstraint('item_id', 'tag_id'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('item_tag_scores')
+    op.drop_column('items', 'scores_version')
@@ -0,0 +1,30 @@
+"""index items image filename
+
+Revision ID: a044c5a2861a
+Revises: 7e08821db5fa
+Create Date: 2026-10-18 22:53:09.927288
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a044c5a2861a'
+down_revision: Union[str, Sequence[str], None] = '7e08821db5fa'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        op.f('ix_items_image_filename'), 'items', ['image_filename'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_items_image_filename'), table_name='items')
@@ -0,0 +1,99 @@
+"""add items tag names
+
+Revision ID: b7d3e91c4a26
+Revises: e0fce7607208
+Create Date: 2026-10-19 09:12:05.214339
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d3e91c4a26'
+down_revision: Union[str, Sequence[str], None] = 'e0fce7607208'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JSON_ARRAY_AGGREGATES = {
+    'mysql': 'JSON_ARRAYAGG',
+    'mariadb': 'JSON_ARRAYAGG',
+    'sqlite': 'json_group_array',
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    The column is added with a constant default, which MariaDB applies
+    without rebuilding the table, and then filled from the existing tag
+    links in a single statement. Dialects without a JSON array aggregate
+    are filled item by item instead, which needs a live connection, so
+    that is checked before any DDL runs.
+    """
+    migration_context = op.get_context()
+    dialect = migration_context.dialect.name
+    aggregate = JSON_ARRAY_AGGREGATES.get(dialect)
+    if aggregate is None and migration_context.as_sql:
+        raise NotImplementedError(
+            f'Offline tag name backfill is not supported on {dialect}'
+        )
+
+    op.add_column(
+        'items',
+        sa.Column('tag_names', sa.JSON(), server_default='[]', nullable=False),
+    )
+
+    if aggregate is None:
+        _backfill_item_by_item()
+        return
+    op.execute(
+        'UPDATE items SET tag_names = ('
+        f'SELECT {aggregate}(weather_tags.name) '
+        'FROM clothing_weather '
+        'JOIN weather_tags ON weather_tags.id = clothing_weather.tag_id '
+        'WHERE clothing_weather.item_id = items.id'
+        ') '
+        'WHERE EXISTS ('
+        'SELECT 1 FROM clothing_weather '
+        'WHERE clothing_weather.item_id = items.id'
+        ')'
+    )
+
+
+def _backfill_item_by_item() -> None:
+    """Fills `tag_names` by grouping the tag links in Python."""
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.text(
+            'SELECT clothing_weather.item_id, weather_tags.name '
+            'FROM clothing_weather '
+            'JOIN weather_tags ON weather_tags.id = clothing_weather.tag_id '
+            'ORDER BY clothing_weather.item_id'
+        )
+    )
+    names: dict[int, list[str]] = {}
+    for item_id, name in rows:
+        names.setdefault(item_id, []).append(name)
+    if not names:
+        return
+
+    items = sa.table(
+        'items', sa.column('id', sa.Integer()), sa.column('tag_names', sa.JSON())
+    )
+    connection.execute(
+        items.update()
+        .where(items.c.id == sa.bindparam('item_id'))
+        .values(tag_names=sa.bindparam('names', type_=sa.JSON())),
+        [
+            {'item_id': item_id, 'names': item_names}
+            for item_id, item_names in names.items()
+        ],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('items', 'tag_names')
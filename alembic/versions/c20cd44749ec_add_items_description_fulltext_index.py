@@ -0,0 +1,41 @@
+"""add items description fulltext index
+
+Revision ID: c20cd44749ec
+Revises: fc5aa6f00221
+Create Date: 2026-10-18 23:08:08.463157
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c20cd44749ec'
+down_revision: Union[str, Sequence[str], None] = 'fc5aa6f00221'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FULLTEXT_DIALECTS = ('mysql', 'mariadb')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_context().dialect.name not in FULLTEXT_DIALECTS:
+        return
+    op.create_index(
+        'ix_items_description_fulltext',
+        'items',
+        ['description'],
+        unique=False,
+        mysql_prefix='FULLTEXT',
+        mariadb_prefix='FULLTEXT',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_context().dialect.name not in FULLTEXT_DIALECTS:
+        return
+    op.drop_index('ix_items_description_fulltext', table_name='items')
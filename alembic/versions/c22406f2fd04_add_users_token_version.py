@@ -0,0 +1,33 @@
+"""add users token version
+
+Revision ID: c22406f2fd04
+Revises: c20cd44749ec
+Create Date: 2026-10-18 23:10:41.539717
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c22406f2fd04'
+down_revision: Union[str, Sequence[str], None] = 'c20cd44749ec'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'users',
+        sa.Column(
+            'token_version', sa.Integer(), server_default='0', nullable=False
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'token_version')
@@ -0,0 +1,105 @@
+"""add owner and tag lookup indexes
+
+Revision ID: e0fce7607208
+Revises: c22406f2fd04
+Create Date: 2026-10-18 23:21:43.546608
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e0fce7607208'
+down_revision: Union[str, Sequence[str], None] = 'c22406f2fd04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ONLINE_DDL_DIALECTS = ('mysql', 'mariadb')
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    On MariaDB the indexes are built in place without blocking writes. The
+    InnoDB indexes created implicitly for the `owner_id` and `tag_id` foreign
+    keys are dropped by the server once the composite indexes cover them.
+    Changing the type of `confidence` always copies the table, so that step
+    only allows concurrent reads.
+    """
+    if op.get_context().dialect.name in ONLINE_DDL_DIALECTS:
+        op.execute(
+            'ALTER TABLE items '
+            'ADD INDEX ix_items_owner_id_id (owner_id, id), '
+            'ALGORITHM=INPLACE, LOCK=NONE'
+        )
+        op.execute(
+            'ALTER TABLE clothing_weather '
+            'ADD INDEX ix_clothing_weather_tag_id_item_id (tag_id, item_id), '
+            'ALGORITHM=INPLACE, LOCK=NONE'
+        )
+        op.execute(
+            'ALTER TABLE clothing_weather '
+            'MODIFY confidence INTEGER NOT NULL, '
+            'ALGORITHM=COPY, LOCK=SHARED'
+        )
+        return
+
+    op.create_index(
+        'ix_items_owner_id_id', 'items', ['owner_id', 'id'], unique=False
+    )
+    op.create_index(
+        'ix_clothing_weather_tag_id_item_id',
+        'clothing_weather',
+        ['tag_id', 'item_id'],
+        unique=False,
+    )
+    with op.batch_alter_table('clothing_weather') as batch_op:
+        batch_op.alter_column(
+            'confidence',
+            existing_type=sa.Float(),
+            type_=sa.Integer(),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema.
+
+    On MariaDB the single-column foreign key indexes are restored in the
+    same statement that drops the composite ones, since a foreign key must
+    never be left without an index.
+    """
+    if op.get_context().dialect.name in ONLINE_DDL_DIALECTS:
+        op.execute(
+            'ALTER TABLE clothing_weather '
+            'MODIFY confidence FLOAT NOT NULL, '
+            'ALGORITHM=COPY, LOCK=SHARED'
+        )
+        op.execute(
+            'ALTER TABLE clothing_weather '
+            'ADD INDEX tag_id (tag_id), '
+            'DROP INDEX ix_clothing_weather_tag_id_item_id, '
+            'ALGORITHM=INPLACE, LOCK=NONE'
+        )
+        op.execute(
+            'ALTER TABLE items '
+            'ADD INDEX owner_id (owner_id), '
+            'DROP INDEX ix_items_owner_id_id, '
+            'ALGORITHM=INPLACE, LOCK=NONE'
+        )
+        return
+
+    with op.batch_alter_table('clothing_weather') as batch_op:
+        batch_op.alter_column(
+            'confidence',
+            existing_type=sa.Integer(),
+            type_=sa.Float(),
+            existing_nullable=False,
+        )
+    op.drop_index(
+        'ix_clothing_weather_tag_id_item_id', table_name='clothing_weather'
+    )
+    op.drop_index('ix_items_owner_id_id', table_name='items')
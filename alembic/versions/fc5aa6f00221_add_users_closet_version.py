@@ -0,0 +1,33 @@
+"""add users closet version
+
+Revision ID: fc5aa6f00221
+Revises: a044c5a2861a
+Create Date: 2026-10-18 23:05:31.878530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fc5aa6f00221'
+down_revision: Union[str, Sequence[str], None] = 'a044c5a2861a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'users',
+        sa.Column(
+            'closet_version', sa.Integer(), server_default='0', nullable=False
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'closet_version')
@@ -0,0 +1,117 @@
+"""Benchmarks bcrypt on this machine and recommends a cost factor.
+
+Usage:
+    python -m app.cli.calibrate_bcrypt --target-ms 250
+
+The recommended value goes into the `BCRYPT_ROUNDS` setting. Existing
+hashes keep working and are rehashed with the new cost on the next login.
+"""
+
+import argparse
+import statistics
+import time
+
+from passlib.hash import bcrypt
+
+MIN_ROUNDS = 4
+MAX_ROUNDS = 31
+SAMPLE_PASSWORD = "Calibration-Password-1!"
+
+
+def measure_rounds(rounds: int, samples: int) -> float:
+    """Measures the median time of one bcrypt hash.
+
+    Args:
+        rounds (int): The bcrypt cost factor.
+        samples (int): The number of hashes to time.
+
+    Returns:
+        float: The median duration in seconds.
+    """
+    hasher = bcrypt.using(rounds=rounds)
+    durations = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        hasher.hash(SAMPLE_PASSWORD)
+        durations.append(time.perf_counter() - started)
+    return statistics.median(durations)
+
+
+def calibrate(
+    target_seconds: float, min_rounds: int, samples: int
+) -> tuple[int, dict[int, float]]:
+    """Finds the highest cost whose hash time stays within a target.
+
+    Each extra round doubles the cost, so rounds are measured from
+    `min_rounds` upwards until the target is exceeded.
+
+    Args:
+        target_seconds (float): The latency budget of one hash in seconds.
+        min_rounds (int): The lowest acceptable cost factor.
+        samples (int): The number of hashes timed per cost factor.
+
+    Returns:
+        tuple[int, dict[int, float]]: The recommended cost factor and the
+            median duration measured for each cost factor tried.
+    """
+    timings = {}
+    recommended = min_rounds
+    for rounds in range(min_rounds, MAX_ROUNDS + 1):
+        timings[rounds] = measure_rounds(rounds, samples)
+        if timings[rounds] > target_seconds:
+            break
+        recommended = rounds
+    return recommended, timings
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Runs the calibration and prints the recommended setting.
+
+    Args:
+        argv (list[str] | None): Command line arguments, defaulting to
+            `sys.argv`.
+
+    Returns:
+        int: The process exit code.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--target-ms",
+        type=float,
+        default=250,
+        help="latency budget of one hash in milliseconds (default: 250)",
+    )
+    parser.add_argument(
+        "--min-rounds",
+        type=int,
+        default=10,
+        help="lowest acceptable cost factor (default: 10)",
+    )
+    parser.add_argument(
+        "--samples",
+        type=int,
+        default=3,
+        help="hashes timed per cost factor (default: 3)",
+    )
+    args = parser.parse_args(argv)
+
+    if not MIN_ROUNDS <= args.min_rounds <= MAX_ROUNDS:
+        parser.error(f"--min-rounds must be between {MIN_ROUNDS} and {MAX_ROUNDS}")
+
+    recommended, timings = calibrate(
+        args.target_ms / 1000, args.min_rounds, max(1, args.samples)
+    )
+
+    for rounds, seconds in timings.items():
+        print(f"rounds={rounds:2d}  {seconds * 1000:8.1f} ms")
+    if timings[recommended] > args.target_ms / 1000:
+        print(
+            f"Even the minimum of {args.min_rounds} rounds exceeds the "
+            f"{args.target_ms:g} ms target on this machine."
+        )
+    print(f"BCRYPT_ROUNDS={recommended}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
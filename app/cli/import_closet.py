@@ -0,0 +1,120 @@
+"""Imports a closet export into a user's closet.
+
+Usage:
+    python -m app.cli.import_closet user@example.com closet.ndjson
+
+The file has the format produced by `GET /closet/export`; pass `-` to read
+standard input. It is read in chunks and the items are inserted in batches,
+so files of any size can be imported. Items without tags are left untagged
+unless `--classify` loads the classifier to tag them in bulk.
+"""
+
+import argparse
+import sys
+from typing import BinaryIO
+
+from sqlalchemy.orm import Session
+
+from app.crud.tag_repo import create_items_with_tags
+from app.crud.user_repo import get_user_by_email
+from app.database.session import SessionLocal
+from app.routers.closet import image_store
+from app.services.closet_import import (
+    IMPORT_BATCH_SIZE,
+    ClosetImport,
+    prepare_entries,
+)
+from app.services.image_storage import ImageStore
+
+READ_CHUNK_BYTES = 64 * 1024
+
+
+def import_stream(
+    db: Session,
+    owner_id: int,
+    source: BinaryIO,
+    store: ImageStore,
+    ai_service=None,
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> tuple[int, ClosetImport]:
+    """Imports newline-delimited JSON items from a binary stream.
+
+    Args:
+        db (Session): The database session.
+        owner_id (int): The unique ID of the user receiving the items.
+        source (BinaryIO): The stream to read.
+        store (ImageStore): The store holding item images.
+        ai_service (AIService | None): The classifier for untagged items.
+        batch_size (int): The number of items inserted per transaction.
+
+    Returns:
+        tuple[int, ClosetImport]: The number of items created and the
+            import state holding the rejected lines.
+    """
+    closet_import = ClosetImport(batch_size=batch_size)
+    imported = 0
+
+    def write(batches):
+        count = 0
+        for batch in batches:
+            entries, scores = prepare_entries(batch, store, ai_service)
+            count += len(create_items_with_tags(db, owner_id, entries, scores))
+        return count
+
+    while chunk := source.read(READ_CHUNK_BYTES):
+        imported += write(closet_import.feed(chunk))
+    imported += write(closet_import.finish())
+    return imported, closet_import
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Runs the import and prints a summary.
+
+    Args:
+        argv (list[str] | None): Command line arguments, defaulting to
+            `sys.argv`.
+
+    Returns:
+        int: The process exit code.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("email", help="email address of the receiving user")
+    parser.add_argument("file", help="closet export to import, or - for stdin")
+    parser.add_argument(
+        "--classify",
+        action="store_true",
+        help="tag items that have no tags with the classifier",
+    )
+    args = parser.parse_args(argv)
+
+    ai_service = None
+    if args.classify:
+        # Imported here, as loading transformers takes several seconds.
+        from app.services.ai_service import AIService
+
+        ai_service = AIService()
+
+    with SessionLocal() as db:
+        user = get_user_by_email(db, args.email)
+        if user is None:
+            print(f"No user with email {args.email}.", file=sys.stderr)
+            return 1
+
+        if args.file == "-":
+            imported, closet_import = import_stream(
+                db, user.id, sys.stdin.buffer, image_store, ai_service
+            )
+        else:
+            with open(args.file, "rb") as source:
+                imported, closet_import = import_stream(
+                    db, user.id, source, image_store, ai_service
+                )
+
+    for error in closet_import.errors:
+        print(f"line {error['line']}: {error['error']}", file=sys.stderr)
+    print(f"Imported {imported} items, rejected {closet_import.rejected} lines.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
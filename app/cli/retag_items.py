@@ -0,0 +1,105 @@
+"""Classifies existing items again and rewrites their weather tags.
+
+Usage:
+    python -m app.cli.retag_items [--user user@example.com]
+    python -m app.cli.retag_items --rebuild [--user user@example.com]
+
+Run it after changing the candidate labels, the hypothesis template or the
+model; items already scored by the current setup are skipped. Progress is
+saved after every batch, so an interrupted run continues where it stopped
+when started again; `--restart` scans from the beginning.
+
+After changing only `ITEM_TAG_THRESHOLD` or `LABEL_TAG_THRESHOLDS` in
+`app.core.utils`, the thresholds new items are tagged with, `--rebuild`
+derives the tags of items scored by the current setup from their stored
+scores in a few SQL statements, without loading the classifier.
+"""
+
+import argparse
+import sys
+import time
+
+from app.crud.tag_repo import rebuild_item_tags
+from app.crud.user_repo import get_user_by_email
+from app.database.session import SessionLocal
+from app.services.retag_job import INFERENCE_BATCH_SIZE, RETAG_BATCH_SIZE, RetagJob
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Runs the re-tagging job and prints its progress.
+
+    Args:
+        argv (list[str] | None): Command line arguments, defaulting to
+            `sys.argv`.
+
+    Returns:
+        int: The process exit code.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--user", help="only re-tag the items of this email")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=RETAG_BATCH_SIZE,
+        help="items classified and written per transaction",
+    )
+    parser.add_argument(
+        "--inference-batch-size",
+        type=int,
+        default=INFERENCE_BATCH_SIZE,
+        help="premise/hypothesis pairs per forward pass of the model",
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="ignore saved progress and start from the first item",
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="derive tags from stored scores instead of classifying",
+    )
+    args = parser.parse_args(argv)
+
+    owner_id = None
+    if args.user:
+        with SessionLocal() as db:
+            user = get_user_by_email(db, args.user)
+        if user is None:
+            print(f"No user with email {args.user}.", file=sys.stderr)
+            return 1
+        owner_id = user.id
+
+    if args.rebuild:
+        with SessionLocal() as db:
+            written = rebuild_item_tags(db, owner_id=owner_id)
+            db.commit()
+        print(f"Rebuilt {written} tag links from stored scores.")
+        return 0
+
+    # Imported here, as loading transformers takes several seconds.
+    from app.services.ai_service import AIService
+
+    job = RetagJob(
+        SessionLocal,
+        AIService(),
+        owner_id=owner_id,
+        batch_size=args.batch_size,
+        inference_batch_size=args.inference_batch_size,
+    )
+    started = time.perf_counter()
+
+    def report(processed: int, changed: int) -> None:
+        minutes = (time.perf_counter() - started) / 60
+        print(
+            f"{processed} items processed, {changed} changed, "
+            f"{processed / minutes:.0f} items/min"
+        )
+
+    result = job.run(restart=args.restart, progress=report)
+    print(f"Re-tagged {result['processed']} items, {result['changed']} changed.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
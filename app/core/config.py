@@ -3,6 +3,8 @@
 This module handles loading and validating environment variables using Pydantic.
 """
 
+from typing import Literal
+
 from pydantic import Field, MariaDBDsn
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -12,17 +14,65 @@ class Settings(BaseSettings):
 
     Attributes:
         database_url (MariaDBDsn): The database connection URL.
+        database_replica_urls (list[MariaDBDsn]): Connection URLs of read replicas. Defaults to none.
+        replica_check_interval (int): Seconds between read replica health checks. Defaults to 10.
+        replica_sticky_seconds (int): Seconds a user's reads go to the primary after they change data. Defaults to 5.
+        web_concurrency (int): Number of worker processes per node, as passed to the server. Defaults to 1.
+        db_max_connections (int): Connections all workers of a node may open to one database server. Defaults to 34.
+        db_pool_liveness (str): "pre_ping" to test every connection on checkout, or "idle" to test only connections idle for `db_pool_idle_ping_seconds`. Defaults to "pre_ping".
+        db_pool_idle_ping_seconds (int): Idle time after which a connection is tested with the "idle" policy. Defaults to 30.
+        db_pool_recycle_seconds (int): Age after which pooled connections are replaced, -1 to never replace them. Defaults to 30 minutes.
+        query_log_threshold (int): SQL statements per request above which the request is logged. Defaults to 25.
+        query_repeat_threshold (int): Executions of one statement within a request reported as a likely N+1 query. Defaults to 5.
         openweather_api_key (str): API key for OpenWeatherMap (32 hex characters).
         secret_key (str): Secret key for JWT encoding and decoding.
         algorithm (str): The algorithm used for JWT encryption. Defaults to "HS256".
         access_token_expire_minutes (int): usage duration of access tokens. Defaults to 30.
+        user_cache_ttl_seconds (int): Seconds an authenticated user stays cached in process. Defaults to 60.
+        user_cache_size (int): Maximum number of users cached in process, 0 disables the cache. Defaults to 4096.
+        bcrypt_rounds (int): The bcrypt cost factor for new password hashes. Defaults to 12.
+        password_workers (int): Number of threads running bcrypt. Defaults to 2.
+        password_queue_limit (int): Password operations allowed to wait for a thread before new ones are rejected. Defaults to 32.
+        login_attempts_per_account (int): Failed logins allowed per account within the throttle window. Defaults to 5.
+        login_attempts_per_ip (int): Failed logins allowed per client address within the throttle window. Defaults to 50.
+        login_throttle_window_seconds (int): Length of the login throttle window. Defaults to 15 minutes.
+        max_upload_bytes (int): Maximum accepted size of an uploaded image. Defaults to 10 MiB.
+        image_workers (int): Number of processes generating image variants. Defaults to 2.
+        retag_workers (int): Number of re-tagging jobs of the API running at once. Defaults to 1.
+        retag_queue_limit (int): Re-tagging jobs allowed to wait for a worker before new ones are rejected. Defaults to 8.
+        image_reconcile_interval (int): Seconds between scans for orphaned images, 0 disables them. Defaults to one day.
+        metrics_token (str | None): Bearer token required by the metrics endpoints, which are disabled without one. Defaults to None.
     """
 
     database_url: MariaDBDsn
+    database_replica_urls: list[MariaDBDsn] = []
+    replica_check_interval: int = 10
+    replica_sticky_seconds: int = 5
+    web_concurrency: int = Field(default=1, ge=1)
+    db_max_connections: int = Field(default=34, ge=2)
+    db_pool_liveness: Literal["pre_ping", "idle"] = "pre_ping"
+    db_pool_idle_ping_seconds: int = 30
+    db_pool_recycle_seconds: int = 30 * 60
+    query_log_threshold: int = 25
+    query_repeat_threshold: int = Field(default=5, ge=2)
     openweather_api_key: str = Field(pattern=r"^[a-fA-F0-9]{32}$")
     secret_key: str
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    user_cache_ttl_seconds: int = 60
+    user_cache_size: int = 4096
+    bcrypt_rounds: int = Field(default=12, ge=4, le=31)
+    password_workers: int = 2
+    password_queue_limit: int = 32
+    login_attempts_per_account: int = 5
+    login_attempts_per_ip: int = 50
+    login_throttle_window_seconds: int = 15 * 60
+    max_upload_bytes: int = 10 * 1024 * 1024
+    image_workers: int = 2
+    retag_workers: int = 1
+    retag_queue_limit: int = 8
+    image_reconcile_interval: int = 24 * 60 * 60
+    metrics_token: str | None = None
     
     model_config = SettingsConfigDict(env_file=".env")
 
@@ -0,0 +1,36 @@
+"""Helpers for entity tags and conditional requests."""
+
+import hashlib
+
+
+def weak_etag(*parts: object) -> str:
+    """Builds a weak ETag from the values a response is derived from.
+
+    Args:
+        *parts (object): The values identifying the representation.
+
+    Returns:
+        str: The weak, quoted ETag value.
+    """
+    digest = hashlib.sha256(repr(parts).encode()).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Checks an If-None-Match header against an ETag.
+
+    Uses the weak comparison required for `If-None-Match`, so strong and weak
+    forms of the same tag match.
+
+    Args:
+        if_none_match (str): The raw header value.
+        etag (str): The current quoted ETag.
+
+    Returns:
+        bool: True if the client already holds the current representation.
+    """
+    etag = etag.removeprefix("W/")
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(
+        tag.removeprefix("W/") == etag for tag in candidates
+    )
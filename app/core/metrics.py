@@ -0,0 +1,63 @@
+"""Lightweight in-process metrics."""
+
+import bisect
+import math
+import threading
+from typing import Sequence
+
+DEFAULT_LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+class Histogram:
+    """A thread-safe histogram of durations with cumulative buckets.
+
+    Attributes:
+        buckets (tuple[float, ...]): The upper bounds of the buckets in seconds.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        """Initializes an empty histogram.
+
+        Args:
+            buckets (Sequence[float]): The upper bounds of the buckets in seconds.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Records one duration.
+
+        Args:
+            value (float): The duration in seconds.
+        """
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._max = max(self._max, value)
+
+    def snapshot(self) -> dict:
+        """Returns the current state of the histogram.
+
+        Returns:
+            dict: The observation `count`, `sum` and `max` in seconds, and
+                the cumulative count per bucket upper bound.
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total, maximum = self._sum, self._max
+
+        cumulative, running = {}, 0
+        for bound, count in zip((*self.buckets, math.inf), counts):
+            running += count
+            cumulative["+Inf" if bound == math.inf else str(bound)] = running
+
+        return {
+            "count": running,
+            "sum": total,
+            "max": maximum,
+            "buckets": cumulative,
+        }
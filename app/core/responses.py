@@ -0,0 +1,44 @@
+"""JSON responses and newline-delimited JSON encoded with orjson."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+class FastJSONResponse(JSONResponse):
+    """A JSON response encoded with orjson.
+
+    It is the application's default response class. Handlers on hot paths
+    return it directly with content they built themselves, which skips
+    FastAPI's response model validation and `jsonable_encoder`. Such content
+    must only hold JSON types, datetimes, UUIDs and dataclasses.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Encodes the content.
+
+        Args:
+            content (Any): The data to encode.
+
+        Returns:
+            bytes: The compact UTF-8 JSON document.
+        """
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def json_line(content: Any) -> bytes:
+    """Encodes one line of newline-delimited JSON.
+
+    Args:
+        content (Any): The data to encode, with the same restrictions as the
+            content of a `FastJSONResponse`.
+
+    Returns:
+        bytes: The compact JSON document followed by a newline.
+    """
+    return orjson.dumps(
+        content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+    )
@@ -7,7 +7,9 @@ from passlib.context import CryptContext
 
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.bcrypt_rounds
+)
 
 
 def get_password_hash(password: str) -> str:
@@ -35,11 +37,36 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(secret=plain_password, hash=hashed_password)
 
 
-def create_access_token(subject: str) -> str:
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """Verifies a password and rehashes it if its hash is outdated.
+
+    A hash is outdated when it uses a deprecated scheme or a bcrypt cost
+    other than the configured `bcrypt_rounds`.
+
+    Args:
+        plain_password (str): The plain text password to verify.
+        hashed_password (str): The stored hashed password.
+
+    Returns:
+        tuple[bool, str | None]: Whether the password matches, and the new
+            hash to store if the password matches and the stored hash is
+            outdated.
+    """
+    return pwd_context.verify_and_update(secret=plain_password, hash=hashed_password)
+
+
+def create_access_token(
+    subject: str, user_id: int | None = None, token_version: int | None = None
+) -> str:
     """Creates a JWT access token for a subject.
 
     Args:
         subject (str): The subject (identity) for the token, typically an email.
+        user_id (int | None): The numeric user ID, stored as the `uid` claim.
+        token_version (int | None): The user's token version, stored as the
+            `ver` claim so the token can be revoked.
 
     Returns:
         str: The encoded JWT access token string.
@@ -49,6 +76,9 @@ def create_access_token(subject: str) -> str:
     )
 
     to_encode = {"exp": expire, "sub": str(subject)}
+    if user_id is not None and token_version is not None:
+        to_encode["uid"] = user_id
+        to_encode["ver"] = token_version
 
     encoded_jwt = jwt.encode(
         to_encode, settings.secret_key, algorithm=settings.algorithm
@@ -1,5 +1,11 @@
 """Utility functions and constants for weather and clothing analysis."""
 
+import hashlib
+import json
+from functools import cache
+
+CLASSIFIER_MODEL = "facebook/bart-large-mnli"
+
 CANDIDATE_LABELS = [
     "Rain",
     "Cold",
@@ -14,6 +20,13 @@ CANDIDATE_LABELS = [
     "Cool",
 ]
 
+ITEM_HYPOTHESIS_TEMPLATE = "This item is worn when the weather is {}."
+
+ITEM_TAG_THRESHOLD = 70
+
+# Labels whose tags need a score other than `ITEM_TAG_THRESHOLD`.
+LABEL_TAG_THRESHOLDS: dict[str, int] = {}
+
 INCOMPATIBLE_KEYWORDS = {
     "Freezing": [
         "short sleeve",
@@ -522,6 +535,69 @@ INCOMPATIBLE_KEYWORDS = {
 }
 
 
+def vetoed_labels(description: str, labels) -> set[str]:
+    """Finds the labels ruled out by keywords of an item description.
+
+    Args:
+        description (str): The item description.
+        labels (Iterable[str]): The labels to check.
+
+    Returns:
+        set[str]: The labels with an incompatible keyword in the description.
+    """
+    text = description.lower()
+    return {
+        label
+        for label in labels
+        if any(k in text for k in INCOMPATIBLE_KEYWORDS.get(label, []))
+    }
+
+
+def select_item_tags(description: str, scores: dict[str, int]) -> dict[str, int]:
+    """Selects the weather tags to attach to an item from classifier scores.
+
+    Labels scoring at or below their threshold, `ITEM_TAG_THRESHOLD` unless
+    `LABEL_TAG_THRESHOLDS` sets another, are dropped, as are labels whose
+    incompatible keywords appear in the description.
+
+    Args:
+        description (str): The item description.
+        scores (dict[str, int]): Confidence percentages per label.
+
+    Returns:
+        dict[str, int]: The selected labels and their confidence.
+    """
+    vetoed = vetoed_labels(description, scores)
+    return {
+        label: score
+        for label, score in scores.items()
+        if score > LABEL_TAG_THRESHOLDS.get(label, ITEM_TAG_THRESHOLD)
+        and label not in vetoed
+    }
+
+
+@cache
+def scores_version(model_name: str = CLASSIFIER_MODEL) -> str:
+    """Digests everything that decides the stored scores of an item.
+
+    Thresholds are left out: stored scores stay valid when they change.
+
+    Args:
+        model_name (str): The name of the classifier model.
+
+    Returns:
+        str: A hex SHA-256 digest of the model, the candidate labels, the
+            hypothesis template and the incompatible keywords.
+    """
+    setup = {
+        "model": model_name,
+        "labels": CANDIDATE_LABELS,
+        "template": ITEM_HYPOTHESIS_TEMPLATE,
+        "incompatible": INCOMPATIBLE_KEYWORDS,
+    }
+    return hashlib.sha256(json.dumps(setup, sort_keys=True).encode()).hexdigest()
+
+
 def get_temperature_label(temp: float) -> str:
     """Converts a numerical temperature into a descriptive weather label.
 
@@ -1,13 +1,23 @@
 """Data access operations for Items."""
 
-from typing import Sequence
+import re
+from typing import AsyncIterator, Collection, Iterator, Sequence
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import Row, Select, delete, func, or_, select
+from sqlalchemy.dialects import mysql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
-from app.database.models import ClothingWeather, Item
+from app.crud.tag_registry import tag_registry
+from app.crud.user_repo import bump_closet_version
+from app.database.models import ClothingWeather, Item, ItemTagScore, WeatherTag
 from app.schemas.item import ItemCreate
 
+SEARCH_TOKEN = re.compile(r"\w+")
+FULLTEXT_MIN_TOKEN = 3
+MAX_SEARCH_TERMS = 8
+STREAM_BATCH_SIZE = 500
+
 
 def create_item(db: Session, item: ItemCreate, owner_id: int) -> Item:
     """Persists a new item in the database.
@@ -27,6 +37,7 @@ def create_item(db: Session, item: ItemCreate, owner_id: int) -> Item:
     )
 
     db.add(new_item)
+    bump_closet_version(db, owner_id)
     db.commit()
     db.refresh(new_item)
 
@@ -41,14 +52,236 @@ def get_items_by_user(db: Session, user_id: int) -> Sequence[Item]:
         user_id (int): The unique ID of the user.
 
     Returns:
-        Sequence[Item]: A list of Item objects owned by the user.
+        Sequence[Item]: A list of Item objects owned by the user, with their
+            tags in `tag_names`.
+    """
+    statement = select(Item).where(Item.owner_id == user_id)
+    return db.scalars(statement).all()
+
+
+def _stream_items_statement(user_id: int, batch_size: int) -> Select:
+    """Builds the query streaming a user's items in ID order.
+
+    Args:
+        user_id (int): The unique ID of the user.
+        batch_size (int): The number of rows fetched per round trip.
+
+    Returns:
+        Select: The statement, set up for a server-side cursor.
+    """
+    return (
+        select(Item)
+        .where(Item.owner_id == user_id)
+        .order_by(Item.id)
+        .execution_options(yield_per=batch_size)
+    )
+
+
+def iter_items_by_user(
+    db: Session, user_id: int, batch_size: int = STREAM_BATCH_SIZE
+) -> Iterator[Sequence[Item]]:
+    """Streams all items of a user in batches, ordered by ID.
+
+    Unlike `get_items_by_user`, the items are read through a server-side
+    cursor `batch_size` rows at a time, so memory use is bounded by the
+    batch size rather than the size of the closet. The cursor holds the
+    session's connection until the iterator is exhausted or closed, so no
+    other statement may run on the session in between.
+
+    Args:
+        db (Session): The database session.
+        user_id (int): The unique ID of the user.
+        batch_size (int): The number of items per batch.
+
+    Yields:
+        Sequence[Item]: The next batch of items.
+    """
+    statement = _stream_items_statement(user_id, batch_size)
+    result = db.scalars(statement)
+    try:
+        yield from result.partitions()
+    finally:
+        result.close()
+
+
+def get_items_page(
+    db: Session,
+    user_id: int,
+    limit: int,
+    after_id: int | None = None,
+    tag_name: str | None = None,
+    with_tags: bool = True,
+) -> Sequence[Row]:
+    """Retrieves one page of a user's items using keyset pagination.
+
+    Items are ordered by ID, and the page starts after `after_id`, so each
+    page is an index range scan regardless of how deep the client has
+    scrolled. The page is read from `items` alone: tags come from the
+    denormalized `tag_names` column, and the tag filter is resolved through
+    the registry. Plain rows are returned instead of ORM objects, so no
+    identity map work is spent on a read-only listing.
+
+    Args:
+        db (Session): The database session.
+        user_id (int): The unique ID of the user.
+        limit (int): The maximum number of items to return.
+        after_id (int | None): The ID of the last item of the previous page.
+        tag_name (str | None): Only return items linked to this tag.
+        with_tags (bool): Whether to include `tag_names`.
+
+    Returns:
+        Sequence[Row]: Up to `limit` rows ordered by ID, with the `id`,
+            `owner_id`, `description`, `image_filename` and, if requested,
+            `tag_names` of each item.
     """
+    columns = [Item.id, Item.owner_id, Item.description, Item.image_filename]
+    if with_tags:
+        columns.append(Item.tag_names)
+    statement = (
+        select(*columns)
+        .where(Item.owner_id == user_id)
+        .order_by(Item.id)
+        .limit(limit)
+    )
+    if after_id is not None:
+        statement = statement.where(Item.id > after_id)
+    if tag_name is not None:
+        tag_id = tag_registry.ids_for(db, [tag_name]).get(tag_name)
+        if tag_id is None:
+            return []
+        statement = statement.where(
+            Item.id.in_(
+                select(ClothingWeather.item_id).where(
+                    ClothingWeather.tag_id == tag_id
+                )
+            )
+        )
+    return db.execute(statement).all()
+
+
+def get_items_after(
+    db: Session,
+    after_id: int,
+    limit: int,
+    owner_id: int | None = None,
+    stale_for: str | None = None,
+) -> Sequence[Row]:
+    """Retrieves the next batch of a scan over items in ID order.
+
+    Each batch is an index range scan starting after the previous one, so a
+    scan over the whole table can stop and resume anywhere.
+
+    Args:
+        db (Session): The database session.
+        after_id (int): The ID of the last item of the previous batch.
+        limit (int): The maximum number of items to return.
+        owner_id (int | None): Only scan the items of this user.
+        stale_for (str | None): Skip items whose scores were produced with
+            this scores version.
+
+    Returns:
+        Sequence[Row]: The `id`, `owner_id` and `description` of up to
+            `limit` items.
+    """
+    statement = (
+        select(Item.id, Item.owner_id, Item.description)
+        .where(Item.id > after_id)
+        .order_by(Item.id)
+        .limit(limit)
+    )
+    if owner_id is not None:
+        statement = statement.where(Item.owner_id == owner_id)
+    if stale_for is not None:
+        statement = statement.where(
+            or_(Item.scores_version.is_(None), Item.scores_version != stale_for)
+        )
+    return db.execute(statement).all()
+
+
+def lock_existing_items(db: Session, item_ids: Collection[int]) -> set[int]:
+    """Finds which of several items still exist and locks them.
+
+    The rows stay locked until the transaction ends, so the items cannot be
+    deleted while rows referencing them are written.
+
+    Args:
+        db (Session): The database session.
+        item_ids (Collection[int]): The IDs of the items.
+
+    Returns:
+        set[int]: The IDs of the items that exist.
+    """
+    if not item_ids:
+        return set()
+    statement = select(Item.id).where(Item.id.in_(item_ids)).with_for_update()
+    return set(db.scalars(statement))
+
+
+def _like_term(term: str):
+    """Builds a case-insensitive substring filter on the item description.
+
+    Args:
+        term (str): A lowercase search term.
+
+    Returns:
+        ColumnElement: The filter expression.
+    """
+    return func.lower(Item.description).contains(term, autoescape=True)
+
+
+def search_items(
+    db: Session, user_id: int, query: str, limit: int, offset: int = 0
+) -> Sequence[Item]:
+    """Searches a user's items by description, best matches first.
+
+    Every word of the query must match, and the last one may be incomplete,
+    so results can be shown while the user is typing. On MariaDB and MySQL
+    the words are matched as prefixes against the `FULLTEXT` index and the
+    results are ranked by relevance. Words shorter than the index's minimum
+    token length, and all words on other databases, fall back to substring
+    matching, with the newest items first.
+
+    Args:
+        db (Session): The database session.
+        user_id (int): The unique ID of the user.
+        query (str): The search text as typed by the user.
+        limit (int): The maximum number of items to return.
+        offset (int): The number of matching items to skip.
+
+    Returns:
+        Sequence[Item]: Up to `limit` matching items.
+    """
+    terms = SEARCH_TOKEN.findall(query.lower())[:MAX_SEARCH_TERMS]
+    if not terms:
+        return []
+
     statement = (
         select(Item)
         .where(Item.owner_id == user_id)
-        .options(joinedload(Item.weather_links).joinedload(ClothingWeather.tag))
+        .limit(limit)
+        .offset(offset)
     )
-    return db.scalars(statement).unique().all()
+
+    if db.get_bind().dialect.name in ("mysql", "mariadb"):
+        indexed = [term for term in terms if len(term) >= FULLTEXT_MIN_TOKEN]
+        short = [term for term in terms if len(term) < FULLTEXT_MIN_TOKEN]
+    else:
+        indexed, short = [], terms
+
+    for term in short:
+        statement = statement.where(_like_term(term))
+
+    if indexed:
+        relevance = mysql.match(
+            Item.description, against=" ".join(f"+{term}*" for term in indexed)
+        ).in_boolean_mode()
+        statement = statement.where(relevance).order_by(
+            relevance.desc(), Item.id.desc()
+        )
+    else:
+        statement = statement.order_by(Item.id.desc())
+
+    return db.scalars(statement).all()
 
 
 def delete_item(db: Session, item_id: int, owner_id: int) -> bool:
@@ -70,5 +303,245 @@ def delete_item(db: Session, item_id: int, owner_id: int) -> bool:
         return False
 
     db.delete(item)
+    bump_closet_version(db, owner_id)
     db.commit()
-    return True
\ No newline at end of file
+    return True
+
+
+def count_items_by_image(db: Session, image_filename: str) -> int:
+    """Counts the items referencing a stored image.
+
+    Args:
+        db (Session): The database session.
+        image_filename (str): The storage key of the image.
+
+    Returns:
+        int: The number of items using the image.
+    """
+    statement = select(func.count()).where(Item.image_filename == image_filename)
+    return db.scalar(statement) or 0
+
+
+def delete_items(
+    db: Session, owner_id: int, item_ids: Collection[int]
+) -> tuple[list[int], set[str]]:
+    """Removes several items with their tag links and scores in one transaction.
+
+    The links, the scores and the items are each removed with a single
+    `DELETE` statement, regardless of how many items are deleted.
+
+    Args:
+        db (Session): The database session.
+        owner_id (int): The unique ID of the user requesting deletion.
+        item_ids (Collection[int]): The IDs of the items to delete. IDs of
+            missing items or items of other users are ignored.
+
+    Returns:
+        tuple[list[int], set[str]]: The IDs of the deleted items and the
+            image keys they referenced.
+    """
+    if not item_ids:
+        return [], set()
+
+    owned = (
+        select(Item.id, Item.image_filename)
+        .where(Item.owner_id == owner_id, Item.id.in_(item_ids))
+        .order_by(Item.id)
+    )
+    try:
+        rows = db.execute(owned).all()
+        deleted_ids = [item_id for item_id, _ in rows]
+        if deleted_ids:
+            db.execute(
+                delete(ClothingWeather).where(
+                    ClothingWeather.item_id.in_(deleted_ids)
+                )
+            )
+            db.execute(
+                delete(ItemTagScore).where(ItemTagScore.item_id.in_(deleted_ids))
+            )
+            db.execute(
+                delete(Item)
+                .where(Item.id.in_(deleted_ids))
+                .execution_options(synchronize_session=False)
+            )
+            bump_closet_version(db, owner_id)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    return deleted_ids, {filename for _, filename in rows if filename}
+
+
+def unreferenced_images(db: Session, image_filenames: Collection[str]) -> set[str]:
+    """Finds which image keys are no longer used by any item.
+
+    Args:
+        db (Session): The database session.
+        image_filenames (Collection[str]): The image keys to check.
+
+    Returns:
+        set[str]: The keys that no item references.
+    """
+    if not image_filenames:
+        return set()
+
+    statement = (
+        select(Item.image_filename)
+        .where(Item.image_filename.in_(image_filenames))
+        .distinct()
+    )
+    return set(image_filenames) - set(db.scalars(statement))
+
+
+async def get_items_page_async(
+    db: AsyncSession,
+    user_id: int,
+    limit: int,
+    after_id: int | None = None,
+    tag_name: str | None = None,
+    with_tags: bool = True,
+) -> Sequence[Row]:
+    """Asyncio version of `get_items_page`.
+
+    Args:
+        db (AsyncSession): The asyncio database session.
+        user_id (int): The unique ID of the user.
+        limit (int): The maximum number of items to return.
+        after_id (int | None): The ID of the last item of the previous page.
+        tag_name (str | None): Only return items linked to this tag.
+        with_tags (bool): Whether to include `tag_names`.
+
+    Returns:
+        Sequence[Row]: Up to `limit` rows ordered by ID.
+    """
+    return await db.run_sync(
+        get_items_page, user_id, limit, after_id, tag_name, with_tags
+    )
+
+
+async def search_items_async(
+    db: AsyncSession, user_id: int, query: str, limit: int, offset: int = 0
+) -> Sequence[Item]:
+    """Asyncio version of `search_items`.
+
+    Args:
+        db (AsyncSession): The asyncio database session.
+        user_id (int): The unique ID of the user.
+        query (str): The search text as typed by the user.
+        limit (int): The maximum number of items to return.
+        offset (int): The number of matching items to skip.
+
+    Returns:
+        Sequence[Item]: Up to `limit` matching items.
+    """
+    return await db.run_sync(search_items, user_id, query, limit, offset)
+
+
+async def delete_items_async(
+    db: AsyncSession, owner_id: int, item_ids: Collection[int]
+) -> tuple[list[int], set[str]]:
+    """Asyncio version of `delete_items`.
+
+    Args:
+        db (AsyncSession): The asyncio database session.
+        owner_id (int): The unique ID of the user requesting deletion.
+        item_ids (Collection[int]): The IDs of the items to delete.
+
+    Returns:
+        tuple[list[int], set[str]]: The IDs of the deleted items and the
+            image keys they referenced.
+    """
+    return await db.run_sync(delete_items, owner_id, item_ids)
+
+
+async def unreferenced_images_async(
+    db: AsyncSession, image_filenames: Collection[str]
+) -> set[str]:
+    """Asyncio version of `unreferenced_images`.
+
+    Args:
+        db (AsyncSession): The asyncio database session.
+        image_filenames (Collection[str]): The image keys to check.
+
+    Returns:
+        set[str]: The keys that no item references.
+    """
+    return await db.run_sync(unreferenced_images, image_filenames)
+
+
+async def export_items_async(
+    db: AsyncSession, user_id: int, batch_size: int = STREAM_BATCH_SIZE
+) -> AsyncIterator[dict]:
+    """Streams all of a user's items with their tag scores, in ID order.
+
+    Items and their links are read with one joined query through a
+    server-side cursor, `batch_size` rows at a time, so memory use does not
+    depend on the size of the closet. Rows of the same item are adjacent
+    and are merged as they arrive.
+
+    Args:
+        db (AsyncSession): The asyncio database session.
+        user_id (int): The unique ID of the user.
+        batch_size (int): The number of rows fetched per round trip.
+
+    Yields:
+        dict: The `id`, `description`, `image_filename` and `tags` of each
+            item, `tags` mapping tag names to confidence scores.
+    """
+    statement = (
+        select(
+            Item.id,
+            Item.description,
+            Item.image_filename,
+            WeatherTag.name,
+            ClothingWeather.confidence,
+        )
+        .outerjoin(ClothingWeather, ClothingWeather.item_id == Item.id)
+        .outerjoin(WeatherTag, WeatherTag.id == ClothingWeather.tag_id)
+        .where(Item.owner_id == user_id)
+        .order_by(Item.id)
+        .execution_options(yield_per=batch_size)
+    )
+    result = await db.stream(statement)
+    try:
+        current = None
+        async for item_id, description, image_filename, tag, confidence in result:
+            if current is None or current["id"] != item_id:
+                if current is not None:
+                    yield current
+                current = {
+                    "id": item_id,
+                    "description": description,
+                    "image_filename": image_filename,
+                    "tags": {},
+                }
+            if tag is not None:
+                current["tags"][tag] = confidence
+        if current is not None:
+            yield current
+    finally:
+        await result.close()
+
+
+async def iter_items_by_user_async(
+    db: AsyncSession, user_id: int, batch_size: int = STREAM_BATCH_SIZE
+) -> AsyncIterator[Sequence[Item]]:
+    """Asyncio version of `iter_items_by_user`.
+
+    Args:
+        db (AsyncSession): The asyncio database session.
+        user_id (int): The unique ID of the user.
+        batch_size (int): The number of items per batch.
+
+    Yields:
+        Sequence[Item]: The next batch of items.
+    """
+    statement = _stream_items_statement(user_id, batch_size)
+    result = await db.stream_scalars(statement)
+    try:
+        async for partition in result.partitions():
+            yield partition
+    finally:
+        await result.close()
@@ -0,0 +1,55 @@
+"""Data access operations for Job Checkpoints."""
+
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+
+from app.database.models import JobCheckpoint
+
+
+def get_checkpoint(db: Session, name: str) -> JobCheckpoint | None:
+    """Retrieves the saved progress of a job.
+
+    Args:
+        db (Session): The database session.
+        name (str): The unique name of the job.
+
+    Returns:
+        JobCheckpoint | None: The checkpoint, or None if the job has none.
+    """
+    return db.get(JobCheckpoint, name)
+
+
+def save_checkpoint(
+    db: Session, name: str, fingerprint: str, last_id: int, processed: int
+) -> None:
+    """Records the progress of a job without committing.
+
+    Call this in the transaction that writes the results of the rows up to
+    `last_id`, so the progress never runs ahead of the data.
+
+    Args:
+        db (Session): The database session.
+        name (str): The unique name of the job.
+        fingerprint (str): Digest of the job's configuration.
+        last_id (int): ID of the last row the job has finished.
+        processed (int): Number of rows the job has finished.
+    """
+    db.merge(
+        JobCheckpoint(
+            name=name,
+            fingerprint=fingerprint,
+            last_id=last_id,
+            processed=processed,
+        )
+    )
+    db.flush()
+
+
+def delete_checkpoint(db: Session, name: str) -> None:
+    """Removes the saved progress of a job without committing.
+
+    Args:
+        db (Session): The database session.
+        name (str): The unique name of the job.
+    """
+    db.execute(delete(JobCheckpoint).where(JobCheckpoint.name == name))
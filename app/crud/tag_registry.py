@@ -0,0 +1,125 @@
+"""In-process registry mapping weather tag names to IDs."""
+
+import threading
+from typing import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.database.models import WeatherTag
+
+
+class TagRegistry:
+    """Caches the small, append-only `weather_tags` table in memory.
+
+    Tags are never renamed or deleted, so an entry never goes stale. Lookups
+    that miss the cache fall back to a single query for the missing keys,
+    which also picks up tags created by other processes.
+    """
+
+    def __init__(self):
+        """Initializes an empty registry."""
+        self._ids_by_name: dict[str, int] = {}
+        self._names_by_id: dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, tag_id: int) -> None:
+        """Adds a tag to the registry.
+
+        Args:
+            name (str): The name of the tag.
+            tag_id (int): The ID of the tag.
+        """
+        with self._lock:
+            self._ids_by_name[name] = tag_id
+            self._names_by_id[tag_id] = name
+
+    def clear(self) -> None:
+        """Forgets all registered tags."""
+        with self._lock:
+            self._ids_by_name.clear()
+            self._names_by_id.clear()
+
+    def load(self, db: Session) -> None:
+        """Loads every tag from the database into the registry.
+
+        Args:
+            db (Session): The database session.
+        """
+        for name, tag_id in db.execute(select(WeatherTag.name, WeatherTag.id)):
+            self.register(name, tag_id)
+
+    def id_for(self, name: str) -> int | None:
+        """Looks up a tag ID by name without touching the database.
+
+        Args:
+            name (str): The name of the tag.
+
+        Returns:
+            int | None: The tag ID, or None if the tag is not registered.
+        """
+        return self._ids_by_name.get(name)
+
+    def name_for(self, tag_id: int) -> str | None:
+        """Looks up a tag name by ID without touching the database.
+
+        Args:
+            tag_id (int): The ID of the tag.
+
+        Returns:
+            str | None: The tag name, or None if the tag is not registered.
+        """
+        return self._names_by_id.get(tag_id)
+
+    def ids_for(self, db: Session, names: Iterable[str]) -> dict[str, int]:
+        """Resolves tag names to IDs, querying only for unregistered names.
+
+        Args:
+            db (Session): The database session.
+            names (Iterable[str]): The tag names to resolve.
+
+        Returns:
+            dict[str, int]: The IDs of the names that exist as tags.
+        """
+        names = set(names)
+        missing = {name for name in names if name not in self._ids_by_name}
+        if missing:
+            statement = select(WeatherTag.name, WeatherTag.id).where(
+                WeatherTag.name.in_(missing)
+            )
+            for name, tag_id in db.execute(statement):
+                self.register(name, tag_id)
+
+        return {
+            name: self._ids_by_name[name]
+            for name in names
+            if name in self._ids_by_name
+        }
+
+    def names_for(self, db: Session, tag_ids: Iterable[int]) -> dict[int, str]:
+        """Resolves tag IDs to names, querying only for unregistered IDs.
+
+        Args:
+            db (Session): The database session.
+            tag_ids (Iterable[int]): The tag IDs to resolve.
+
+        Returns:
+            dict[int, str]: The names of the IDs that exist as tags.
+        """
+        tag_ids = set(tag_ids)
+        missing = {tag_id for tag_id in tag_ids if tag_id not in self._names_by_id}
+        if missing:
+            statement = select(WeatherTag.name, WeatherTag.id).where(
+                WeatherTag.id.in_(missing)
+            )
+            for name, tag_id in db.execute(statement):
+                self.register(name, tag_id)
+
+        return {
+            tag_id: self._names_by_id[tag_id]
+            for tag_id in tag_ids
+            if tag_id in self._names_by_id
+        }
+
+
+tag_registry = TagRegistry()
@@ -1,11 +1,41 @@
 """Data access operations for Weather Tags."""
 
-from typing import Sequence
+from typing import AsyncIterator, Iterable, Iterator, Mapping, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import (
+    Select,
+    case,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database.models import ClothingWeather, Item, WeatherTag
+from app.core.utils import (
+    ITEM_TAG_THRESHOLD,
+    LABEL_TAG_THRESHOLDS,
+    scores_version,
+    vetoed_labels,
+)
+from app.crud.item_repo import STREAM_BATCH_SIZE
+from app.crud.tag_registry import tag_registry
+from app.crud.user_repo import bump_closet_version, bump_closet_versions
+from app.database.models import ClothingWeather, Item, ItemTagScore, User, WeatherTag
+from app.schemas.item import ItemCreate
+
+JSON_ARRAY_AGGREGATES = {
+    "mysql": "JSON_ARRAYAGG",
+    "mariadb": "JSON_ARRAYAGG",
+    "sqlite": "json_group_array",
+    "postgresql": "json_agg",
+}
 
 
 def get_tag_by_name(db: Session, name: str) -> WeatherTag | None:
@@ -36,6 +66,7 @@ def create_tag(db: Session, name: str) -> WeatherTag:
     db.add(tag)
     db.commit()
     db.refresh(tag)
+    tag_registry.register(tag.name, tag.id)
     return tag
 
 
@@ -49,10 +80,183 @@ def get_or_create_tag(db: Session, name: str) -> WeatherTag:
     Returns:
         WeatherTag: The retrieved or created tag instance.
     """
-    tag = get_tag_by_name(db, name)
-    if not tag:
-        tag = create_tag(db, name)
-    return tag
+    tag_id = get_or_create_tags(db, {name})[name]
+    db.commit()
+    tag_registry.register(name, tag_id)
+    return db.get_one(WeatherTag, tag_id)
+
+
+def load_tag_registry(db: Session, seed_names: Iterable[str] = ()) -> None:
+    """Seeds missing tags and loads the whole tag table into the registry.
+
+    Args:
+        db (Session): The database session.
+        seed_names (Iterable[str]): Tag names that must exist, such as the
+            candidate labels of the classifier.
+    """
+    get_or_create_tags(db, set(seed_names))
+    db.commit()
+    tag_registry.load(db)
+
+
+def _insert_tags_ignoring_duplicates(db: Session, names: set[str]) -> None:
+    """Inserts tags, silently skipping names that already exist.
+
+    Uses the dialect's native upsert so concurrent requests creating the
+    same tag cannot fail on the unique constraint. Other dialects insert
+    each name in a savepoint and skip names that violate the constraint.
+
+    Args:
+        db (Session): The database session.
+        names (set[str]): The tag names to insert.
+    """
+    rows = [{"name": name} for name in sorted(names)]
+    dialect = db.get_bind().dialect.name
+
+    if dialect in ("mysql", "mariadb"):
+        statement = mysql.insert(WeatherTag).values(rows)
+        statement = statement.on_duplicate_key_update(name=statement.inserted.name)
+    elif dialect == "sqlite":
+        statement = sqlite.insert(WeatherTag).values(rows).on_conflict_do_nothing()
+    elif dialect == "postgresql":
+        statement = (
+            postgresql.insert(WeatherTag).values(rows).on_conflict_do_nothing()
+        )
+    else:
+        for row in rows:
+            try:
+                with db.begin_nested():
+                    db.execute(insert(WeatherTag), row)
+            except IntegrityError:
+                pass
+        return
+
+    db.execute(statement)
+
+
+def get_or_create_tags(db: Session, names: set[str]) -> dict[str, int]:
+    """Resolves tag names to IDs, upserting missing tags without committing.
+
+    Registered tags are resolved from the in-process registry. Tags created
+    here are only registered by the caller once the transaction commits.
+
+    Args:
+        db (Session): The database session.
+        names (set[str]): The tag names to resolve.
+
+    Returns:
+        dict[str, int]: A mapping of tag name to tag ID.
+    """
+    if not names:
+        return {}
+
+    tag_ids = tag_registry.ids_for(db, names)
+
+    missing = names - tag_ids.keys()
+    if missing:
+        _insert_tags_ignoring_duplicates(db, missing)
+        statement = select(WeatherTag.name, WeatherTag.id).where(
+            WeatherTag.name.in_(missing)
+        )
+        tag_ids.update({name: tag_id for name, tag_id in db.execute(statement)})
+
+    return tag_ids
+
+
+def create_items_with_tags(
+    db: Session,
+    owner_id: int,
+    entries: Sequence[tuple[ItemCreate, Mapping[str, int]]],
+    scores: Sequence[Mapping[str, int] | None] | None = None,
+) -> list[Item]:
+    """Creates several items and their tag links in a single transaction.
+
+    Items are inserted in one batch, tags are resolved with one query, and
+    all `ClothingWeather` rows are written with one bulk insert. The tag
+    names are stored on the items as well, for listings to read them without
+    joining the links.
+
+    Args:
+        db (Session): The database session.
+        owner_id (int): The unique ID of the user who owns the items.
+        entries (Sequence[tuple[ItemCreate, Mapping[str, int]]]): Each item
+            with its selected tag names and confidence scores.
+        scores (Sequence[Mapping[str, int] | None] | None): The classifier
+            scores of all labels of each item, in entry order, with None for
+            items that were not classified.
+
+    Returns:
+        list[Item]: The created items, in input order.
+    """
+    try:
+        items = [
+            Item(
+                description=item.description,
+                image_filename=item.image_filename,
+                owner_id=owner_id,
+                tag_names=list(tags),
+            )
+            for item, tags in entries
+        ]
+        db.add_all(items)
+        db.flush()
+
+        tag_ids = get_or_create_tags(
+            db, {name for _, tags in entries for name in tags}
+        )
+        links = [
+            {"item_id": item.id, "tag_id": tag_ids[name], "confidence": score}
+            for item, (_, tags) in zip(items, entries)
+            for name, score in tags.items()
+        ]
+        if links:
+            db.execute(insert(ClothingWeather), links)
+        if scores:
+            save_item_scores(
+                db,
+                {
+                    item.id: (item.description, item_scores)
+                    for item, item_scores in zip(items, scores)
+                    if item_scores is not None
+                },
+            )
+        bump_closet_version(db, owner_id)
+
+        item_ids = [item.id for item in items]
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    for name, tag_id in tag_ids.items():
+        tag_registry.register(name, tag_id)
+
+    statement = select(Item).where(Item.id.in_(item_ids))
+    loaded = {item.id: item for item in db.scalars(statement)}
+    return [loaded[item_id] for item_id in item_ids]
+
+
+def create_item_with_tags(
+    db: Session,
+    owner_id: int,
+    item: ItemCreate,
+    tags: Mapping[str, int],
+    scores: Mapping[str, int] | None = None,
+) -> Item:
+    """Creates an item and all of its tag links in a single transaction.
+
+    Args:
+        db (Session): The database session.
+        owner_id (int): The unique ID of the user who owns the item.
+        item (ItemCreate): The item creation schema.
+        tags (Mapping[str, int]): The tag names and their confidence scores.
+        scores (Mapping[str, int] | None): The classifier scores of all
+            labels, if the item was classified.
+
+    Returns:
+        Item: The created item.
+    """
+    return create_items_with_tags(db, owner_id, [(item, tags)], [scores])[0]
 
 
 def link_item_to_tag(
@@ -71,16 +275,261 @@ def link_item_to_tag(
     """
     link = ClothingWeather(item_id=item_id, tag_id=tag_id, confidence=confidence)
     db.add(link)
+    bump_closet_version(
+        db, select(Item.owner_id).where(Item.id == item_id).scalar_subquery()
+    )
     db.commit()
     db.refresh(link)
     return link
 
 
+def replace_item_tags(
+    db: Session, item_tags: Mapping[int, Mapping[str, int]]
+) -> list[int]:
+    """Rewrites the tag links of several items in bulk without committing.
+
+    The current links of all items are read with one query and compared with
+    the new tags. Only the differences are written, with one bulk statement
+    each for removed, added and re-scored links. Items whose set of tags
+    changed get new `tag_names`, and their owners' closet versions are
+    bumped.
+
+    Args:
+        db (Session): The database session.
+        item_tags (Mapping[int, Mapping[str, int]]): The new tag names and
+            confidence scores of each item, keyed by item ID.
+
+    Returns:
+        list[int]: The IDs of the items whose set of tags changed.
+    """
+    if not item_tags:
+        return []
+
+    tag_ids = get_or_create_tags(
+        db, {name for tags in item_tags.values() for name in tags}
+    )
+    wanted = {
+        (item_id, tag_ids[name]): score
+        for item_id, tags in item_tags.items()
+        for name, score in tags.items()
+    }
+    statement = select(
+        ClothingWeather.item_id, ClothingWeather.tag_id, ClothingWeather.confidence
+    ).where(ClothingWeather.item_id.in_(item_tags))
+    current = {
+        (item_id, tag_id): score for item_id, tag_id, score in db.execute(statement)
+    }
+
+    removed = sorted(current.keys() - wanted.keys())
+    added = sorted(wanted.keys() - current.keys())
+    rescored = sorted(
+        key for key in wanted.keys() & current.keys() if wanted[key] != current[key]
+    )
+
+    if removed:
+        db.execute(
+            delete(ClothingWeather)
+            .where(tuple_(ClothingWeather.item_id, ClothingWeather.tag_id).in_(removed))
+            .execution_options(synchronize_session=False)
+        )
+    if added or rescored:
+        links = {
+            key: {"item_id": key[0], "tag_id": key[1], "confidence": wanted[key]}
+            for key in added + rescored
+        }
+        if added:
+            db.execute(insert(ClothingWeather), [links[key] for key in added])
+        if rescored:
+            db.execute(update(ClothingWeather), [links[key] for key in rescored])
+
+    changed = sorted({item_id for item_id, _ in removed + added})
+    if changed:
+        db.execute(
+            update(Item),
+            [
+                {"id": item_id, "tag_names": list(item_tags[item_id])}
+                for item_id in changed
+            ],
+        )
+        owners = db.scalars(
+            select(Item.owner_id).where(Item.id.in_(changed)).distinct()
+        )
+        bump_closet_versions(db, list(owners))
+    return changed
+
+
+def save_item_scores(
+    db: Session,
+    item_scores: Mapping[int, tuple[str, Mapping[str, int]]],
+    version: str | None = None,
+) -> None:
+    """Replaces the stored classifier scores of several items without committing.
+
+    The scores of all labels are kept, together with whether a keyword of
+    the description rules the label out, so that `rebuild_item_tags` can
+    derive the links for any threshold in SQL.
+
+    Args:
+        db (Session): The database session.
+        item_scores (Mapping[int, tuple[str, Mapping[str, int]]]): The
+            description and the scores of every label of each item, keyed
+            by item ID.
+        version (str | None): Digest of the model and labels that produced
+            the scores, defaulting to the current `scores_version()`.
+    """
+    if not item_scores:
+        return
+
+    tag_ids = get_or_create_tags(
+        db, {label for _, scores in item_scores.values() for label in scores}
+    )
+    rows = []
+    for item_id, (description, scores) in item_scores.items():
+        vetoed = vetoed_labels(description, scores)
+        rows.extend(
+            {
+                "item_id": item_id,
+                "tag_id": tag_ids[label],
+                "score": score,
+                "vetoed": label in vetoed,
+            }
+            for label, score in scores.items()
+        )
+
+    db.execute(
+        delete(ItemTagScore)
+        .where(ItemTagScore.item_id.in_(item_scores))
+        .execution_options(synchronize_session=False)
+    )
+    if rows:
+        db.execute(insert(ItemTagScore), rows)
+    version = version or scores_version()
+    db.execute(
+        update(Item),
+        [{"id": item_id, "scores_version": version} for item_id in item_scores],
+    )
+
+
+def rebuild_item_tags(
+    db: Session,
+    threshold: int = ITEM_TAG_THRESHOLD,
+    label_thresholds: Mapping[str, int] = LABEL_TAG_THRESHOLDS,
+    owner_id: int | None = None,
+) -> int:
+    """Derives the tag links of scored items from their stored scores.
+
+    The links, the `tag_names` of the items and the closet versions of their
+    owners are rewritten by a fixed number of set-based statements, without
+    running the classifier and without committing. Only items scored by the
+    current setup are rebuilt; items never scored, or scored by an older
+    model or labels, keep their links until the re-tagging job scores them.
+    Dialects without a JSON array aggregate collect the `tag_names` in
+    Python instead.
+
+    Args:
+        db (Session): The database session.
+        threshold (int): The score a label must exceed to become a tag.
+        label_thresholds (Mapping[str, int]): Thresholds of labels that
+            differ from `threshold`.
+        owner_id (int | None): Only rebuild the tags of this user's items.
+
+    Returns:
+        int: The number of links written.
+    """
+    scored = Item.scores_version == scores_version()
+    if owner_id is not None:
+        scored = scored & (Item.owner_id == owner_id)
+    scored_ids = select(Item.id).where(scored)
+
+    cutoff = literal(threshold)
+    if label_thresholds:
+        tag_ids = get_or_create_tags(db, set(label_thresholds))
+        cutoff = case(
+            {tag_ids[name]: value for name, value in label_thresholds.items()},
+            value=ItemTagScore.tag_id,
+            else_=threshold,
+        )
+
+    db.execute(
+        delete(ClothingWeather)
+        .where(ClothingWeather.item_id.in_(scored_ids))
+        .execution_options(synchronize_session=False)
+    )
+    derived = select(
+        ItemTagScore.item_id, ItemTagScore.tag_id, ItemTagScore.score
+    ).where(
+        ItemTagScore.item_id.in_(scored_ids),
+        ItemTagScore.vetoed.is_(False),
+        ItemTagScore.score > cutoff,
+    )
+    result = db.execute(
+        insert(ClothingWeather).from_select(
+            ["item_id", "tag_id", "confidence"], derived
+        )
+    )
+
+    aggregate = JSON_ARRAY_AGGREGATES.get(db.get_bind().dialect.name)
+    if aggregate is None:
+        _rebuild_tag_names_in_python(db, scored_ids)
+    else:
+        names = (
+            select(getattr(func, aggregate)(WeatherTag.name))
+            .select_from(ClothingWeather)
+            .join(WeatherTag, WeatherTag.id == ClothingWeather.tag_id)
+            .where(ClothingWeather.item_id == Item.id)
+            .scalar_subquery()
+        )
+        db.execute(
+            update(Item)
+            .where(scored)
+            .values(tag_names=func.coalesce(names, literal("[]")))
+            .execution_options(synchronize_session=False)
+        )
+    db.execute(
+        update(User)
+        .where(User.id.in_(select(Item.owner_id).where(scored)))
+        .values(closet_version=User.closet_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+def _rebuild_tag_names_in_python(db: Session, item_ids: Select) -> None:
+    """Rewrites the `tag_names` of items from their links, grouped in Python.
+
+    Args:
+        db (Session): The database session.
+        item_ids (Select): Selects the IDs of the items to rewrite.
+    """
+    names: dict[int, list[str]] = {
+        item_id: [] for item_id in db.scalars(item_ids)
+    }
+    if not names:
+        return
+    links = db.execute(
+        select(ClothingWeather.item_id, WeatherTag.name)
+        .join(WeatherTag, WeatherTag.id == ClothingWeather.tag_id)
+        .where(ClothingWeather.item_id.in_(item_ids))
+    )
+    for item_id, name in links:
+        names[item_id].append(name)
+    db.execute(
+        update(Item),
+        [
+            {"id": item_id, "tag_names": item_names}
+            for item_id, item_names in names.items()
+        ],
+    )
+
+
 def get_items_by_tags(
     db: Session, user_id: int, tag_names: list[str]
 ) -> Sequence[Item]:
     """Retrieves items owned by a user that match any of the provided tags.
 
+    Tag names are resolved through the registry, so the query filters on
+    `ClothingWeather.tag_id` without joining `weather_tags`.
+
     Args:
         db (Session): The database session.
         user_id (int): The ID of the user.
@@ -89,12 +538,172 @@ def get_items_by_tags(
     Returns:
         Sequence[Item]: A list of matching items.
     """
+    tag_ids = tag_registry.ids_for(db, tag_names)
+    if not tag_ids:
+        return []
+
     statement = (
         select(Item)
         .join(ClothingWeather, Item.id == ClothingWeather.item_id)
-        .join(WeatherTag, ClothingWeather.tag_id == WeatherTag.id)
         .where(Item.owner_id == user_id)
-        .where(WeatherTag.name.in_(tag_names))
+        .where(ClothingWeather.tag_id.in_(tag_ids.values()))
         .distinct()
     )
-    return db.scalars(statement).all()
\ No newline at end of file
+    return db.scalars(statement).all()
+
+
+def _stream_items_by_tags_statement(
+    user_id: int, tag_ids: Iterable[int], batch_size: int
+) -> Select:
+    """Builds the query streaming a user's items linked to any of some tags.
+
+    The links are matched with a semi-join rather than a join with
+    `DISTINCT`, which the database could only answer after reading all
+    matches, so rows reach the client while the query is still running.
+
+    Args:
+        user_id (int): The ID of the user.
+        tag_ids (Iterable[int]): The IDs of the tags.
+        batch_size (int): The number of rows fetched per round trip.
+
+    Returns:
+        Select: The statement, set up for a server-side cursor.
+    """
+    linked = select(ClothingWeather.item_id).where(
+        ClothingWeather.tag_id.in_(tag_ids)
+    )
+    return (
+        select(Item)
+        .where(Item.owner_id == user_id, Item.id.in_(linked))
+        .order_by(Item.id)
+        .execution_options(yield_per=batch_size)
+    )
+
+
+def iter_items_by_tags(
+    db: Session,
+    user_id: int,
+    tag_names: list[str],
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> Iterator[Sequence[Item]]:
+    """Streams a user's items matching any of the tags in batches.
+
+    The streaming counterpart of `get_items_by_tags`: items are read through
+    a server-side cursor `batch_size` rows at a time, in ID order. No other
+    statement may run on the session until the iterator is exhausted or
+    closed.
+
+    Args:
+        db (Session): The database session.
+        user_id (int): The ID of the user.
+        tag_names (list[str]): A list of tag names to filter by.
+        batch_size (int): The number of items per batch.
+
+    Yields:
+        Sequence[Item]: The next batch of matching items.
+    """
+    tag_ids = tag_registry.ids_for(db, tag_names)
+    if not tag_ids:
+        return
+
+    statement = _stream_items_by_tags_statement(
+        user_id, tag_ids.values(), batch_size
+    )
+    result = db.scalars(statement)
+    try:
+        yield from result.partitions()
+    finally:
+        result.close()
+
+
+async def create_items_with_tags_async(
+    db: AsyncSession,
+    owner_id: int,
+    entries: Sequence[tuple[ItemCreate, Mapping[str, int]]],
+    scores: Sequence[Mapping[str, int] | None] | None = None,
+) -> list[Item]:
+    """Asyncio version of `create_items_with_tags`.
+
+    Args:
+        db (AsyncSession): The asyncio database session.
+        owner_id (int): The unique ID of the user who owns the items.
+        entries (Sequence[tuple[ItemCreate, Mapping[str, int]]]): Each item
+            with its selected tag names and confidence scores.
+        scores (Sequence[Mapping[str, int] | None] | None): The classifier
+            scores of all labels of each item, in entry order.
+
+    Returns:
+        list[Item]: The created items, in input order.
+    """
+    return await db.run_sync(create_items_with_tags, owner_id, entries, scores)
+
+
+async def create_item_with_tags_async(
+    db: AsyncSession,
+    owner_id: int,
+    item: ItemCreate,
+    tags: Mapping[str, int],
+    scores: Mapping[str, int] | None = None,
+) -> Item:
+    """Asyncio version of `create_item_with_tags`.
+
+    Args:
+        db (AsyncSession): The asyncio database session.
+        owner_id (int): The unique ID of the user who owns the item.
+        item (ItemCreate): The item creation schema.
+        tags (Mapping[str, int]): The tag names and their confidence scores.
+        scores (Mapping[str, int] | None): The classifier scores of all
+            labels, if the item was classified.
+
+    Returns:
+        Item: The created item.
+    """
+    return await db.run_sync(create_item_with_tags, owner_id, item, tags, scores)
+
+
+async def get_items_by_tags_async(
+    db: AsyncSession, user_id: int, tag_names: list[str]
+) -> Sequence[Item]:
+    """Asyncio version of `get_items_by_tags`.
+
+    Args:
+        db (AsyncSession): The asyncio database session.
+        user_id (int): The ID of the user.
+        tag_names (list[str]): A list of tag names to filter by.
+
+    Returns:
+        Sequence[Item]: A list of matching items.
+    """
+    return await db.run_sync(get_items_by_tags, user_id, tag_names)
+
+
+async def iter_items_by_tags_async(
+    db: AsyncSession,
+    user_id: int,
+    tag_names: list[str],
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> AsyncIterator[Sequence[Item]]:
+    """Asyncio version of `iter_items_by_tags`.
+
+    Args:
+        db (AsyncSession): The asyncio database session.
+        user_id (int): The ID of the user.
+        tag_names (list[str]): A list of tag names to filter by.
+        batch_size (int): The number of items per batch.
+
+    Yields:
+        Sequence[Item]: The next batch of matching items.
+    """
+    tag_ids = await db.run_sync(tag_registry.ids_for, tag_names)
+    if not tag_ids:
+        return
+
+    statement = _stream_items_by_tags_statement(
+        user_id, tag_ids.values(), batch_size
+    )
+    result = await db.stream_scalars(statement)
+    try:
+        async for partition in result.partitions():
+            yield partition
+    finally:
+        await result.close()
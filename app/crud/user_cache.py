@@ -0,0 +1,98 @@
+"""In-process cache of authenticated users keyed by ID."""
+
+import threading
+import time
+from collections import OrderedDict
+
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.config import settings
+from app.database.models import User
+
+CACHED_COLUMNS = ("id", "email", "hashed_password", "closet_version", "token_version")
+
+
+class UserCache:
+    """A small, TTL-bounded LRU cache of user rows.
+
+    Only column values are cached. Every lookup returns a fresh detached
+    `User`, so request handlers never share ORM state. Cached values such as
+    `closet_version` may be up to `ttl` seconds old and must not be used
+    where freshness matters. Entries expire after `ttl` seconds, which
+    bounds how long another worker's token revocation can go unnoticed;
+    revocations in this process call `invalidate`.
+
+    Attributes:
+        ttl (float): Seconds an entry stays valid.
+        max_size (int): The maximum number of cached users.
+    """
+
+    def __init__(self, ttl: float, max_size: int):
+        """Initializes an empty cache.
+
+        Args:
+            ttl (float): Seconds an entry stays valid.
+            max_size (int): The maximum number of cached users.
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: OrderedDict[int, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> User | None:
+        """Looks up a user without touching the database.
+
+        Args:
+            user_id (int): The unique ID of the user.
+
+        Returns:
+            User | None: A detached copy of the cached user, or None if the
+                user is not cached or the entry has expired.
+        """
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, values = entry
+            if expires_at <= time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+
+        user = User(**values)
+        make_transient_to_detached(user)
+        return user
+
+    def put(self, user: User) -> None:
+        """Stores the column values of a user.
+
+        Args:
+            user (User): The user loaded from the database.
+        """
+        if self.max_size <= 0:
+            return
+        values = {column: getattr(user, column) for column in CACHED_COLUMNS}
+        with self._lock:
+            self._entries[user.id] = (time.monotonic() + self.ttl, values)
+            self._entries.move_to_end(user.id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        """Drops a user from the cache.
+
+        Args:
+            user_id (int): The unique ID of the user.
+        """
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        """Drops every cached user."""
+        with self._lock:
+            self._entries.clear()
+
+
+user_cache = UserCache(
+    ttl=settings.user_cache_ttl_seconds, max_size=settings.user_cache_size
+)
@@ -1,6 +1,15 @@
-"""Data access operations for Users."""
+"""Data access operations for Users.
 
-from sqlalchemy import select
+Every function used by request handlers has an `_async` counterpart taking
+an `AsyncSession`. Counterparts with more than a single statement run the
+synchronous implementation through `AsyncSession.run_sync`, which executes
+it on the asyncio driver without blocking the event loop.
+"""
+
+from typing import Any, Collection
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.security import get_password_hash
@@ -8,17 +17,22 @@ from app.database.models import User
 from app.schemas.user import UserCreate
 
 
-def create_user(db: Session, user: UserCreate) -> User:
+def create_user(
+    db: Session, user: UserCreate, hashed_password: str | None = None
+) -> User:
     """Creates a new user with a hashed password.
 
     Args:
         db (Session): The database session.
         user (UserCreate): The user creation schema.
+        hashed_password (str | None): The already hashed password. If omitted,
+            the password of `user` is hashed here.
 
     Returns:
         User: The created user instance.
     """
-    hashed_password = get_password_hash(user.password)
+    if hashed_password is None:
+        hashed_password = get_password_hash(user.password)
     new_user = User(email=user.email, hashed_password=hashed_password)
 
     db.add(new_user)
@@ -41,4 +55,178 @@ def get_user_by_email(db: Session, email: str) -> User | None:
     statement = select(User).where(User.email == email)
     user = db.scalar(statement)
 
-    return user
\ No newline at end of file
+    return user
+
+
+def get_user_by_id(db: Session, user_id: int) -> User | None:
+    """Retrieves a user by their unique ID.
+
+    Args:
+        db (Session): The database session.
+        user_id (int): The unique ID of the user.
+
+    Returns:
+        User | None: The user instance if found, otherwise None.
+    """
+    return db.get(User, user_id)
+
+
+def update_password_hash(db: Session, user_id: int, hashed_password: str) -> None:
+    """Replaces the stored password hash of a user.
+
+    Args:
+        db (Session): The database session.
+        user_id (int): The unique ID of the user.
+        hashed_password (str): The new password hash.
+    """
+    db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(hashed_password=hashed_password)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+
+
+def revoke_tokens(db: Session, user_id: int) -> None:
+    """Invalidates every access token issued to a user so far.
+
+    Args:
+        db (Session): The database session.
+        user_id (int): The unique ID of the user.
+    """
+    db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(token_version=User.token_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+
+
+def get_closet_version(db: Session, user_id: int) -> int | None:
+    """Retrieves the version counter of a user's closet.
+
+    Args:
+        db (Session): The database session.
+        user_id (int): The unique ID of the user.
+
+    Returns:
+        int | None: The closet version, or None if the user does not exist.
+    """
+    statement = select(User.closet_version).where(User.id == user_id)
+    return db.scalar(statement)
+
+
+def bump_closet_version(db: Session, user_id: int | Any) -> None:
+    """Increments the version counter of a user's closet without committing.
+
+    Call this in the same transaction as every change to the user's items,
+    so cached closet responses are invalidated atomically with the change.
+
+    Args:
+        db (Session): The database session.
+        user_id (int | Any): The unique ID of the user, or a scalar subquery
+            selecting it.
+    """
+    db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(closet_version=User.closet_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def bump_closet_versions(db: Session, user_ids: Collection[int]) -> None:
+    """Increments the closet version of several users without committing.
+
+    Args:
+        db (Session): The database session.
+        user_ids (Collection[int]): The unique IDs of the users.
+    """
+    if not user_ids:
+        return
+    db.execute(
+        update(User)
+        .where(User.id.in_(user_ids))
+        .values(closet_version=User.closet_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def create_user_async(
+    db: AsyncSession, user: UserCreate, hashed_password: str | None = None
+) -> User:
+    """Asyncio version of `create_user`.
+
+    Args:
+        db (AsyncSession): The asyncio database session.
+        user (UserCreate): The user creation schema.
+        hashed_password (str | None): The already hashed password.
+
+    Returns:
+        User: The created user instance.
+    """
+    return await db.run_sync(create_user, user, hashed_password)
+
+
+async def get_user_by_email_async(db: AsyncSession, email: str) -> User | None:
+    """Asyncio version of `get_user_by_email`.
+
+    Args:
+        db (AsyncSession): The asyncio database session.
+        email (str): The email address of the user.
+
+    Returns:
+        User | None: The user instance if found, otherwise None.
+    """
+    return await db.scalar(select(User).where(User.email == email))
+
+
+async def get_user_by_id_async(db: AsyncSession, user_id: int) -> User | None:
+    """Asyncio version of `get_user_by_id`.
+
+    Args:
+        db (AsyncSession): The asyncio database session.
+        user_id (int): The unique ID of the user.
+
+    Returns:
+        User | None: The user instance if found, otherwise None.
+    """
+    return await db.get(User, user_id)
+
+
+async def update_password_hash_async(
+    db: AsyncSession, user_id: int, hashed_password: str
+) -> None:
+    """Asyncio version of `update_password_hash`.
+
+    Args:
+        db (AsyncSession): The asyncio database session.
+        user_id (int): The unique ID of the user.
+        hashed_password (str): The new password hash.
+    """
+    await db.run_sync(update_password_hash, user_id, hashed_password)
+
+
+async def revoke_tokens_async(db: AsyncSession, user_id: int) -> None:
+    """Asyncio version of `revoke_tokens`.
+
+    Args:
+        db (AsyncSession): The asyncio database session.
+        user_id (int): The unique ID of the user.
+    """
+    await db.run_sync(revoke_tokens, user_id)
+
+
+async def get_closet_version_async(db: AsyncSession, user_id: int) -> int | None:
+    """Asyncio version of `get_closet_version`.
+
+    Args:
+        db (AsyncSession): The asyncio database session.
+        user_id (int): The unique ID of the user.
+
+    Returns:
+        int | None: The closet version, or None if the user does not exist.
+    """
+    return await db.scalar(select(User.closet_version).where(User.id == user_id))
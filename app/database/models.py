@@ -2,8 +2,14 @@
 
 from typing import List, Optional
 
-from sqlalchemy import ForeignKey, Integer, String, Text
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy import JSON, Boolean, ForeignKey, Index, Integer, String, Text, event
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    Session,
+    mapped_column,
+    relationship,
+)
 
 
 class Base(DeclarativeBase):
@@ -18,6 +24,8 @@ class User(Base):
         id (int): Primary key ID.
         email (str): Unique email address.
         hashed_password (str): Bcrypt hashed password.
+        closet_version (int): Counter bumped on every change to the user's items.
+        token_version (int): Counter embedded in access tokens; bumping it revokes them.
         items (List[Item]): Collection of items owned by the user.
     """
 
@@ -27,6 +35,12 @@ class User(Base):
         String(255), unique=True, index=True, nullable=False
     )
     hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
+    closet_version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    token_version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
 
     items: Mapped[List["Item"]] = relationship(back_populates="owner")
 
@@ -53,16 +67,33 @@ class Item(Base):
     Attributes:
         id (int): Primary key ID.
         description (str): User-provided description of the item.
-        image_filename (Optional[str]): Filename of the uploaded image.
+        image_filename (Optional[str]): Storage key of the uploaded image.
         owner_id (int): Foreign key to the User table.
         owner (User): The User who owns this item.
+        tag_names (List[str]): Names of the linked weather tags, a read model of `weather_links` for listings.
+        scores_version (Optional[str]): Digest of the model and labels that produced `tag_scores`, or None if the item was never scored.
         weather_links (List[ClothingWeather]): Association records linking weather tags to this item.
+        tag_scores (List[ItemTagScore]): The classifier scores of every candidate label.
     """
 
     __tablename__ = "items"
+    __table_args__ = (
+        Index("ix_items_owner_id_id", "owner_id", "id"),
+        Index(
+            "ix_items_description_fulltext",
+            "description",
+            mysql_prefix="FULLTEXT",
+            mariadb_prefix="FULLTEXT",
+        ).ddl_if(dialect=("mysql", "mariadb")),
+    )
+
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     description: Mapped[str] = mapped_column(Text)
-    image_filename: Mapped[Optional[str]] = mapped_column(String(255))
+    image_filename: Mapped[Optional[str]] = mapped_column(String(255), index=True)
+    tag_names: Mapped[List[str]] = mapped_column(
+        JSON, nullable=False, default=list, server_default="[]"
+    )
+    scores_version: Mapped[Optional[str]] = mapped_column(String(64))
 
     owner_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
     owner: Mapped["User"] = relationship(back_populates="items")
@@ -70,6 +101,9 @@ class Item(Base):
     weather_links: Mapped[List["ClothingWeather"]] = relationship(
         back_populates="item", cascade="all, delete-orphan"
     )
+    tag_scores: Mapped[List["ItemTagScore"]] = relationship(
+        cascade="all, delete-orphan"
+    )
 
 
 class ClothingWeather(Base):
@@ -84,6 +118,9 @@ class ClothingWeather(Base):
     """
 
     __tablename__ = "clothing_weather"
+    __table_args__ = (
+        Index("ix_clothing_weather_tag_id_item_id", "tag_id", "item_id"),
+    )
 
     item_id: Mapped[int] = mapped_column(ForeignKey("items.id"), primary_key=True)
     tag_id: Mapped[int] = mapped_column(ForeignKey("weather_tags.id"), primary_key=True)
@@ -91,4 +128,85 @@ class ClothingWeather(Base):
     confidence: Mapped[int] = mapped_column(Integer, nullable=False)
 
     item: Mapped["Item"] = relationship(back_populates="weather_links")
-    tag: Mapped["WeatherTag"] = relationship(back_populates="item_links")
\ No newline at end of file
+    tag: Mapped["WeatherTag"] = relationship(back_populates="item_links")
+
+
+class ItemTagScore(Base):
+    """The classifier score of one candidate label for an item.
+
+    Every label is stored, not only those above the threshold, so the tag
+    links can be derived again for other thresholds without inference.
+
+    Attributes:
+        item_id (int): Foreign key to the Item table.
+        tag_id (int): Foreign key to the WeatherTag table.
+        score (int): Confidence score of the label (0-100).
+        vetoed (bool): Whether a keyword of the description rules the label out.
+    """
+
+    __tablename__ = "item_tag_scores"
+
+    item_id: Mapped[int] = mapped_column(ForeignKey("items.id"), primary_key=True)
+    tag_id: Mapped[int] = mapped_column(ForeignKey("weather_tags.id"), primary_key=True)
+
+    score: Mapped[int] = mapped_column(Integer, nullable=False)
+    vetoed: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=False, server_default="0"
+    )
+
+
+class JobCheckpoint(Base):
+    """Progress of a resumable batch job.
+
+    Attributes:
+        name (str): Unique name of the job.
+        fingerprint (str): Digest of the configuration the progress was made with.
+        last_id (int): ID of the last row the job has finished.
+        processed (int): Number of rows the job has finished.
+    """
+
+    __tablename__ = "job_checkpoints"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    last_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    processed: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+@event.listens_for(Session, "before_flush")
+def sync_item_tag_names(session: Session, flush_context, instances) -> None:
+    """Mirrors tag links added or removed through the ORM in `Item.tag_names`.
+
+    Bulk statements bypass the unit of work, so code writing links with
+    `insert()` or `delete()` must keep `tag_names` up to date itself.
+
+    Args:
+        session (Session): The session being flushed.
+        flush_context: The unit of work of the flush.
+        instances: The objects passed to `Session.flush()`, if any.
+    """
+    changes = [
+        (link, True) for link in session.new if isinstance(link, ClothingWeather)
+    ] + [
+        (link, False)
+        for link in session.deleted
+        if isinstance(link, ClothingWeather)
+    ]
+    if not changes:
+        return
+
+    updated: dict[Item, list[str]] = {}
+    with session.no_autoflush:
+        for link, added in changes:
+            item = link.item or session.get(Item, link.item_id)
+            if item is None or item in session.deleted:
+                continue
+            name = (link.tag or session.get_one(WeatherTag, link.tag_id)).name
+            names = updated.setdefault(item, list(item.tag_names or []))
+            if added and name not in names:
+                names.append(name)
+            elif not added and name in names:
+                names.remove(name)
+
+    for item, names in updated.items():
+        item.tag_names = names
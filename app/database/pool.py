@@ -0,0 +1,197 @@
+"""Instrumented connection pools, pool sizing and connection liveness."""
+
+import math
+import threading
+import time
+
+from sqlalchemy import Engine, event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from app.core.metrics import Histogram
+
+
+class PoolMetrics:
+    """Counters and latency histograms of one connection pool.
+
+    Attributes:
+        wait (Histogram): Time spent waiting for a pooled connection.
+        checkout (Histogram): Total checkout time, including the wait, new
+            connections and liveness checks.
+    """
+
+    def __init__(self):
+        """Initializes zeroed metrics."""
+        self.wait = Histogram()
+        self.checkout = Histogram()
+        self._counts = dict.fromkeys(
+            ("checkouts", "timeouts", "connects", "invalidations"), 0
+        )
+        self._lock = threading.Lock()
+
+    def count(self, name: str) -> None:
+        """Increments a counter.
+
+        Args:
+            name (str): The name of the counter.
+        """
+        with self._lock:
+            self._counts[name] += 1
+
+    def snapshot(self) -> dict:
+        """Returns the current counters and histograms.
+
+        Returns:
+            dict: The counters, `wait_seconds` and `checkout_seconds`.
+        """
+        with self._lock:
+            counts = dict(self._counts)
+        return {
+            **counts,
+            "wait_seconds": self.wait.snapshot(),
+            "checkout_seconds": self.checkout.snapshot(),
+        }
+
+
+class InstrumentedPoolMixin:
+    """Records `PoolMetrics` for a queue pool.
+
+    The metrics live on the pool as `metrics` and survive `recreate()`, which
+    the engine calls after a disconnect invalidates the whole pool.
+    """
+
+    metrics: PoolMetrics
+
+    def __init__(self, *args, **kwargs):
+        """Initializes the pool and its metrics.
+
+        Args:
+            *args: Positional arguments of the pool class.
+            **kwargs: Keyword arguments of the pool class.
+        """
+        recreated = "_dispatch" in kwargs
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+        if not recreated:
+            metrics = self.metrics
+            event.listen(self, "connect", lambda *_: metrics.count("connects"))
+            event.listen(
+                self, "invalidate", lambda *_: metrics.count("invalidations")
+            )
+
+    def recreate(self) -> Pool:
+        """Creates a fresh pool that keeps reporting into the same metrics.
+
+        Returns:
+            Pool: The new pool.
+        """
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def connect(self):
+        """Checks out a connection and records the total checkout time.
+
+        Returns:
+            PoolProxiedConnection: The checked out connection.
+        """
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            self.metrics.checkout.observe(time.perf_counter() - started)
+
+    def _do_get(self):
+        """Takes a connection from the queue and records the wait.
+
+        Returns:
+            ConnectionPoolEntry: The pooled connection.
+
+        Raises:
+            sqlalchemy.exc.TimeoutError: If no connection became available.
+        """
+        started = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.count("timeouts")
+            raise
+        finally:
+            self.metrics.wait.observe(time.perf_counter() - started)
+        self.metrics.count("checkouts")
+        return record
+
+    def stats(self) -> dict:
+        """Reports the occupancy and the metrics of the pool.
+
+        Returns:
+            dict: The configured `size` and `max_overflow`, the connections
+                currently `checked_out` and in `overflow`, and the metrics.
+        """
+        return {
+            "size": self.size(),
+            "max_overflow": self._max_overflow,
+            "checked_out": self.checkedout(),
+            "overflow": max(0, self.overflow()),
+            **self.metrics.snapshot(),
+        }
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    """A `QueuePool` recording checkout metrics."""
+
+
+class InstrumentedAsyncQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """An `AsyncAdaptedQueuePool` recording checkout metrics."""
+
+
+def pool_sizing(
+    max_connections: int, workers: int, reserved: int = 0
+) -> tuple[int, int]:
+    """Splits a per-node connection budget into one worker's pool limits.
+
+    Half of a worker's share is kept open, the other half is overflow that
+    is only opened under load.
+
+    Args:
+        max_connections (int): Connections all workers on the node may open
+            to one database server together.
+        workers (int): The number of worker processes on the node.
+        reserved (int): Connections per worker already used by other pools.
+
+    Returns:
+        tuple[int, int]: The `pool_size` and `max_overflow` of the pool.
+    """
+    per_worker = max(2, max_connections // max(1, workers) - reserved)
+    pool_size = math.ceil(per_worker / 2)
+    return pool_size, per_worker - pool_size
+
+
+def ping_idle_connections(engine: Engine, idle_seconds: float) -> None:
+    """Checks that connections left idle for a while are still alive.
+
+    Unlike `pool_pre_ping`, which costs a round trip on every checkout,
+    only connections that sat in the pool for longer than `idle_seconds` are
+    pinged. Dead ones are replaced transparently by the pool. Combine with
+    `pool_recycle` so that no connection outlives the server's timeouts.
+
+    Args:
+        engine (Engine): The engine whose pool to watch.
+        idle_seconds (float): How long a connection may be idle before its
+            next checkout pings it.
+    """
+
+    @event.listens_for(engine, "checkin")
+    def stamp(dbapi_connection, connection_record):
+        connection_record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(engine, "checkout")
+    def ping(dbapi_connection, connection_record, connection_proxy):
+        checked_in_at = connection_record.info.get("checked_in_at")
+        if checked_in_at is None or time.monotonic() - checked_in_at < idle_seconds:
+            return
+        try:
+            cursor = dbapi_connection.cursor()
+            cursor.execute("SELECT 1")
+            cursor.close()
+        except Exception as e:
+            raise exc.DisconnectionError() from e
@@ -0,0 +1,220 @@
+"""Per-request counting and timing of SQL statements."""
+
+import logging
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import Engine, event
+
+logger = logging.getLogger(__name__)
+
+_current: ContextVar["QueryStats | None"] = ContextVar("query_stats", default=None)
+
+
+class QueryStats:
+    """The SQL statements executed during one unit of work.
+
+    Statements are compared by their SQL text, which holds placeholders
+    rather than values, so the same query run with different parameters,
+    typically a lazy load inside a loop, counts as a repetition.
+
+    Attributes:
+        count (int): The number of statements executed.
+        seconds (float): The total time spent executing them.
+    """
+
+    def __init__(self):
+        """Initializes empty statistics."""
+        self.count = 0
+        self.seconds = 0.0
+        self._statements: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, seconds: float) -> None:
+        """Adds one executed statement.
+
+        Args:
+            statement (str): The SQL text of the statement.
+            seconds (float): How long the statement took.
+        """
+        with self._lock:
+            self.count += 1
+            self.seconds += seconds
+            self._statements[statement] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Lists statements executed at least `threshold` times.
+
+        Args:
+            threshold (int): The minimum number of executions.
+
+        Returns:
+            list[tuple[str, int]]: Each repeated statement with its count,
+                most frequent first.
+        """
+        with self._lock:
+            return [
+                (statement, count)
+                for statement, count in self._statements.most_common()
+                if count >= threshold
+            ]
+
+    def summary(self) -> str:
+        """Describes the statistics for logs and assertion messages.
+
+        Returns:
+            str: The statement count, total time and the most frequent
+                statements.
+        """
+        lines = [f"{self.count} statements in {self.seconds * 1000:.1f} ms"]
+        lines.extend(
+            f"  {count}x {' '.join(statement.split())}"
+            for statement, count in self.repeated(1)[:5]
+        )
+        return "\n".join(lines)
+
+
+@contextmanager
+def track_queries():
+    """Collects the statements executed in the current context.
+
+    The statistics follow the context into asyncio tasks, greenlets and
+    threads started with `run_in_threadpool`.
+
+    Yields:
+        QueryStats: The statistics, filled in as statements run.
+    """
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def _before_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+) -> None:
+    """Notes the start time of a statement in a tracked context.
+
+    The time is kept on the execution context of the statement, which is
+    discarded with it, so a failing statement leaves nothing behind on the
+    pooled connection.
+    """
+    if _current.get() is not None:
+        context._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+) -> None:
+    """Records a finished statement in the tracked context."""
+    stats = _current.get()
+    started = getattr(context, "_query_started", None)
+    if stats is not None and started is not None:
+        stats.record(statement, time.perf_counter() - started)
+
+
+def install_query_tracking() -> None:
+    """Hooks statement tracking into every engine of the process."""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def log_query_stats(
+    method: str,
+    path: str,
+    stats: QueryStats,
+    max_statements: int,
+    repeat_threshold: int,
+) -> None:
+    """Warns about requests that ran many or repeated statements.
+
+    Args:
+        method (str): The HTTP method of the request.
+        path (str): The path of the request.
+        stats (QueryStats): The statements of the request.
+        max_statements (int): The statement count above which the request
+            is logged.
+        repeat_threshold (int): The number of executions of one statement
+            reported as a likely N+1 query.
+    """
+    if stats.count > max_statements:
+        logger.warning("%s %s ran %s", method, path, stats.summary())
+    for statement, count in stats.repeated(repeat_threshold):
+        logger.warning(
+            "%s %s ran the same statement %d times, likely an N+1 query: %s",
+            method,
+            path,
+            count,
+            " ".join(statement.split()),
+        )
+
+
+class QueryStatsMiddleware:
+    """ASGI middleware that tracks the statements of each HTTP request.
+
+    The statistics are logged once the last chunk of the response body is
+    sent, so statements run while a streaming response produces its body
+    are included and background tasks started afterwards are not. A
+    request that fails before its response completes is logged when the
+    error propagates.
+    """
+
+    def __init__(self, app, max_statements: int, repeat_threshold: int):
+        """Wraps an ASGI application.
+
+        Args:
+            app: The ASGI application.
+            max_statements (int): The statement count above which a request
+                is logged.
+            repeat_threshold (int): The number of executions of one
+                statement reported as a likely N+1 query.
+        """
+        self.app = app
+        self.max_statements = max_statements
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope, receive, send) -> None:
+        """Handles one ASGI connection.
+
+        Args:
+            scope (dict): The connection scope.
+            receive: Receives the events of the client.
+            send: Sends events to the client.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        logged = False
+
+        def log(stats: QueryStats) -> None:
+            nonlocal logged
+            if not logged:
+                logged = True
+                log_query_stats(
+                    scope["method"],
+                    scope["path"],
+                    stats,
+                    max_statements=self.max_statements,
+                    repeat_threshold=self.repeat_threshold,
+                )
+
+        with track_queries() as stats:
+
+            async def send_and_log(message) -> None:
+                await send(message)
+                if message["type"] == "http.response.body" and not message.get(
+                    "more_body", False
+                ):
+                    log(stats)
+
+            try:
+                await self.app(scope, receive, send_and_log)
+            finally:
+                log(stats)
@@ -0,0 +1,181 @@
+"""Selection of read replicas and read-your-writes tracking."""
+
+import asyncio
+import logging
+import threading
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+HEALTH_CHECK_TIMEOUT_SECONDS = 2.0
+MAX_TRACKED_WRITERS = 10_000
+
+
+async def _select_one(engine: AsyncEngine) -> None:
+    """Runs a trivial query on a fresh connection.
+
+    Args:
+        engine (AsyncEngine): The engine to check.
+    """
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+
+
+class ReplicaSet:
+    """Spreads reads over the healthy replicas in round-robin order.
+
+    A replica is taken out of rotation when a request loses its connection
+    to it or when a periodic health check fails, and put back once a later
+    health check succeeds or `retry_interval` has passed.
+
+    Attributes:
+        engines (list[AsyncEngine]): The engines of the replicas.
+        check_interval (float): Seconds between health checks.
+        retry_interval (float): Seconds a failed replica stays out of
+            rotation when no health check brings it back earlier.
+    """
+
+    def __init__(
+        self,
+        engines: list[AsyncEngine],
+        check_interval: float = 10,
+        retry_interval: float = 30,
+    ):
+        """Initializes the set with every replica considered healthy.
+
+        Args:
+            engines (list[AsyncEngine]): The engines of the replicas.
+            check_interval (float): Seconds between health checks.
+            retry_interval (float): Seconds a failed replica stays out of
+                rotation.
+        """
+        self.engines = engines
+        self.check_interval = check_interval
+        self.retry_interval = retry_interval
+        self._down_until = [0.0] * len(engines)
+        self._next = 0
+        self._lock = threading.Lock()
+        self._task: asyncio.Task | None = None
+
+    def choose(self) -> AsyncEngine | None:
+        """Picks the next healthy replica.
+
+        Returns:
+            AsyncEngine | None: The replica's engine, or None if no replica
+                is healthy.
+        """
+        now = time.monotonic()
+        with self._lock:
+            for offset in range(len(self.engines)):
+                index = (self._next + offset) % len(self.engines)
+                if self._down_until[index] <= now:
+                    self._next = index + 1
+                    return self.engines[index]
+        return None
+
+    def mark_down(self, engine: AsyncEngine) -> None:
+        """Takes a replica out of rotation.
+
+        Args:
+            engine (AsyncEngine): The engine of the failed replica.
+        """
+        index = self.engines.index(engine)
+        with self._lock:
+            self._down_until[index] = time.monotonic() + self.retry_interval
+        logger.warning("Read replica %s is unavailable", engine.url.host)
+
+    async def _ping(self, index: int) -> None:
+        """Checks one replica and updates its state.
+
+        Args:
+            index (int): The position of the replica.
+        """
+        engine = self.engines[index]
+        try:
+            await asyncio.wait_for(_select_one(engine), HEALTH_CHECK_TIMEOUT_SECONDS)
+        except Exception:
+            self.mark_down(engine)
+        else:
+            with self._lock:
+                self._down_until[index] = 0.0
+
+    async def check(self) -> None:
+        """Pings every replica concurrently and updates the rotation."""
+        await asyncio.gather(*(self._ping(i) for i in range(len(self.engines))))
+
+    async def start(self) -> None:
+        """Starts the periodic health checks if there are replicas."""
+        if self.engines and self.check_interval > 0:
+            self._task = asyncio.create_task(self._check_forever())
+
+    async def stop(self) -> None:
+        """Stops the health checks."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _check_forever(self) -> None:
+        """Runs the health checks periodically until cancelled."""
+        while True:
+            try:
+                await self.check()
+            except Exception:
+                logger.exception("Read replica health check failed")
+            await asyncio.sleep(self.check_interval)
+
+
+class RecentWrites:
+    """Remembers which users wrote recently, so their reads see the writes.
+
+    Replicas apply changes with a delay, so for `window` seconds after a
+    write the user's reads are served by the primary. The record is kept in
+    process, like the user cache: a request served by another worker may
+    still read from a replica.
+
+    Attributes:
+        window (float): Seconds reads stay on the primary after a write.
+    """
+
+    def __init__(self, window: float):
+        """Initializes an empty record.
+
+        Args:
+            window (float): Seconds reads stay on the primary after a write.
+        """
+        self.window = window
+        self._until: dict[int, float] = {}
+        self._lock = threading.Lock()
+
+    def record(self, user_id: int) -> None:
+        """Notes that a user has just written.
+
+        Args:
+            user_id (int): The unique ID of the user.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if len(self._until) >= MAX_TRACKED_WRITERS:
+                self._until = {
+                    key: until for key, until in self._until.items() if until > now
+                }
+            self._until[user_id] = now + self.window
+
+    def is_recent(self, user_id: int) -> bool:
+        """Checks whether a user wrote within the window.
+
+        Args:
+            user_id (int): The unique ID of the user.
+
+        Returns:
+            bool: True if the user's reads must go to the primary.
+        """
+        return self._until.get(user_id, 0.0) > time.monotonic()
+
+    def clear(self) -> None:
+        """Forgets all recorded writes."""
+        with self._lock:
+            self._until.clear()
@@ -1,16 +1,62 @@
 """Database session management configuration."""
 
-from sqlalchemy import create_engine
+from contextlib import asynccontextmanager
+from functools import cache
+
+from sqlalchemy import URL, create_engine, make_url
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
+from app.database.pool import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    ping_idle_connections,
+    pool_sizing,
+)
+from app.database.query_stats import install_query_tracking
+from app.database.replicas import RecentWrites, ReplicaSet
+
+ASYNC_DRIVERS = {"mariadb": "asyncmy", "mysql": "asyncmy", "sqlite": "aiosqlite"}
+
+# The synchronous engine only serves background work and Alembic.
+SYNC_POOL_SIZE = 2
+SYNC_MAX_OVERFLOW = 2
+
+
+def pool_options(pool_size: int, max_overflow: int) -> dict:
+    """Builds the pool arguments of an engine from the settings.
+
+    Args:
+        pool_size (int): The number of connections kept open.
+        max_overflow (int): The number of extra connections opened under load.
+
+    Returns:
+        dict: Keyword arguments for `create_engine`.
+    """
+    return {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_pre_ping": settings.db_pool_liveness == "pre_ping",
+        "pool_recycle": settings.db_pool_recycle_seconds,
+    }
+
+
+install_query_tracking()
 
 engine = create_engine(
-    str(settings.database_url), pool_pre_ping=True, pool_size=10, max_overflow=20
+    str(settings.database_url),
+    poolclass=InstrumentedQueuePool,
+    **pool_options(SYNC_POOL_SIZE, SYNC_MAX_OVERFLOW),
 )
+if settings.db_pool_liveness == "idle":
+    ping_idle_connections(engine, settings.db_pool_idle_ping_seconds)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+recent_writes = RecentWrites(window=settings.replica_sticky_seconds)
+
 
 def get_db():
     """Dependency that yields a database session.
@@ -22,4 +68,186 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+def get_session_factory() -> sessionmaker:
+    """Dependency that provides the factory of synchronous sessions.
+
+    Background tasks that outlive the request open their own sessions with
+    it.
+
+    Returns:
+        sessionmaker: The session factory.
+    """
+    return SessionLocal
+
+
+def to_async_url(url: str | URL) -> URL:
+    """Swaps the driver of a database URL for its asyncio counterpart.
+
+    Args:
+        url (str | URL): A database URL using a synchronous driver.
+
+    Returns:
+        URL: The same URL using the backend's asyncio driver.
+
+    Raises:
+        ValueError: If no asyncio driver is known for the backend.
+    """
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No asyncio driver configured for {backend}")
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+
+
+def create_pooled_async_engine(url: str | URL, reserved: int = 0) -> AsyncEngine:
+    """Creates an asyncio engine sized for this worker's share of connections.
+
+    Args:
+        url (str | URL): The database URL with a synchronous driver.
+        reserved (int): Connections per worker that other pools already
+            open to the same server.
+
+    Returns:
+        AsyncEngine: The engine.
+    """
+    pool_size, max_overflow = pool_sizing(
+        settings.db_max_connections, settings.web_concurrency, reserved
+    )
+    async_engine = create_async_engine(
+        to_async_url(url),
+        poolclass=InstrumentedAsyncQueuePool,
+        **pool_options(pool_size, max_overflow),
+    )
+    if settings.db_pool_liveness == "idle":
+        ping_idle_connections(
+            async_engine.sync_engine, settings.db_pool_idle_ping_seconds
+        )
+    return async_engine
+
+
+@cache
+def get_async_engine() -> AsyncEngine:
+    """Returns the process-wide asyncio engine, creating it on first use.
+
+    The engine is created lazily so that code using only the synchronous
+    engine, such as Alembic and the background workers, does not need the
+    asyncio driver installed.
+
+    Returns:
+        AsyncEngine: The engine used by request handlers.
+    """
+    return create_pooled_async_engine(
+        str(settings.database_url), reserved=SYNC_POOL_SIZE + SYNC_MAX_OVERFLOW
+    )
+
+
+@cache
+def get_async_sessionmaker() -> async_sessionmaker:
+    """Returns the factory for asyncio sessions bound to the asyncio engine.
+
+    Attributes stay loaded after commit, since handlers serialize the
+    objects after the transaction has ended and an asyncio session cannot
+    lazily reload them.
+
+    Returns:
+        async_sessionmaker: The session factory.
+    """
+    return async_sessionmaker(
+        get_async_engine(), autoflush=False, expire_on_commit=False
+    )
+
+
+async def get_async_db():
+    """Dependency that yields an asyncio database session.
+
+    Yields:
+        AsyncSession: A SQLAlchemy asyncio database session.
+    """
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+@cache
+def get_replica_set() -> ReplicaSet:
+    """Returns the read replicas configured in the settings.
+
+    Returns:
+        ReplicaSet: The replicas, possibly none.
+    """
+    engines = [
+        create_pooled_async_engine(str(url)) for url in settings.database_replica_urls
+    ]
+    return ReplicaSet(engines, check_interval=settings.replica_check_interval)
+
+
+@asynccontextmanager
+async def read_session(user_id: int | None = None):
+    """Opens an asyncio session for reads, on a replica where possible.
+
+    The primary serves the reads when no replica is healthy, and when
+    `user_id` changed data recently, so users always see their own writes.
+    A replica whose connection fails is taken out of rotation.
+
+    Args:
+        user_id (int | None): The unique ID of the user the reads are for.
+
+    Yields:
+        AsyncSession: A SQLAlchemy asyncio database session.
+    """
+    replica = None
+    if user_id is None or not recent_writes.is_recent(user_id):
+        replica = get_replica_set().choose()
+
+    bind = replica if replica is not None else get_async_engine()
+    async with get_async_sessionmaker()(bind=bind) as db:
+        try:
+            yield db
+        except OperationalError:
+            if replica is not None:
+                get_replica_set().mark_down(replica)
+            raise
+
+
+async def get_async_read_db():
+    """Dependency that yields an asyncio session for reads.
+
+    Yields:
+        AsyncSession: A session on a replica, or on the primary if no
+            replica is available.
+    """
+    async with read_session() as db:
+        yield db
+
+
+def pool_stats() -> dict:
+    """Reports the connection pools of the engines created so far.
+
+    Returns:
+        dict: The statistics of the `sync` pool, the asyncio `primary` pool
+            and the `replicas` pools, the latter in the order of
+            `database_replica_urls`. Host names are left out, so the report
+            does not reveal the database topology.
+    """
+    stats = {"sync": engine.pool.stats()}
+    if get_async_engine.cache_info().currsize:
+        stats["primary"] = get_async_engine().pool.stats()
+    if get_replica_set.cache_info().currsize:
+        stats["replicas"] = [
+            replica.pool.stats() for replica in get_replica_set().engines
+        ]
+    return stats
+
+
+async def dispose_async_engine() -> None:
+    """Closes the pooled connections of the asyncio engines that were created."""
+    if get_replica_set.cache_info().currsize:
+        for replica in get_replica_set().engines:
+            await replica.dispose()
+        get_replica_set.cache_clear()
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+        get_async_sessionmaker.cache_clear()
+        get_async_engine.cache_clear()
@@ -1,38 +1,113 @@
 """API endpoints for user authentication and registration."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from jose import JWTError, jwt
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.core.security import create_access_token, verify_password
-from app.crud.user_repo import create_user, get_user_by_email
+from app.core.security import create_access_token
+from app.crud.user_cache import user_cache
+from app.crud.user_repo import (
+    create_user_async,
+    get_user_by_email_async,
+    get_user_by_id_async,
+    revoke_tokens_async,
+    update_password_hash_async,
+)
 from app.database.models import User
-from app.database.session import get_db
+from app.database.session import get_async_db, read_session, recent_writes
 from app.schemas.token import Token
 from app.schemas.user import UserCreate, UserResponse
+from app.services.login_throttle import LoginThrottle
+from app.services.password_service import PasswordHasher, PasswordHasherBusyError
 
 router = APIRouter()
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login")
 
+HASHER_RETRY_AFTER_SECONDS = 1
+
+
+def get_password_hasher(request: Request) -> PasswordHasher:
+    """Dependency provider for the password hashing pool.
+
+    Args:
+        request (Request): The request object containing application state.
+
+    Returns:
+        PasswordHasher: The application's password hasher.
+    """
+    return request.app.state.password_hasher
+
+
+def get_login_throttle(request: Request) -> LoginThrottle:
+    """Dependency provider for the login throttle.
+
+    Args:
+        request (Request): The request object containing application state.
+
+    Returns:
+        LoginThrottle: The application's login throttle.
+    """
+    return request.app.state.login_throttle
+
+
+def hasher_busy_exception() -> HTTPException:
+    """Builds the error returned when the password hashing queue is full.
+
+    Returns:
+        HTTPException: A `503` asking the client to retry shortly.
+    """
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many concurrent sign-ins, please retry.",
+        headers={"Retry-After": str(HASHER_RETRY_AFTER_SECONDS)},
+    )
+
+
+async def _load_user(db: AsyncSession, user_id: int) -> User | None:
+    """Retrieves a user through the in-process cache.
+
+    Args:
+        db (AsyncSession): The database session, only used on a cache miss.
+        user_id (int): The unique ID of the user.
+
+    Returns:
+        User | None: The user instance if found, otherwise None.
+    """
+    user = user_cache.get(user_id)
+    if user is None:
+        user = await get_user_by_id_async(db, user_id)
+        if user is not None:
+            user_cache.put(user)
+    return user
+
 
 async def get_current_user(
-    token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db),
 ) -> User:
     """Dependency to retrieve the currently authenticated user from a JWT token.
 
+    Tokens carrying the `uid` and `ver` claims are resolved through the
+    in-process user cache, so most requests authenticate without a database
+    round trip; the session only checks out a connection on a cache miss.
+    Lookups go to the primary, never a replica, so a revocation or a new
+    account is seen by every worker as soon as it is committed.
+    Older tokens that only carry the email are looked up by email.
+
     Args:
         token (str): The JWT access token.
-        db (Session): The database session.
+        db (AsyncSession): The database session.
 
     Returns:
         User: The authenticated user instance.
 
     Raises:
-        HTTPException: If the token is invalid, expired, or the user does not exist.
+        HTTPException: If the token is invalid, expired, revoked, or the user
+            does not exist.
     """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -52,58 +127,164 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
 
-    user = get_user_by_email(db, email=email)
+    user_id = payload.get("uid")
+    token_version = payload.get("ver")
+    if isinstance(user_id, int) and isinstance(token_version, int):
+        user = await _load_user(db, user_id)
+        if (
+            user is None
+            or user.email != email
+            or user.token_version != token_version
+        ):
+            raise credentials_exception
+        return user
+
+    user = await get_user_by_email_async(db, email=email)
     if user is None:
         raise credentials_exception
 
     return user
 
 
+async def get_user_read_db(current_user: User = Depends(get_current_user)):
+    """Dependency that yields a session for the authenticated user's reads.
+
+    Reads go to a replica, except shortly after the user changed data, so
+    the user's own writes are always visible.
+
+    Args:
+        current_user (User): The authenticated user.
+
+    Yields:
+        AsyncSession: A SQLAlchemy asyncio database session.
+    """
+    async with read_session(current_user.id) as db:
+        yield db
+
+
 @router.post("/signup", response_model=UserResponse)
-def register_user(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register_user(
+    user_data: UserCreate,
+    db: AsyncSession = Depends(get_async_db),
+    hasher: PasswordHasher = Depends(get_password_hasher),
+):
     """Registers a new user in the system.
 
+    The password is hashed on the dedicated password pool and the insert
+    runs on the asyncio driver, so neither blocks the event loop.
+
     Args:
         user_data (UserCreate): The user registration data.
-        db (Session): The database session.
+        db (AsyncSession): The database session.
+        hasher (PasswordHasher): The password hashing pool.
 
     Returns:
         UserResponse: The created user details.
 
     Raises:
-        HTTPException: If the email address is already registered.
+        HTTPException: If the email address is already registered or the
+            password hashing queue is full.
     """
     try:
-        new_user = create_user(db=db, user=user_data)
+        hashed_password = await hasher.hash(user_data.password)
+    except PasswordHasherBusyError:
+        raise hasher_busy_exception()
+
+    try:
+        new_user = await create_user_async(
+            db, user=user_data, hashed_password=hashed_password
+        )
+        recent_writes.record(new_user.id)
         return new_user
     except IntegrityError:
         raise HTTPException(status_code=400, detail="Email already registered")
 
 
 @router.post("/login", response_model=Token)
-def login_for_access_token(
-    form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)
+async def login_for_access_token(
+    request: Request,
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+    hasher: PasswordHasher = Depends(get_password_hasher),
+    throttle: LoginThrottle = Depends(get_login_throttle),
 ):
     """Authenticates a user and issues an access token.
 
+    Accounts and client addresses with too many recent failures are turned
+    away before any password is verified. A password whose stored hash uses
+    outdated parameters is transparently rehashed with the current ones.
+
     Args:
+        request (Request): The incoming request.
         form_data (OAuth2PasswordRequestForm): The login credentials (username/password).
-        db (Session): The database session.
+        db (AsyncSession): The database session.
+        hasher (PasswordHasher): The password hashing pool.
+        throttle (LoginThrottle): The failed login throttle.
 
     Returns:
         Token: The JWT access token.
 
     Raises:
-        HTTPException: If authentication fails.
+        HTTPException: If authentication fails, the caller is throttled, or
+            the password hashing queue is full.
     """
-    user = get_user_by_email(db, form_data.username)
+    client_ip = request.client.host if request.client else None
+    retry_after = throttle.retry_after(form_data.username, client_ip)
+    if retry_after is not None:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many failed login attempts, please retry later.",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+    user = await get_user_by_email_async(db, form_data.username)
+
+    verified, new_hash = False, None
+    try:
+        if user is not None:
+            verified, new_hash = await hasher.verify_and_update(
+                form_data.password, user.hashed_password
+            )
+    except PasswordHasherBusyError:
+        raise hasher_busy_exception()
 
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not verified:
+        throttle.record_failure(form_data.username, client_ip)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    access_token = create_access_token(subject=user.email)
-    return {"access_token": access_token, "token_type": "bearer"}
\ No newline at end of file
+    throttle.reset(form_data.username)
+    access_token = create_access_token(
+        subject=user.email, user_id=user.id, token_version=user.token_version
+    )
+
+    if new_hash:
+        user_id = user.id
+        await update_password_hash_async(db, user_id, new_hash)
+        recent_writes.record(user_id)
+        user_cache.invalidate(user_id)
+
+    return {"access_token": access_token, "token_type": "bearer"}
+
+
+@router.post("/logout/all", status_code=204)
+async def logout_everywhere(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Revokes every access token issued to the authenticated user.
+
+    Args:
+        current_user (User): The authenticated user.
+        db (AsyncSession): The database session.
+
+    Returns:
+        None
+    """
+    await revoke_tokens_async(db, current_user.id)
+    recent_writes.record(current_user.id)
+    user_cache.invalidate(current_user.id)
+    return None
\ No newline at end of file
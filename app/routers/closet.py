@@ -1,56 +1,183 @@
 """API endpoints for managing the user's closet."""
 
-import os
-import shutil
-import uuid
+import asyncio
 from pathlib import Path
-from typing import Annotated, Any, List
+from typing import Annotated, Any, Collection, List
 
 from fastapi import (
     APIRouter,
+    BackgroundTasks,
     Depends,
     File,
     Form,
     HTTPException,
+    Query,
     Request,
+    Response,
     UploadFile,
 )
-from sqlalchemy import select
-from sqlalchemy.orm import Session, joinedload
-
-from app.core.utils import CANDIDATE_LABELS, INCOMPATIBLE_KEYWORDS
-from app.crud.item_repo import create_item
-from app.crud.tag_repo import get_or_create_tag, link_item_to_tag
-from app.database.models import ClothingWeather, Item, User
-from app.database.session import get_db
-from app.routers.auth import get_current_user
-from app.schemas.item import ItemCreate, ItemResponse
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.etags import etag_matches, weak_etag
+from app.core.responses import NDJSON_MEDIA_TYPE, FastJSONResponse, json_line
+from app.core.utils import (
+    CANDIDATE_LABELS,
+    ITEM_HYPOTHESIS_TEMPLATE,
+    select_item_tags,
+)
+from app.crud.item_repo import (
+    delete_items_async,
+    export_items_async,
+    get_items_page_async,
+    search_items_async,
+    unreferenced_images_async,
+)
+from app.crud.tag_repo import (
+    create_item_with_tags_async,
+    create_items_with_tags_async,
+)
+from app.crud.user_repo import get_closet_version_async
+from app.database.models import User
+from app.database.session import get_async_db, get_session_factory, recent_writes
+from app.routers.auth import get_current_user, get_user_read_db
+from app.schemas.item import (
+    BatchUploadResponse,
+    BulkDeleteRequest,
+    BulkDeleteResponse,
+    ClosetPage,
+    ImportResponse,
+    ItemCreate,
+    ItemImport,
+    ItemResponse,
+    SearchPage,
+)
+from app.services.closet_import import ClosetImport, prepare_entries
+from app.services.image_reaper import delete_images
+from app.services.image_service import image_variants
+from app.services.image_storage import (
+    ImageStore,
+    ImageTooLargeError,
+    InvalidImageError,
+    LocalImageStore,
+)
+from app.services.retag_job import RetagJob, RetagWorker, RetagWorkerBusyError
 
 router = APIRouter()
 UPLOAD_DIR = Path("static/images")
-UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+image_store = LocalImageStore(UPLOAD_DIR)
+
+ITEM_FIELDS = frozenset({"description", "image", "tags"})
+MAX_PAGE_SIZE = 100
+MAX_BATCH_SIZE = 50
+MAX_SEARCH_OFFSET = 1000
+PRIVATE_REVALIDATE = "private, no-cache"
+EXPORT_CHUNK_BYTES = 64 * 1024
+RETAG_RETRY_AFTER_SECONDS = 60
 
 
-def item_to_response(item: Any) -> dict:
-    """Helper to convert an Item model to a response dictionary.
+def get_image_store() -> ImageStore:
+    """Dependency provider for the image store.
+
+    Returns:
+        ImageStore: The store holding uploaded images.
+    """
+    return image_store
+
+
+def get_retag_worker(request: Request) -> RetagWorker | None:
+    """Dependency provider for the re-tagging worker.
 
     Args:
-        item (Any): The Item model instance.
+        request (Request): The request object containing application state.
+
+    Returns:
+        RetagWorker | None: The worker, or None outside the app lifespan.
+    """
+    return getattr(request.app.state, "retag_worker", None)
+
+
+def item_to_response(
+    item: Any, store: ImageStore, fields: Collection[str] = ITEM_FIELDS
+) -> dict:
+    """Helper to convert an Item model or row to a response dictionary.
+
+    Args:
+        item (Any): The Item model instance or a row with its columns.
+        store (ImageStore): The store holding the item's image.
+        fields (Collection[str]): The optional field groups to include.
 
     Returns:
         dict: The serialized item data.
     """
-    tags = []
-    if hasattr(item, "weather_links"):
-        tags = [link.tag.name for link in item.weather_links if link.tag]
+    response = {"id": item.id, "owner_id": item.owner_id}
 
-    return {
-        "id": item.id,
-        "owner_id": item.owner_id,
-        "description": item.description,
-        "image_filename": item.image_filename,
-        "tags": tags,
-    }
+    if "description" in fields:
+        response["description"] = item.description
+
+    if "image" in fields:
+        response["image_filename"] = item.image_filename
+        response.update(image_variants(item.image_filename, store))
+
+    if "tags" in fields:
+        response["tags"] = list(item.tag_names)
+
+    return response
+
+
+def images_ready(entries: list[dict]) -> bool:
+    """Checks that no serialized item is still waiting for image variants.
+
+    Variants appear without a closet change, so responses listing images
+    that lack them must not be given a validator that outlives them.
+
+    Args:
+        entries (list[dict]): The serialized items.
+
+    Returns:
+        bool: True if every listed image already has its variants.
+    """
+    return all(
+        entry["variants"] or not entry["image_filename"]
+        for entry in entries
+        if "image_filename" in entry
+    )
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    """Answers a conditional request whose validator is still current.
+
+    Args:
+        request (Request): The incoming request.
+        etag (str): The current ETag of the requested representation.
+
+    Returns:
+        Response | None: An empty `304` response, or None if the client
+            needs the full representation.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, etag):
+        return Response(
+            status_code=304,
+            headers={"ETag": etag, "Cache-Control": PRIVATE_REVALIDATE},
+        )
+    return None
+
+
+def schedule_variants(request: Request, store: ImageStore, key: str) -> None:
+    """Queues variant generation for a stored image that has none yet.
+
+    Args:
+        request (Request): The request object containing application state.
+        store (ImageStore): The store holding the image.
+        key (str): The storage key of the image.
+    """
+    image_service = getattr(request.app.state, "image_service", None)
+    if image_service and not image_variants(key, store)["variants"]:
+        image_service.schedule_variants(store.path(key))
 
 
 @router.post("/closet/upload", response_model=ItemResponse)
@@ -59,102 +186,517 @@ async def upload_item(
     file: Annotated[UploadFile, File()],
     description: Annotated[str, Form()],
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
+    store: ImageStore = Depends(get_image_store),
 ):
     """Uploads a new clothing item, saves the image, and processes tags via AI.
 
+    Resized image variants are generated in the background after the image
+    is stored. The classifier runs on the threadpool, so it does not block
+    other requests.
+
     Args:
         request (Request): The request object containing application state.
         file (UploadFile): The uploaded image file.
         description (str): A description of the clothing item.
         current_user (User): The authenticated user.
-        db (Session): The database session.
+        db (AsyncSession): The database session.
+        store (ImageStore): The store for uploaded images.
 
     Returns:
         ItemResponse: The created item with generated tags.
 
     Raises:
-        HTTPException: If the file type is invalid or saving fails.
+        HTTPException: If the file is not an image, is too large or saving fails.
     """
-    if file.content_type not in ["image/jpeg", "image/png", "image/webp"]:
-        raise HTTPException(status_code=400, detail="Invalid image type.")
-
-    file_extension = (
-        file.filename.split(".")[-1]
-        if file.filename and "." in file.filename
-        else "jpg"
-    )
-    unique_filename = f"{uuid.uuid4()}.{file_extension}"
-    file_path = UPLOAD_DIR / unique_filename
-
     try:
-        with file_path.open("wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-    except Exception:
+        image_key = await store.save(file, settings.max_upload_bytes)
+    except InvalidImageError:
+        raise HTTPException(status_code=400, detail="Invalid image type.")
+    except ImageTooLargeError:
+        raise HTTPException(status_code=413, detail="Image is too large.")
+    except OSError:
         raise HTTPException(status_code=500, detail="Could not save file.")
 
-    item_in = ItemCreate(description=description, image_filename=unique_filename)
-    new_item = create_item(db=db, item=item_in, owner_id=current_user.id)
+    schedule_variants(request, store, image_key)
 
+    tags, scores = {}, None
     ai_service = request.app.state.ai_service
     if ai_service:
-        results = ai_service.classify_description(
+        scores = await run_in_threadpool(
+            ai_service.classify_description,
             text=description,
             candidate_labels=CANDIDATE_LABELS,
-            hypothesis_template="This item is worn when the weather is {}.",
+            hypothesis_template=ITEM_HYPOTHESIS_TEMPLATE,
+        )
+        tags = select_item_tags(description, scores)
+
+    item_in = ItemCreate(description=description, image_filename=image_key)
+    new_item = await create_item_with_tags_async(
+        db, current_user.id, item_in, tags, scores
+    )
+    recent_writes.record(current_user.id)
+    return item_to_response(new_item, store)
+
+
+async def _store_upload(store: ImageStore, file: UploadFile) -> str:
+    """Stores one file of a batch upload, translating failures to messages.
+
+    Args:
+        store (ImageStore): The store for uploaded images.
+        file (UploadFile): The uploaded file.
+
+    Returns:
+        str: The storage key of the image.
+
+    Raises:
+        ValueError: With a client-facing message if the file is rejected.
+    """
+    try:
+        return await store.save(file, settings.max_upload_bytes)
+    except (InvalidImageError, ImageTooLargeError) as e:
+        raise ValueError(str(e))
+    except OSError:
+        raise ValueError("Could not save file.")
+
+
+@router.post("/closet/upload/batch", response_model=BatchUploadResponse)
+async def upload_items_batch(
+    request: Request,
+    files: Annotated[List[UploadFile], File()],
+    descriptions: Annotated[List[str], Form()],
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: AsyncSession = Depends(get_async_db),
+    store: ImageStore = Depends(get_image_store),
+):
+    """Uploads several clothing items in one request.
+
+    Files are streamed to storage concurrently, all descriptions are
+    classified in one batched inference call, and the items and their tag
+    links are inserted in a single transaction. Files that fail validation
+    are reported individually without affecting the rest of the batch.
+
+    Args:
+        request (Request): The request object containing application state.
+        files (List[UploadFile]): The uploaded image files.
+        descriptions (List[str]): One description per file, in the same order.
+        current_user (User): The authenticated user.
+        db (AsyncSession): The database session.
+        store (ImageStore): The store for uploaded images.
+
+    Returns:
+        BatchUploadResponse: The outcome for every file, in request order.
+
+    Raises:
+        HTTPException: If the files and descriptions do not match up or the
+            batch is too large.
+    """
+    if len(files) != len(descriptions):
+        raise HTTPException(
+            status_code=400, detail="Each file needs exactly one description."
+        )
+    if len(files) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=413, detail=f"At most {MAX_BATCH_SIZE} files per batch."
+        )
+
+    stored = await asyncio.gather(
+        *(_store_upload(store, file) for file in files), return_exceptions=True
+    )
+    for outcome in stored:
+        if isinstance(outcome, BaseException) and not isinstance(
+            outcome, ValueError
+        ):
+            raise outcome
+
+    accepted = [i for i, outcome in enumerate(stored) if isinstance(outcome, str)]
+    texts = [descriptions[i] for i in accepted]
+
+    ai_service = request.app.state.ai_service
+    scores = None
+    if ai_service and texts:
+        scores = await run_in_threadpool(
+            ai_service.classify_batch,
+            texts,
+            CANDIDATE_LABELS,
+            hypothesis_template=ITEM_HYPOTHESIS_TEMPLATE,
+        )
+
+    entries = [
+        (
+            ItemCreate(description=descriptions[i], image_filename=stored[i]),
+            select_item_tags(descriptions[i], item_scores),
         )
+        for i, item_scores in zip(accepted, scores or [{}] * len(accepted))
+    ]
+    items = []
+    if entries:
+        items = await create_items_with_tags_async(
+            db, current_user.id, entries, scores
+        )
+        recent_writes.record(current_user.id)
+
+    for key in {item.image_filename for item in items}:
+        schedule_variants(request, store, key)
+
+    created = dict(zip(accepted, items))
+    return {
+        "results": [
+            {"index": i, "item": item_to_response(created[i], store)}
+            if i in created
+            else {"index": i, "error": str(stored[i])}
+            for i in range(len(files))
+        ]
+    }
+
 
-        for label, score in results.items():
-            if label in INCOMPATIBLE_KEYWORDS:
-                if any(
-                    k in description.lower() for k in INCOMPATIBLE_KEYWORDS[label]
-                ):
-                    continue
+@router.get("/closet", response_model=ClosetPage)
+async def get_closet(
+    request: Request,
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: AsyncSession = Depends(get_user_read_db),
+    store: ImageStore = Depends(get_image_store),
+    cursor: int | None = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = 50,
+    fields: str | None = None,
+    tag: str | None = None,
+):
+    """Retrieves one page of items in the authenticated user's closet.
 
-            if score > 70:
-                tag = get_or_create_tag(db, label)
-                link_item_to_tag(db, new_item.id, tag.id, score)
+    The response carries a weak ETag derived from the user's closet version
+    and the query. A request whose `If-None-Match` still matches is answered
+    with `304 Not Modified` after a single primary-key lookup. The page is
+    encoded straight from the fetched rows, without validating it against
+    `ClosetPage`, which only documents the response.
 
-    db.refresh(new_item)
-    return item_to_response(new_item)
+    Args:
+        request (Request): The incoming request.
+        current_user (User): The authenticated user.
+        db (AsyncSession): The database session.
+        store (ImageStore): The store holding item images.
+        cursor (int | None): The `next_cursor` of the previous page.
+        limit (int): The maximum number of items per page.
+        fields (str | None): Comma-separated field groups to include
+            (`description`, `image`, `tags`). Defaults to all of them.
+        tag (str | None): Only return items linked to this weather tag.
+
+    Returns:
+        FastJSONResponse | Response: The items on the page and the cursor of
+            the next page, or an empty `304` response.
 
+    Raises:
+        HTTPException: If an unknown field group is requested.
+    """
+    selected = ITEM_FIELDS
+    if fields is not None:
+        selected = frozenset(f.strip() for f in fields.split(",") if f.strip())
+        unknown = selected - ITEM_FIELDS
+        if unknown:
+            detail = f"Unknown fields: {', '.join(sorted(unknown))}"
+            raise HTTPException(status_code=400, detail=detail)
+
+    version = await get_closet_version_async(db, current_user.id)
+    etag = weak_etag(current_user.id, version, cursor, limit, sorted(selected), tag)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+
+    items = await get_items_page_async(
+        db,
+        current_user.id,
+        limit=limit + 1,
+        after_id=cursor,
+        tag_name=tag,
+        with_tags="tags" in selected,
+    )
+    next_cursor = items[limit - 1].id if len(items) > limit else None
+    entries = [item_to_response(item, store, selected) for item in items[:limit]]
+
+    headers = {"Cache-Control": PRIVATE_REVALIDATE}
+    if images_ready(entries):
+        headers["ETag"] = etag
+
+    return FastJSONResponse(
+        {"items": entries, "next_cursor": next_cursor}, headers=headers
+    )
 
-@router.get("/closet", response_model=List[ItemResponse])
-def get_closet(
+
+@router.get("/closet/export")
+async def export_closet(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_user_read_db),
 ):
-    """Retrieves all items in the authenticated user's closet.
+    """Streams the authenticated user's whole closet as newline-delimited JSON.
+
+    Each line holds the `id`, `description`, `image_filename` and `tags` of
+    one item, `tags` mapping tag names to confidence scores. Items are read
+    through a server-side cursor and sent in chunks as they arrive, so
+    memory use stays constant whatever the size of the closet. The output
+    can be fed back to `POST /closet/import`.
 
     Args:
         current_user (User): The authenticated user.
-        db (Session): The database session.
+        db (AsyncSession): The database session.
 
     Returns:
-        List[ItemResponse]: A list of clothing items.
+        StreamingResponse: The items, one JSON document per line.
     """
-    stmt = (
-        select(Item)
-        .where(Item.owner_id == current_user.id)
-        .options(joinedload(Item.weather_links).joinedload(ClothingWeather.tag))
+
+    async def chunks():
+        buffer = bytearray()
+        async for entry in export_items_async(db, current_user.id):
+            buffer += json_line(entry)
+            if len(buffer) >= EXPORT_CHUNK_BYTES:
+                yield bytes(buffer)
+                buffer.clear()
+        if buffer:
+            yield bytes(buffer)
+
+    return StreamingResponse(
+        chunks(),
+        media_type=NDJSON_MEDIA_TYPE,
+        headers={
+            "Content-Disposition": 'attachment; filename="closet.ndjson"',
+            "Cache-Control": "private, no-store",
+        },
     )
-    items = db.scalars(stmt).unique().all()
 
-    return [item_to_response(item) for item in items]
+
+async def _import_batch(
+    db: AsyncSession,
+    owner_id: int,
+    batch: list[ItemImport],
+    store: ImageStore,
+    ai_service,
+) -> int:
+    """Classifies and inserts one batch of imported items.
+
+    Args:
+        db (AsyncSession): The database session.
+        owner_id (int): The unique ID of the importing user.
+        batch (list[ItemImport]): The parsed items.
+        store (ImageStore): The store holding item images.
+        ai_service (AIService | None): The classifier, if available.
+
+    Returns:
+        int: The number of items created.
+    """
+    entries, scores = await run_in_threadpool(
+        prepare_entries, batch, store, ai_service
+    )
+    items = await create_items_with_tags_async(db, owner_id, entries, scores)
+    return len(items)
+
+
+@router.post("/closet/import", response_model=ImportResponse)
+async def import_closet(
+    request: Request,
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: AsyncSession = Depends(get_async_db),
+    store: ImageStore = Depends(get_image_store),
+):
+    """Imports items from a newline-delimited JSON request body.
+
+    The body has the format produced by `GET /closet/export` and is parsed
+    as it is received. Items are inserted in batches, each in its own
+    transaction, and the items of a batch that come without tags are
+    classified in one inference call. Invalid lines are skipped and
+    reported; if the import is interrupted, completed batches are kept.
+
+    Args:
+        request (Request): The request object containing application state.
+        current_user (User): The authenticated user.
+        db (AsyncSession): The database session.
+        store (ImageStore): The store holding item images.
+
+    Returns:
+        ImportResponse: The number of items created and the rejected lines.
+    """
+    closet_import = ClosetImport()
+    ai_service = request.app.state.ai_service
+    imported = 0
+
+    async for chunk in request.stream():
+        for batch in closet_import.feed(chunk):
+            imported += await _import_batch(
+                db, current_user.id, batch, store, ai_service
+            )
+    for batch in closet_import.finish():
+        imported += await _import_batch(db, current_user.id, batch, store, ai_service)
+
+    if imported:
+        recent_writes.record(current_user.id)
+    return {
+        "imported": imported,
+        "rejected": closet_import.rejected,
+        "errors": closet_import.errors,
+    }
+
+
+@router.post("/closet/retag", status_code=202)
+async def retag_closet(
+    request: Request,
+    current_user: Annotated[User, Depends(get_current_user)],
+    session_factory: sessionmaker = Depends(get_session_factory),
+    worker: RetagWorker | None = Depends(get_retag_worker),
+):
+    """Starts classifying the user's items again with the current setup.
+
+    The job is queued on the re-tagging worker, which bounds the number of
+    jobs running and waiting across all users. If it is interrupted, the
+    next request resumes it after the last finished batch.
+
+    Args:
+        request (Request): The request object containing application state.
+        current_user (User): The authenticated user.
+        session_factory (sessionmaker): Creates the sessions of the job.
+        worker (RetagWorker | None): The re-tagging worker.
+
+    Returns:
+        dict: The name of the started job.
+
+    Raises:
+        HTTPException: If the classifier is unavailable, the job is already
+            queued or running, or the re-tagging queue is full.
+    """
+    ai_service = request.app.state.ai_service
+    if not ai_service or worker is None:
+        raise HTTPException(status_code=503, detail="Classifier is unavailable.")
+
+    job = RetagJob(session_factory, ai_service, owner_id=current_user.id)
+    if worker.is_pending(job.name):
+        raise HTTPException(status_code=409, detail="Re-tagging is already running.")
+    try:
+        worker.submit(job)
+    except RetagWorkerBusyError:
+        raise HTTPException(
+            status_code=429,
+            detail="Too many re-tagging jobs, please retry later.",
+            headers={"Retry-After": str(RETAG_RETRY_AFTER_SECONDS)},
+        )
+    return {"job": job.name}
+
+
+@router.get("/closet/search", response_model=SearchPage)
+async def search_closet(
+    current_user: Annotated[User, Depends(get_current_user)],
+    q: Annotated[str, Query(min_length=1, max_length=200)],
+    db: AsyncSession = Depends(get_user_read_db),
+    store: ImageStore = Depends(get_image_store),
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = 20,
+    offset: Annotated[int, Query(ge=0, le=MAX_SEARCH_OFFSET)] = 0,
+):
+    """Searches the authenticated user's closet by item description.
+
+    Every word of `q` must match the description and the last one may be
+    incomplete, so the endpoint can be called on each keystroke. Results are
+    ranked by relevance where the database supports it. Like the closet
+    listing, the page is encoded without validation.
+
+    Args:
+        current_user (User): The authenticated user.
+        q (str): The search text.
+        db (AsyncSession): The database session.
+        store (ImageStore): The store holding item images.
+        limit (int): The maximum number of items per page.
+        offset (int): The `next_offset` of the previous page.
+
+    Returns:
+        FastJSONResponse: The matching items and the offset of the next page.
+    """
+    items = await search_items_async(
+        db, current_user.id, q, limit=limit + 1, offset=offset
+    )
+    next_offset = offset + limit if len(items) > limit else None
+
+    return FastJSONResponse(
+        {
+            "items": [item_to_response(item, store) for item in items[:limit]],
+            "next_offset": next_offset,
+        }
+    )
+
+
+async def discard_images(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession,
+    store: ImageStore,
+    keys: set[str],
+) -> None:
+    """Hands images that lost their last item over for deletion.
+
+    The files are removed by the application's image reaper when it runs,
+    otherwise by a background task after the response has been sent.
+
+    Args:
+        request (Request): The request object containing application state.
+        background_tasks (BackgroundTasks): The tasks run after the response.
+        db (AsyncSession): The database session.
+        store (ImageStore): The store holding item images.
+        keys (set[str]): The image keys of the deleted items.
+    """
+    unreferenced = await unreferenced_images_async(db, keys)
+    if not unreferenced:
+        return
+
+    image_reaper = getattr(request.app.state, "image_reaper", None)
+    if image_reaper:
+        image_reaper.enqueue(unreferenced)
+    else:
+        background_tasks.add_task(delete_images, store, sorted(unreferenced))
+
+
+@router.delete("/closet", response_model=BulkDeleteResponse)
+async def remove_items(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    body: BulkDeleteRequest,
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: AsyncSession = Depends(get_async_db),
+    store: ImageStore = Depends(get_image_store),
+):
+    """Deletes several clothing items in one transaction.
+
+    Args:
+        request (Request): The request object containing application state.
+        background_tasks (BackgroundTasks): The tasks run after the response.
+        body (BulkDeleteRequest): The IDs of the items to delete.
+        current_user (User): The authenticated user.
+        db (AsyncSession): The database session.
+        store (ImageStore): The store holding item images.
+
+    Returns:
+        BulkDeleteResponse: The IDs of the items that were deleted. IDs that
+            do not exist or belong to other users are left out.
+    """
+    deleted, keys = await delete_items_async(
+        db, current_user.id, set(body.ids)
+    )
+    if deleted:
+        recent_writes.record(current_user.id)
+    await discard_images(request, background_tasks, db, store, keys)
+    return {"deleted": deleted}
 
 
 @router.delete("/closet/{item_id}", status_code=204)
-def remove_item(
+async def remove_item(
+    request: Request,
+    background_tasks: BackgroundTasks,
     item_id: int,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
+    store: ImageStore = Depends(get_image_store),
 ):
-    """Deletes a clothing item and its associated image file.
+    """Deletes a clothing item and, if no other item uses it, its image.
 
     Args:
+        request (Request): The request object containing application state.
+        background_tasks (BackgroundTasks): The tasks run after the response.
         item_id (int): The ID of the item to delete.
         current_user (User): The authenticated user.
-        db (Session): The database session.
+        db (AsyncSession): The database session.
+        store (ImageStore): The store holding item images.
 
     Returns:
         None
@@ -162,21 +704,10 @@ def remove_item(
     Raises:
         HTTPException: If the item does not exist or does not belong to the user.
     """
-    stmt = select(Item).where(Item.id == item_id, Item.owner_id == current_user.id)
-    item = db.scalar(stmt)
-
-    if not item:
+    deleted, keys = await delete_items_async(db, current_user.id, [item_id])
+    if not deleted:
         raise HTTPException(status_code=404, detail="Item not found")
+    recent_writes.record(current_user.id)
 
-    filename = item.image_filename
-    db.delete(item)
-    db.commit()
-
-    if filename:
-        path = UPLOAD_DIR / filename
-        if path.exists():
-            try:
-                os.remove(path)
-            except OSError:
-                pass
-    return None
\ No newline at end of file
+    await discard_images(request, background_tasks, db, store, keys)
+    return None
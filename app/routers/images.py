@@ -0,0 +1,98 @@
+"""API endpoints for serving stored closet images."""
+
+import os
+import re
+import stat
+from pathlib import Path
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import FileResponse
+from starlette.concurrency import run_in_threadpool
+
+from app.core.etags import etag_matches
+from app.routers.closet import get_image_store
+from app.services.image_storage import ImageStore
+
+router = APIRouter()
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+CONTENT_ADDRESSED_NAME = re.compile(r"^[0-9a-f]{64}\.")
+
+
+def image_etag(path: Path, stat_result: os.stat_result) -> str:
+    """Builds a strong ETag for a stored image.
+
+    Content-addressed blobs and their variants carry the SHA-256 digest in
+    their name, which already identifies the bytes. Legacy files fall back
+    to their modification time and size.
+
+    Args:
+        path (Path): The path of the image file.
+        stat_result (os.stat_result): The file status of the image.
+
+    Returns:
+        str: The quoted ETag value.
+    """
+    if CONTENT_ADDRESSED_NAME.match(path.name):
+        return f'"{path.name}"'
+    return f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+
+def _stat_image(path: Path, root: Path) -> os.stat_result | None:
+    """Resolves and stats an image file inside the store root.
+
+    Args:
+        path (Path): The requested image path.
+        root (Path): The root directory of the store.
+
+    Returns:
+        os.stat_result | None: The file status, or None if the path escapes
+            the root, is hidden, or is not a regular file.
+    """
+    resolved = path.resolve()
+    if not resolved.is_relative_to(root.resolve()) or resolved.name.startswith("."):
+        return None
+    try:
+        stat_result = os.stat(resolved)
+    except OSError:
+        return None
+    return stat_result if stat.S_ISREG(stat_result.st_mode) else None
+
+
+@router.get("/images/{key:path}")
+async def get_image(
+    key: str, request: Request, store: ImageStore = Depends(get_image_store)
+):
+    """Serves a stored image with long-lived caching headers.
+
+    Stored images never change once written, so responses may be cached for
+    a year without revalidation. Conditional requests are answered with
+    `304 Not Modified`, and byte ranges are handled by `FileResponse`, which
+    hands the file to the server for zero-copy sending when supported.
+
+    Args:
+        key (str): The storage key of the image or one of its variants.
+        request (Request): The incoming request.
+        store (ImageStore): The store holding the images.
+
+    Returns:
+        Response: The image file or an empty `304` response.
+
+    Raises:
+        HTTPException: If the key does not resolve to a stored image.
+    """
+    path = store.path(key)
+    stat_result = await run_in_threadpool(_stat_image, path, store.path(""))
+    if stat_result is None:
+        raise HTTPException(status_code=404, detail="Image not found")
+
+    headers = {
+        "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+        "ETag": image_etag(path, stat_result),
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    return FileResponse(path, headers=headers, stat_result=stat_result)
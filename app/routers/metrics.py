@@ -0,0 +1,75 @@
+"""API endpoints exposing in-process service metrics.
+
+The endpoints are meant for monitoring systems, not users: they require the
+bearer token configured as `metrics_token` and are disabled without one.
+"""
+
+import secrets
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+
+from app.core.config import settings
+from app.database.session import pool_stats
+from app.routers.auth import get_login_throttle, get_password_hasher
+from app.services.login_throttle import LoginThrottle
+from app.services.password_service import PasswordHasher
+
+
+def require_metrics_token(
+    authorization: Annotated[str | None, Header()] = None,
+) -> None:
+    """Dependency that admits only requests carrying the metrics token.
+
+    Args:
+        authorization (str | None): The `Authorization` request header.
+
+    Raises:
+        HTTPException: 404 if no token is configured, 401 if the request
+            does not carry it.
+    """
+    if not settings.metrics_token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not secrets.compare_digest(
+        token.encode(), settings.metrics_token.encode()
+    ):
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+router = APIRouter(dependencies=[Depends(require_metrics_token)])
+
+
+@router.get("/metrics/auth")
+def auth_metrics(
+    hasher: PasswordHasher = Depends(get_password_hasher),
+    throttle: LoginThrottle = Depends(get_login_throttle),
+):
+    """Reports the load of the password pool and the login throttle.
+
+    Args:
+        hasher (PasswordHasher): The password hashing pool.
+        throttle (LoginThrottle): The failed login throttle.
+
+    Returns:
+        dict: The password pool and login throttle statistics.
+    """
+    return {"password_hasher": hasher.stats(), "login_throttle": throttle.stats()}
+
+
+@router.get("/metrics/db-pool")
+def db_pool_metrics():
+    """Reports the occupancy and checkout latency of the connection pools.
+
+    A growing `wait_seconds` or any `timeouts` mean the pool is too small
+    for the load; `checkout_seconds` beyond the wait is spent opening and
+    checking connections.
+
+    Returns:
+        dict: The statistics of every connection pool of this worker.
+    """
+    return pool_stats()
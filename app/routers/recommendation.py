@@ -4,8 +4,10 @@ from typing import Annotated, List, Sequence
 
 import httpx
 from fastapi import APIRouter, Depends, HTTPException, Request
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.etags import weak_etag
+from app.core.responses import FastJSONResponse
 from app.core.utils import (
     CANDIDATE_LABELS,
     INCOMPATIBLE_KEYWORDS,
@@ -13,10 +15,18 @@ from app.core.utils import (
     get_temperature_label,
     get_wind_label,
 )
-from app.crud.tag_repo import get_items_by_tags
+from app.crud.tag_repo import get_items_by_tags_async
+from app.crud.user_repo import get_closet_version_async
 from app.database.models import Item, User
-from app.database.session import get_db
-from app.routers.auth import get_current_user
+from app.routers.auth import get_current_user, get_user_read_db
+from app.routers.closet import (
+    PRIVATE_REVALIDATE,
+    get_image_store,
+    images_ready,
+    not_modified,
+)
+from app.services.image_service import image_variants
+from app.services.image_storage import ImageStore
 from app.services.weather_service import WeatherService
 
 router = APIRouter()
@@ -59,25 +69,53 @@ def filter_incompatible_items(
     return filtered_items
 
 
+def item_to_summary(item: Item, store: ImageStore) -> dict:
+    """Helper to convert a recommended Item model to a response dictionary.
+
+    Args:
+        item (Item): The Item model instance.
+        store (ImageStore): The store holding the item's image.
+
+    Returns:
+        dict: The serialized item data including image variant URLs.
+    """
+    return {
+        "id": item.id,
+        "owner_id": item.owner_id,
+        "description": item.description,
+        "image_filename": item.image_filename,
+        **image_variants(item.image_filename, store),
+    }
+
+
 @router.get("/recommend/{city}")
 async def recommend(
     city: str,
     request: Request,
     current_user: Annotated[User, Depends(get_current_user)],
     weather_service: WeatherService = Depends(get_weather_service),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_user_read_db),
+    store: ImageStore = Depends(get_image_store),
 ):
     """Generates recommendations based on the current weather in a city.
 
+    The response carries a weak ETag derived from the weather, the detected
+    tags and the user's closet version. A request whose `If-None-Match`
+    still matches is answered with `304 Not Modified` without querying the
+    user's items. The body is encoded directly with orjson, without passing
+    through `jsonable_encoder`.
+
     Args:
         city (str): The target city.
         request (Request): The request object containing application state.
         current_user (User): The authenticated user.
         weather_service (WeatherService): Service to fetch weather data.
-        db (Session): The database session.
+        db (AsyncSession): The database session.
+        store (ImageStore): The store holding item images.
 
     Returns:
-        dict: A dictionary containing weather data, detected tags, and recommended items.
+        FastJSONResponse | Response: The weather data, detected tags and
+            recommended items, or an empty `304` response.
 
     Raises:
         HTTPException: If the city is not found or the AI service is unavailable.
@@ -111,7 +149,29 @@ async def recommend(
             sorted(results.items(), key=lambda x: x[1], reverse=True)[:2]
         )
 
-    items = get_items_by_tags(db, current_user.id, list(filtered_tags))
-    final_items = filter_incompatible_items(items, list(filtered_tags.keys()))
+    version = await get_closet_version_async(db, current_user.id)
+    etag = weak_etag(
+        current_user.id, version, weather, sorted(filtered_tags.items())
+    )
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
 
-    return {"weather": weather, "tags": filtered_tags, "items": final_items}
\ No newline at end of file
+    items = await get_items_by_tags_async(
+        db, current_user.id, list(filtered_tags)
+    )
+    final_items = filter_incompatible_items(items, list(filtered_tags.keys()))
+    summaries = [item_to_summary(item, store) for item in final_items]
+
+    headers = {"Cache-Control": PRIVATE_REVALIDATE}
+    if images_ready(summaries):
+        headers["ETag"] = etag
+
+    return FastJSONResponse(
+        {
+            "weather": weather.model_dump(),
+            "tags": filtered_tags,
+            "items": summaries,
+        },
+        headers=headers,
+    )
\ No newline at end of file
@@ -1,8 +1,11 @@
 """Pydantic schemas for Item data validation."""
 
-from typing import List, Optional
+from typing import Annotated, Dict, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+TagName = Annotated[str, Field(min_length=1, max_length=50)]
+Confidence = Annotated[int, Field(ge=0, le=100)]
 
 
 class ItemBase(BaseModel):
@@ -25,21 +28,151 @@ class ItemCreate(ItemBase):
     image_filename: Optional[str] = None
 
 
+class ImageVariant(BaseModel):
+    """Schema for a resized variant of an item image.
+
+    Attributes:
+        width (int): The width of the variant in pixels.
+        url (str): The URL the variant is served from.
+    """
+
+    width: int
+    url: str
+
+
 class ItemResponse(ItemBase):
     """Schema for item response data.
 
     Attributes:
         id (int): The unique ID of the item.
         owner_id (int): The ID of the item's owner.
+        description (Optional[str]): Text description, omitted in sparse listings.
         image_filename (Optional[str]): The filename of the item's image.
         tags (List[str]): A list of associated weather tags.
+        variants (List[ImageVariant]): Resized variants of the image, if generated.
+        placeholder_url (Optional[str]): URL of a tiny placeholder image.
     """
 
     id: int
     owner_id: int
+    description: Optional[str] = None
     image_filename: Optional[str] = None
     tags: List[str] = []
+    variants: List[ImageVariant] = []
+    placeholder_url: Optional[str] = None
 
     class Config:
         """Pydantic configuration."""
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class ClosetPage(BaseModel):
+    """Schema for one page of a closet listing.
+
+    Attributes:
+        items (List[ItemResponse]): The items on this page.
+        next_cursor (Optional[int]): Cursor for the next page, None on the last page.
+    """
+
+    items: List[ItemResponse]
+    next_cursor: Optional[int] = None
+
+
+class SearchPage(BaseModel):
+    """Schema for one page of closet search results.
+
+    Attributes:
+        items (List[ItemResponse]): The matching items on this page, best first.
+        next_offset (Optional[int]): Offset of the next page, None on the last page.
+    """
+
+    items: List[ItemResponse]
+    next_offset: Optional[int] = None
+
+
+class BatchUploadResult(BaseModel):
+    """Schema for the outcome of one file in a batch upload.
+
+    Attributes:
+        index (int): Position of the file in the request.
+        item (Optional[ItemResponse]): The created item, if the upload succeeded.
+        error (Optional[str]): The reason the file was rejected, if it failed.
+    """
+
+    index: int
+    item: Optional[ItemResponse] = None
+    error: Optional[str] = None
+
+
+class BatchUploadResponse(BaseModel):
+    """Schema for the response of a batch upload.
+
+    Attributes:
+        results (List[BatchUploadResult]): One result per uploaded file, in order.
+    """
+
+    results: List[BatchUploadResult]
+
+
+class BulkDeleteRequest(BaseModel):
+    """Schema for deleting several items at once.
+
+    Attributes:
+        ids (List[int]): The IDs of the items to delete.
+    """
+
+    ids: List[int] = Field(min_length=1, max_length=1000)
+
+
+class BulkDeleteResponse(BaseModel):
+    """Schema for the response of a bulk delete.
+
+    Attributes:
+        deleted (List[int]): The IDs of the items that were deleted.
+    """
+
+    deleted: List[int]
+
+
+class ItemImport(BaseModel):
+    """Schema for one line of a closet import.
+
+    Lines of a closet export are accepted as they are; the `id` of the
+    exported item is ignored.
+
+    Attributes:
+        description (str): Text description of the item.
+        image_filename (Optional[str]): The storage key of an already stored image.
+        tags (Optional[Dict[str, int]]): Weather tags and confidence scores; items
+            without them are classified on import.
+    """
+
+    description: str = Field(min_length=1, max_length=2000)
+    image_filename: Optional[str] = Field(default=None, max_length=255)
+    tags: Optional[Dict[TagName, Confidence]] = Field(default=None, max_length=20)
+
+
+class ImportLineError(BaseModel):
+    """Schema for a rejected line of a closet import.
+
+    Attributes:
+        line (int): The 1-based line number.
+        error (str): The reason the line was rejected.
+    """
+
+    line: int
+    error: str
+
+
+class ImportResponse(BaseModel):
+    """Schema for the response of a closet import.
+
+    Attributes:
+        imported (int): The number of items created.
+        rejected (int): The number of lines that were not valid items.
+        errors (List[ImportLineError]): The first rejected lines.
+    """
+
+    imported: int
+    rejected: int
+    errors: List[ImportLineError]
@@ -2,6 +2,8 @@
 
 from transformers import pipeline
 
+from app.core.utils import CLASSIFIER_MODEL
+
 
 class AIService:
     """Handles interaction with the Hugging Face transformers pipeline."""
@@ -10,7 +12,7 @@ class AIService:
         """Initializes the Zero-Shot Classification pipeline."""
         self.classifier = pipeline(
             task="zero-shot-classification",
-            model="facebook/bart-large-mnli",
+            model=CLASSIFIER_MODEL,
             device=-1,
         )
 
@@ -40,4 +42,43 @@ class AIService:
         return {
             label: int(score * 100)
             for label, score in zip(result["labels"], result["scores"])
-        }
\ No newline at end of file
+        }
+
+    def classify_batch(
+        self,
+        texts: list[str],
+        candidate_labels: list[str],
+        hypothesis_template: str = "This example is {}.",
+        batch_size: int = 8,
+    ) -> list[dict[str, int]]:
+        """Classifies several texts against the candidate labels in one call.
+
+        Args:
+            texts (list[str]): The texts to classify.
+            candidate_labels (list[str]): The list of possible labels.
+            hypothesis_template (str): The template for the hypothesis.
+            batch_size (int): The number of premise/hypothesis pairs per forward pass.
+
+        Returns:
+            list[dict[str, int]]: One label-to-percentage mapping per text, in input order.
+        """
+        if not texts:
+            return []
+
+        results: list[dict] = self.classifier(
+            texts,
+            candidate_labels,
+            multi_label=True,
+            hypothesis_template=hypothesis_template,
+            batch_size=batch_size,
+        ) # type: ignore
+        if isinstance(results, dict):
+            results = [results]
+
+        return [
+            {
+                label: int(score * 100)
+                for label, score in zip(result["labels"], result["scores"])
+            }
+            for result in results
+        ]
\ No newline at end of file
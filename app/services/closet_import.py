@@ -0,0 +1,203 @@
+"""Incremental parsing and preparation of closet imports."""
+
+import re
+
+from pydantic import ValidationError
+
+from app.core.utils import (
+    CANDIDATE_LABELS,
+    ITEM_HYPOTHESIS_TEMPLATE,
+    select_item_tags,
+)
+from app.schemas.item import ItemCreate, ItemImport
+from app.services.image_storage import ImageStore
+
+IMPORT_BATCH_SIZE = 200
+MAX_LINE_BYTES = 64 * 1024
+MAX_REPORTED_ERRORS = 100
+KNOWN_LABELS = frozenset(CANDIDATE_LABELS)
+CONTENT_KEY = re.compile(r"^[0-9a-f]{2}/[0-9a-f]{2}/[0-9a-f]{64}\.[a-z0-9]+$")
+
+
+def _describe(error: ValidationError) -> str:
+    """Summarizes the first problem of a rejected line.
+
+    Args:
+        error (ValidationError): The validation failure.
+
+    Returns:
+        str: A short client-facing message.
+    """
+    first = error.errors()[0]
+    location = ".".join(str(part) for part in first["loc"])
+    return f"{location}: {first['msg']}" if location else first["msg"]
+
+
+class ClosetImport:
+    """Parses newline-delimited JSON items chunk by chunk into batches.
+
+    Only the current line and the batch being filled are held in memory,
+    whatever the size of the input. Lines that are not valid items are
+    counted and the first `MAX_REPORTED_ERRORS` of them are reported.
+
+    Attributes:
+        batch_size (int): The number of items per batch.
+        max_line_bytes (int): The longest accepted line.
+        lines (int): The number of lines read so far.
+        rejected (int): The number of lines rejected so far.
+        errors (list[dict]): The line number and reason of the first
+            rejected lines.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = IMPORT_BATCH_SIZE,
+        max_line_bytes: int = MAX_LINE_BYTES,
+    ):
+        """Initializes an empty import.
+
+        Args:
+            batch_size (int): The number of items per batch.
+            max_line_bytes (int): The longest accepted line.
+        """
+        self.batch_size = batch_size
+        self.max_line_bytes = max_line_bytes
+        self.lines = 0
+        self.rejected = 0
+        self.errors: list[dict] = []
+        self._buffer = bytearray()
+        self._overlong = False
+        self._batch: list[ItemImport] = []
+
+    def feed(self, chunk: bytes) -> list[list[ItemImport]]:
+        """Consumes the next chunk of input.
+
+        Args:
+            chunk (bytes): The bytes following the previous chunk.
+
+        Returns:
+            list[list[ItemImport]]: The batches completed by this chunk.
+        """
+        batches = []
+        pieces = chunk.split(b"\n")
+        for index, piece in enumerate(pieces):
+            if not self._overlong:
+                self._buffer += piece
+                if len(self._buffer) > self.max_line_bytes:
+                    self._overlong = True
+                    self._buffer.clear()
+            if index < len(pieces) - 1:
+                self._end_line(batches)
+        return batches
+
+    def finish(self) -> list[list[ItemImport]]:
+        """Consumes the end of the input.
+
+        Returns:
+            list[list[ItemImport]]: The last, possibly partial, batch.
+        """
+        batches = []
+        if self._buffer or self._overlong:
+            self._end_line(batches)
+        if self._batch:
+            batches.append(self._batch)
+            self._batch = []
+        return batches
+
+    def _end_line(self, batches: list[list[ItemImport]]) -> None:
+        """Parses the buffered line and adds it to the current batch.
+
+        Args:
+            batches (list[list[ItemImport]]): Receives the batch if it fills up.
+        """
+        self.lines += 1
+        line, overlong = bytes(self._buffer), self._overlong
+        self._buffer.clear()
+        self._overlong = False
+
+        if overlong:
+            self._reject(f"Line is longer than {self.max_line_bytes} bytes.")
+            return
+        if not line.strip():
+            return
+        try:
+            record = ItemImport.model_validate_json(line)
+        except ValidationError as e:
+            self._reject(_describe(e))
+            return
+
+        self._batch.append(record)
+        if len(self._batch) >= self.batch_size:
+            batches.append(self._batch)
+            self._batch = []
+
+    def _reject(self, reason: str) -> None:
+        """Records a rejected line.
+
+        Args:
+            reason (str): Why the current line was rejected.
+        """
+        self.rejected += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": self.lines, "error": reason})
+
+
+def prepare_entries(
+    records: list[ItemImport], store: ImageStore, ai_service=None
+) -> tuple[list[tuple[ItemCreate, dict[str, int]]], list[dict[str, int] | None]]:
+    """Turns a batch of imported items into item entries.
+
+    Items imported without tags are classified together in one batched
+    inference call. Imported tags outside the candidate labels are dropped,
+    as are image keys that do not name an image in the store. Kept image
+    keys are touched, so the image reaper leaves them alone until the items
+    referencing them are committed.
+
+    Args:
+        records (list[ItemImport]): The parsed items.
+        store (ImageStore): The store holding item images.
+        ai_service (AIService | None): The classifier, if available.
+
+    Returns:
+        tuple[list[tuple[ItemCreate, dict[str, int]]], list[dict[str, int] | None]]:
+            Each item with its tag names and confidence scores, and the
+            classifier scores of all labels of each item, None for items
+            that were not classified, both in input order.
+    """
+    untagged = [record.description for record in records if record.tags is None]
+    results = iter([])
+    if ai_service and untagged:
+        results = iter(
+            ai_service.classify_batch(
+                untagged,
+                CANDIDATE_LABELS,
+                hypothesis_template=ITEM_HYPOTHESIS_TEMPLATE,
+            )
+        )
+
+    entries, scores = [], []
+    for record in records:
+        item_scores = None
+        if record.tags is not None:
+            tags = {
+                name: score
+                for name, score in record.tags.items()
+                if name in KNOWN_LABELS
+            }
+        elif ai_service:
+            item_scores = next(results)
+            tags = select_item_tags(record.description, item_scores)
+        else:
+            tags = {}
+
+        key = record.image_filename
+        if key and not (CONTENT_KEY.match(key) and store.exists(key)):
+            key = None
+        elif key:
+            store.touch(key)
+
+        entries.append(
+            (ItemCreate(description=record.description, image_filename=key), tags)
+        )
+        scores.append(item_scores)
+    return entries, scores
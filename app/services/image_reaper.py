@@ -0,0 +1,279 @@
+"""Background removal of images that are no longer referenced by any item."""
+
+import asyncio
+import logging
+import time
+from typing import Callable, Iterable
+
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.crud.item_repo import unreferenced_images
+from app.services.image_storage import ImageStore
+
+logger = logging.getLogger(__name__)
+
+REAP_BATCH_SIZE = 100
+MAX_ATTEMPTS = 5
+RETRY_DELAY_SECONDS = 2.0
+ORPHAN_MIN_AGE_SECONDS = 60 * 60
+# Queued images written or reused more recently than this are not deleted
+# yet, since an item referencing them may still be uncommitted.
+REUSE_GRACE_SECONDS = 10 * 60
+
+
+def delete_images(store: ImageStore, keys: Iterable[str]) -> list[str]:
+    """Removes several blobs and their variants from the store.
+
+    Args:
+        store (ImageStore): The store holding the images.
+        keys (Iterable[str]): The keys of the blobs to remove.
+
+    Returns:
+        list[str]: The keys that could not be removed.
+    """
+    failed = []
+    for key in keys:
+        try:
+            store.delete(key)
+        except OSError:
+            logger.warning("Could not delete image %s", key, exc_info=True)
+            failed.append(key)
+    return failed
+
+
+def modified_since(store: ImageStore, key: str, cutoff: float) -> bool:
+    """Tells whether a blob was written or touched after a point in time.
+
+    Args:
+        store (ImageStore): The store holding the blob.
+        key (str): The key of the blob.
+        cutoff (float): The point in time, as a Unix timestamp.
+
+    Returns:
+        bool: True if the blob exists and was modified after `cutoff`.
+    """
+    try:
+        return store.path(key).stat().st_mtime > cutoff
+    except OSError:
+        return False
+
+
+def find_orphaned_images(
+    db: Session, store: ImageStore, min_age: float = ORPHAN_MIN_AGE_SECONDS
+) -> tuple[list[str], list[str]]:
+    """Scans the store for blobs that no item references and empty blobs.
+
+    Blobs younger than `min_age` are skipped, because an upload writes its
+    blob before the item referencing it is committed.
+
+    Args:
+        db (Session): The database session.
+        store (ImageStore): The store to scan.
+        min_age (float): The minimum age in seconds of a blob to consider.
+
+    Returns:
+        tuple[list[str], list[str]]: The keys of unreferenced blobs, which
+            includes unreferenced empty ones, and the keys of empty blobs that
+            items still reference.
+    """
+    cutoff = time.time() - min_age
+    candidates = {}
+    for key in store.keys():
+        try:
+            stat_result = store.path(key).stat()
+        except OSError:
+            continue
+        if stat_result.st_mtime <= cutoff:
+            candidates[key] = stat_result.st_size
+
+    orphaned = set()
+    keys = sorted(candidates)
+    for start in range(0, len(keys), REAP_BATCH_SIZE):
+        orphaned |= unreferenced_images(db, keys[start : start + REAP_BATCH_SIZE])
+
+    empty_referenced = [
+        key for key in keys if candidates[key] == 0 and key not in orphaned
+    ]
+    return sorted(orphaned), empty_referenced
+
+
+class ImageReaper:
+    """Deletes unreferenced images off the request path.
+
+    Keys are queued by request handlers and removed in batches in the thread
+    pool. Before deleting, the reaper checks again that no item references a
+    key, since an identical image may have been uploaded in the meantime.
+    Keys whose blob was written or reused within `reuse_grace` seconds are
+    put back until the grace period has passed, because the item of such an
+    upload may not be committed yet. Failed deletions are retried with a
+    growing delay.
+
+    Attributes:
+        store (ImageStore): The store holding the images.
+        session_factory (Callable[[], Session]): Creates database sessions
+            for the reference checks.
+        reconcile_interval (float): Seconds between orphan scans, or 0 to
+            disable them.
+        reuse_grace (float): Seconds a written or reused blob is kept.
+    """
+
+    def __init__(
+        self,
+        store: ImageStore,
+        session_factory: Callable[[], Session],
+        reconcile_interval: float = 0,
+        reuse_grace: float = REUSE_GRACE_SECONDS,
+    ):
+        """Initializes the reaper without starting it.
+
+        Args:
+            store (ImageStore): The store holding the images.
+            session_factory (Callable[[], Session]): Creates database sessions.
+            reconcile_interval (float): Seconds between orphan scans, or 0 to
+                disable them.
+            reuse_grace (float): Seconds a written or reused blob is kept.
+        """
+        self.store = store
+        self.session_factory = session_factory
+        self.reconcile_interval = reconcile_interval
+        self.reuse_grace = reuse_grace
+        self._queue: asyncio.Queue[tuple[str, int]] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._tasks: list[asyncio.Task] = []
+
+    async def start(self) -> None:
+        """Starts the reaping loop and, if enabled, the orphan scans."""
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._tasks.append(asyncio.create_task(self._reap_forever()))
+        if self.reconcile_interval > 0:
+            self._tasks.append(asyncio.create_task(self._reconcile_forever()))
+
+    async def stop(self) -> None:
+        """Deletes the images still queued and stops the background tasks.
+
+        Pending retries are dropped; the next orphan scan picks them up.
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+        if self._queue is None:
+            return
+        keys = []
+        while batch := self._drain():
+            keys.extend(key for key, _ in batch)
+        if keys:
+            try:
+                # Keys still in their grace period are left to the orphan scan.
+                await run_in_threadpool(self._reap, keys)
+            except Exception:
+                logger.exception("Image reaping failed during shutdown")
+
+    def enqueue(self, keys: Iterable[str]) -> None:
+        """Queues image keys for deletion.
+
+        Safe to call from both the event loop and worker threads.
+
+        Args:
+            keys (Iterable[str]): The keys of the images to delete.
+        """
+        for key in keys:
+            self._put(key, 0)
+
+    def _put(self, key: str, attempt: int) -> None:
+        """Adds a key to the queue from any thread.
+
+        Args:
+            key (str): The key of the image to delete.
+            attempt (int): The number of failed deletions so far.
+        """
+        if self._loop is None or self._queue is None:
+            raise RuntimeError("ImageReaper has not been started")
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, (key, attempt))
+
+    def _drain(self) -> list[tuple[str, int]]:
+        """Takes up to one batch of queued keys without waiting.
+
+        Returns:
+            list[tuple[str, int]]: The queued keys with their attempt counts.
+        """
+        batch = []
+        while len(batch) < REAP_BATCH_SIZE and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    def _reap(self, keys: list[str]) -> tuple[list[str], list[str]]:
+        """Deletes the keys that are still unreferenced and not recently used.
+
+        The modification times are checked after the references, so a blob
+        reused by an upload that has not committed its item yet is kept.
+
+        Args:
+            keys (list[str]): The candidate keys.
+
+        Returns:
+            tuple[list[str], list[str]]: The keys whose deletion failed and
+                the keys kept because their blob was used recently.
+        """
+        with self.session_factory() as db:
+            unreferenced = unreferenced_images(db, keys)
+        cutoff = time.time() - self.reuse_grace
+        recent = sorted(
+            key for key in unreferenced if modified_since(self.store, key, cutoff)
+        )
+        failed = delete_images(self.store, sorted(unreferenced - set(recent)))
+        return failed, recent
+
+    async def _reap_forever(self) -> None:
+        """Deletes queued images in batches until cancelled."""
+        while True:
+            batch = [await self._queue.get()]
+            batch.extend(self._drain())
+            attempts = {}
+            for key, attempt in batch:
+                attempts[key] = max(attempt, attempts.get(key, 0))
+
+            recent = []
+            try:
+                failed, recent = await run_in_threadpool(self._reap, list(attempts))
+            except Exception:
+                logger.exception("Image reaping failed")
+                failed = list(attempts)
+
+            for key in recent:
+                self._loop.call_later(self.reuse_grace, self._put, key, attempts[key])
+
+            for key in failed:
+                attempt = attempts[key] + 1
+                if attempt >= MAX_ATTEMPTS:
+                    logger.error("Giving up deleting image %s", key)
+                    continue
+                self._loop.call_later(
+                    RETRY_DELAY_SECONDS * 2 ** (attempt - 1), self._put, key, attempt
+                )
+
+    def reconcile(self) -> list[str]:
+        """Scans the store once and queues every orphaned blob.
+
+        Returns:
+            list[str]: The keys queued for deletion.
+        """
+        with self.session_factory() as db:
+            orphaned, empty_referenced = find_orphaned_images(db, self.store)
+
+        for key in empty_referenced:
+            logger.warning("Image %s is empty but still referenced", key)
+        self.enqueue(orphaned)
+        return orphaned
+
+    async def _reconcile_forever(self) -> None:
+        """Runs the orphan scan periodically until cancelled."""
+        while True:
+            try:
+                await run_in_threadpool(self.reconcile)
+            except Exception:
+                logger.exception("Image reconciliation failed")
+            await asyncio.sleep(self.reconcile_interval)
@@ -0,0 +1,190 @@
+"""Service for generating resized variants of closet images."""
+
+import logging
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image, ImageOps
+
+from app.services.image_storage import ImageStore
+
+VARIANT_WIDTHS = (320, 640, 1024)
+PLACEHOLDER_WIDTH = 16
+
+logger = logging.getLogger(__name__)
+
+
+def variant_filename(filename: str, width: int) -> str:
+    """Builds the filename of a resized WebP variant.
+
+    Args:
+        filename (str): The filename of the original image.
+        width (int): The target width in pixels.
+
+    Returns:
+        str: The variant filename.
+    """
+    stem = filename.rsplit(".", 1)[0]
+    return f"{stem}.w{width}.webp"
+
+
+def placeholder_filename(filename: str) -> str:
+    """Builds the filename of the tiny blurred placeholder.
+
+    Args:
+        filename (str): The filename of the original image.
+
+    Returns:
+        str: The placeholder filename.
+    """
+    stem = filename.rsplit(".", 1)[0]
+    return f"{stem}.placeholder.jpg"
+
+
+def _save_atomic(image: Image.Image, destination: Path, **options) -> None:
+    """Saves an image through a temporary file and renames it into place.
+
+    Args:
+        image (Image.Image): The image to save.
+        destination (Path): The final location of the file.
+        **options: Encoder options passed to `Image.save`.
+    """
+    temp_path = destination.with_name(f".{destination.name}.part")
+    try:
+        image.save(temp_path, **options)
+        os.replace(temp_path, destination)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def _resize_to_width(image: Image.Image, width: int) -> Image.Image:
+    """Scales an image down to a width, preserving the aspect ratio.
+
+    Args:
+        image (Image.Image): The source image.
+        width (int): The target width in pixels.
+
+    Returns:
+        Image.Image: The resized image, or a copy if it is already narrower.
+    """
+    if image.width <= width:
+        return image.copy()
+    height = max(1, round(image.height * width / image.width))
+    return image.resize((width, height), Image.Resampling.LANCZOS)
+
+
+def generate_variants(source: Path) -> list[str]:
+    """Generates the placeholder and all resized variants of an image.
+
+    Variants are re-encoded from pixel data only, so EXIF and other metadata
+    of the original are not carried over. The widest variant is written last
+    and doubles as the completion marker checked by `image_variants`.
+
+    Args:
+        source (Path): The path of the original image.
+
+    Returns:
+        list[str]: The filenames of the generated files.
+    """
+    generated = []
+    with Image.open(source) as original:
+        image = ImageOps.exif_transpose(original).convert("RGB")
+
+    placeholder = placeholder_filename(source.name)
+    _save_atomic(
+        _resize_to_width(image, PLACEHOLDER_WIDTH),
+        source.with_name(placeholder),
+        format="JPEG",
+        quality=40,
+    )
+    generated.append(placeholder)
+
+    for width in VARIANT_WIDTHS:
+        name = variant_filename(source.name, width)
+        _save_atomic(
+            _resize_to_width(image, width),
+            source.with_name(name),
+            format="WEBP",
+            quality=80,
+            method=4,
+        )
+        generated.append(name)
+
+    return generated
+
+
+def image_variants(filename: str | None, store: ImageStore) -> dict:
+    """Describes the URLs of the variants available for an image.
+
+    Args:
+        filename (str | None): The storage key of the original image.
+        store (ImageStore): The store holding the image.
+
+    Returns:
+        dict: The `variants` list of width/URL pairs and the `placeholder_url`,
+            both empty if the variants have not been generated yet.
+    """
+    if not filename or not store.exists(
+        variant_filename(filename, VARIANT_WIDTHS[-1])
+    ):
+        return {"variants": [], "placeholder_url": None}
+
+    return {
+        "variants": [
+            {"width": width, "url": store.url(variant_filename(filename, width))}
+            for width in VARIANT_WIDTHS
+        ],
+        "placeholder_url": store.url(placeholder_filename(filename)),
+    }
+
+
+def _log_failure(future: Future, source: Path) -> None:
+    """Logs the error of a finished variant job, if it failed.
+
+    Args:
+        future (Future): The finished job.
+        source (Path): The path of the original image.
+    """
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is not None:
+        logger.error("Generating variants of %s failed", source, exc_info=error)
+
+
+class ImageService:
+    """Runs image variant generation in a separate process pool.
+
+    Attributes:
+        executor (ProcessPoolExecutor): The pool running the resize jobs.
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        """Initializes the process pool.
+
+        Args:
+            max_workers (int | None): The number of worker processes.
+        """
+        self.executor = ProcessPoolExecutor(max_workers=max_workers)
+
+    def schedule_variants(self, source: Path) -> Future:
+        """Queues variant generation for an image without waiting for it.
+
+        Failures are logged when the job finishes, since callers do not wait
+        for the result.
+
+        Args:
+            source (Path): The path of the original image.
+
+        Returns:
+            Future: The future of the background job.
+        """
+        future = self.executor.submit(generate_variants, source)
+        future.add_done_callback(lambda done: _log_failure(done, source))
+        return future
+
+    def shutdown(self) -> None:
+        """Stops the worker processes, dropping jobs that have not started."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,336 @@
+"""Content-addressed storage for uploaded images."""
+
+import hashlib
+import os
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
+
+CHUNK_SIZE = 64 * 1024
+
+
+class InvalidImageError(ValueError):
+    """Raised when uploaded content is not a supported image format."""
+
+
+class ImageTooLargeError(ValueError):
+    """Raised when uploaded content exceeds the configured size limit."""
+
+
+def sniff_image_type(head: bytes) -> str | None:
+    """Detects the image format from the leading bytes of a file.
+
+    Args:
+        head (bytes): The first bytes of the uploaded content.
+
+    Returns:
+        str | None: The file extension for the detected format, or None if
+            the content is not a supported image.
+    """
+    if head.startswith(b"\xff\xd8\xff"):
+        return "jpg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+    return None
+
+
+def content_key(digest: str, extension: str) -> str:
+    """Builds the sharded storage key for a blob.
+
+    The first two byte pairs of the digest become nested directories, which
+    keeps every directory small regardless of the number of stored blobs.
+
+    Args:
+        digest (str): The hex SHA-256 digest of the content.
+        extension (str): The file extension of the content.
+
+    Returns:
+        str: The relative key, e.g. `ab/cd/abcd....jpg`.
+    """
+    return f"{digest[:2]}/{digest[2:4]}/{digest}.{extension}"
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Flushes a directory entry to disk so a rename survives a crash.
+
+    Args:
+        directory (Path): The directory containing the renamed file.
+    """
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class ImageStore(ABC):
+    """Interface for image blob storage backends.
+
+    Blobs are addressed by opaque string keys, which are what items store in
+    `image_filename`. Derived files such as resized variants live next to
+    their blob and share its key stem.
+    """
+
+    @abstractmethod
+    async def save(self, file: UploadFile, max_bytes: int) -> str:
+        """Validates and stores an uploaded image.
+
+        Args:
+            file (UploadFile): The uploaded file.
+            max_bytes (int): The maximum accepted image size in bytes.
+
+        Returns:
+            str: The key of the stored blob.
+
+        Raises:
+            InvalidImageError: If the content is not a supported image.
+            ImageTooLargeError: If the content exceeds `max_bytes`.
+            OSError: If the blob cannot be written.
+        """
+
+    @abstractmethod
+    def path(self, key: str) -> Path:
+        """Resolves a key to the local file backing it.
+
+        Args:
+            key (str): The blob key.
+
+        Returns:
+            Path: The filesystem path of the blob.
+        """
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        """Checks whether a blob is stored.
+
+        Args:
+            key (str): The blob key.
+
+        Returns:
+            bool: True if the blob exists.
+        """
+
+    @abstractmethod
+    def touch(self, key: str) -> None:
+        """Marks a blob as just used, so reapers treat it like a new upload.
+
+        Args:
+            key (str): The blob key.
+        """
+
+    @abstractmethod
+    def url(self, key: str) -> str:
+        """Builds the public URL of a blob.
+
+        Args:
+            key (str): The blob key.
+
+        Returns:
+            str: The URL the blob is served from.
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Removes a blob and the files derived from it.
+
+        Args:
+            key (str): The blob key.
+        """
+
+    @abstractmethod
+    def keys(self) -> Iterator[str]:
+        """Lists the keys of all stored blobs, excluding derived files.
+
+        Yields:
+            str: The key of each stored blob.
+        """
+
+
+class LocalImageStore(ImageStore):
+    """Stores images on the local filesystem under their SHA-256 digest.
+
+    Identical uploads resolve to the same key and are stored once; callers
+    are responsible for only deleting a key once no item references it.
+
+    Attributes:
+        root (Path): The directory holding the sharded blobs.
+        url_prefix (str): The URL path the root directory is served under.
+    """
+
+    def __init__(self, root: Path, url_prefix: str = "/images"):
+        """Initializes the store and creates its root directory.
+
+        Args:
+            root (Path): The directory holding the sharded blobs.
+            url_prefix (str): The URL path the root directory is served under.
+        """
+        self.root = root
+        self.url_prefix = url_prefix
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _write_stream(
+        self, source: BinaryIO, head: bytes, extension: str, max_bytes: int
+    ) -> str:
+        """Copies a stream into the store, hashing it on the way.
+
+        The content is written to a hidden temporary file, flushed with fsync
+        and then renamed to its content address, so readers never observe a
+        partially written blob. If the blob already exists the copy is
+        discarded instead and the blob's modification time is refreshed.
+
+        Args:
+            source (BinaryIO): The stream positioned just after `head`.
+            head (bytes): The already consumed first chunk of the stream.
+            extension (str): The file extension of the content.
+            max_bytes (int): The maximum number of bytes allowed.
+
+        Returns:
+            str: The key of the stored blob.
+
+        Raises:
+            ImageTooLargeError: If the stream exceeds `max_bytes`.
+            OSError: If the file cannot be written.
+        """
+        temp_path = self.root / f".upload-{uuid.uuid4()}.part"
+        digest = hashlib.sha256()
+        written = 0
+
+        try:
+            with temp_path.open("wb") as buffer:
+                chunk = head
+                while chunk:
+                    written += len(chunk)
+                    if written > max_bytes:
+                        raise ImageTooLargeError("Image is too large.")
+                    digest.update(chunk)
+                    buffer.write(chunk)
+                    chunk = source.read(CHUNK_SIZE)
+
+                buffer.flush()
+                os.fsync(buffer.fileno())
+
+            key = content_key(digest.hexdigest(), extension)
+            destination = self.path(key)
+            if destination.exists():
+                temp_path.unlink()
+                # An item referencing the blob is about to be written; keep
+                # reapers from deleting it before that item commits.
+                os.utime(destination)
+                return key
+
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(temp_path, destination)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+        _fsync_directory(destination.parent)
+        return key
+
+    async def save(self, file: UploadFile, max_bytes: int) -> str:
+        """Validates and streams an uploaded image into the store.
+
+        The first chunk is inspected for a known image signature before
+        anything is written, and the remaining copy runs in the thread pool
+        so disk I/O never blocks the event loop.
+
+        Args:
+            file (UploadFile): The uploaded file.
+            max_bytes (int): The maximum accepted image size in bytes.
+
+        Returns:
+            str: The key of the stored blob.
+
+        Raises:
+            InvalidImageError: If the content is not a supported image.
+            ImageTooLargeError: If the content exceeds `max_bytes`.
+            OSError: If the blob cannot be written.
+        """
+        if file.size is not None and file.size > max_bytes:
+            raise ImageTooLargeError("Image is too large.")
+
+        head = await file.read(CHUNK_SIZE)
+        extension = sniff_image_type(head)
+        if extension is None:
+            raise InvalidImageError("Invalid image type.")
+
+        return await run_in_threadpool(
+            self._write_stream, file.file, head, extension, max_bytes
+        )
+
+    def path(self, key: str) -> Path:
+        """Resolves a key to the local file backing it.
+
+        Args:
+            key (str): The blob key.
+
+        Returns:
+            Path: The filesystem path of the blob.
+        """
+        return self.root / key
+
+    def exists(self, key: str) -> bool:
+        """Checks whether a blob is stored.
+
+        Args:
+            key (str): The blob key.
+
+        Returns:
+            bool: True if the blob exists.
+        """
+        return self.path(key).is_file()
+
+    def touch(self, key: str) -> None:
+        """Sets the modification time of a blob to now.
+
+        Args:
+            key (str): The blob key.
+        """
+        os.utime(self.path(key))
+
+    def url(self, key: str) -> str:
+        """Builds the public URL of a blob.
+
+        Args:
+            key (str): The blob key.
+
+        Returns:
+            str: The URL the blob is served from.
+        """
+        return f"{self.url_prefix}/{key}"
+
+    def delete(self, key: str) -> None:
+        """Removes a blob and the variants stored next to it.
+
+        Args:
+            key (str): The blob key.
+        """
+        path = self.path(key)
+        stem = path.name.rsplit(".", 1)[0]
+        for derived in path.parent.glob(f"{stem}.*"):
+            derived.unlink(missing_ok=True)
+        path.unlink(missing_ok=True)
+
+    def keys(self) -> Iterator[str]:
+        """Lists the keys of all stored blobs, excluding derived files.
+
+        Derived files carry an extra suffix before their extension, and
+        in-progress uploads are hidden, so both are skipped.
+
+        Yields:
+            str: The key of each stored blob.
+        """
+        for directory, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if filename.startswith(".") or filename.count(".") != 1:
+                    continue
+                yield (Path(directory) / filename).relative_to(self.root).as_posix()
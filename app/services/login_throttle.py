@@ -0,0 +1,115 @@
+"""Sliding-window throttling of failed login attempts."""
+
+import math
+import threading
+import time
+from collections import deque
+
+MAX_TRACKED_KEYS = 100_000
+
+
+class LoginThrottle:
+    """Limits failed logins per account and per client address.
+
+    Checks happen before the password is verified, so a credential stuffing
+    run is rejected without spending bcrypt time on it.
+
+    Attributes:
+        max_per_account (int): Failed attempts allowed per account and window.
+        max_per_ip (int): Failed attempts allowed per address and window.
+        window (float): The length of the window in seconds.
+    """
+
+    def __init__(self, max_per_account: int, max_per_ip: int, window: float):
+        """Initializes the throttle with no recorded failures.
+
+        Args:
+            max_per_account (int): Failed attempts allowed per account.
+            max_per_ip (int): Failed attempts allowed per address.
+            window (float): The length of the window in seconds.
+        """
+        self.max_per_account = max_per_account
+        self.max_per_ip = max_per_ip
+        self.window = window
+        self._failures: dict[str, deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def _recent(self, key: str, now: float) -> deque[float]:
+        """Drops expired failures of a key and returns the remaining ones.
+
+        Args:
+            key (str): The throttling key.
+            now (float): The current monotonic time.
+
+        Returns:
+            deque[float]: The failure times inside the window.
+        """
+        failures = self._failures.get(key, deque())
+        while failures and failures[0] <= now - self.window:
+            failures.popleft()
+        if not failures:
+            self._failures.pop(key, None)
+        return failures
+
+    def retry_after(self, account: str, ip: str | None) -> int | None:
+        """Checks whether a login attempt must be rejected.
+
+        Args:
+            account (str): The account name being logged into.
+            ip (str | None): The client address, if known.
+
+        Returns:
+            int | None: Seconds until the next attempt is allowed, or None if
+                the attempt may proceed.
+        """
+        now = time.monotonic()
+        limits = [(f"account:{account.lower()}", self.max_per_account)]
+        if ip:
+            limits.append((f"ip:{ip}", self.max_per_ip))
+
+        wait = 0.0
+        with self._lock:
+            for key, limit in limits:
+                failures = self._recent(key, now)
+                if len(failures) >= limit:
+                    wait = max(wait, failures[-limit] + self.window - now)
+        return max(1, math.ceil(wait)) if wait > 0 else None
+
+    def record_failure(self, account: str, ip: str | None) -> None:
+        """Records a failed login attempt.
+
+        Args:
+            account (str): The account name being logged into.
+            ip (str | None): The client address, if known.
+        """
+        now = time.monotonic()
+        keys = [f"account:{account.lower()}"] + ([f"ip:{ip}"] if ip else [])
+        with self._lock:
+            if len(self._failures) >= MAX_TRACKED_KEYS:
+                for key in list(self._failures):
+                    self._recent(key, now)
+            for key in keys:
+                self._recent(key, now)
+                self._failures.setdefault(key, deque()).append(now)
+
+    def reset(self, account: str) -> None:
+        """Forgets the failed attempts of an account after a successful login.
+
+        Args:
+            account (str): The account name that logged in.
+        """
+        with self._lock:
+            self._failures.pop(f"account:{account.lower()}", None)
+
+    def stats(self) -> dict:
+        """Reports how many keys are currently tracked.
+
+        Returns:
+            dict: The number of throttled accounts and addresses.
+        """
+        with self._lock:
+            keys = list(self._failures)
+        return {
+            "tracked_accounts": sum(key.startswith("account:") for key in keys),
+            "tracked_ips": sum(key.startswith("ip:") for key in keys),
+        }
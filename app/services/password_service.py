@@ -0,0 +1,151 @@
+"""Service running password hashing on a dedicated, bounded thread pool."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from app.core.metrics import Histogram
+from app.core.security import (
+    get_password_hash,
+    verify_and_update_password,
+    verify_password,
+)
+
+T = TypeVar("T")
+
+
+class PasswordHasherBusyError(RuntimeError):
+    """Raised when the password hashing queue is full."""
+
+
+class PasswordHasher:
+    """Runs bcrypt on its own threads so it cannot starve other endpoints.
+
+    At most `max_workers` hashes run at once and at most `max_queued` more
+    wait for a thread; further requests are rejected immediately instead of
+    piling up behind a login spike.
+
+    Attributes:
+        executor (ThreadPoolExecutor): The pool running the hash operations.
+        max_workers (int): The number of hashing threads.
+        max_queued (int): The number of operations allowed to wait.
+        queue_wait (Histogram): Time operations spent waiting for a thread.
+    """
+
+    def __init__(self, max_workers: int, max_queued: int):
+        """Initializes the thread pool.
+
+        Args:
+            max_workers (int): The number of hashing threads.
+            max_queued (int): The number of operations allowed to wait.
+        """
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hasher"
+        )
+        self.queue_wait = Histogram()
+        self._pending = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        """Runs a hash operation on the pool.
+
+        Args:
+            func (Callable[..., T]): The blocking operation.
+            *args: The arguments of the operation.
+
+        Returns:
+            T: The result of the operation.
+
+        Raises:
+            PasswordHasherBusyError: If the queue is full.
+        """
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queued:
+                self._rejected += 1
+                raise PasswordHasherBusyError("Password hashing queue is full")
+            self._pending += 1
+
+        submitted = time.perf_counter()
+
+        def task() -> T:
+            self.queue_wait.observe(time.perf_counter() - submitted)
+            return func(*args)
+
+        try:
+            return await asyncio.wrap_future(self.executor.submit(task))
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    async def hash(self, password: str) -> str:
+        """Hashes a password.
+
+        Args:
+            password (str): The plain text password.
+
+        Returns:
+            str: The hashed password.
+
+        Raises:
+            PasswordHasherBusyError: If the queue is full.
+        """
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """Verifies a password against a stored hash.
+
+        Args:
+            password (str): The plain text password.
+            hashed_password (str): The stored hash.
+
+        Returns:
+            bool: True if the password matches the hash.
+
+        Raises:
+            PasswordHasherBusyError: If the queue is full.
+        """
+        return await self._run(verify_password, password, hashed_password)
+
+    async def verify_and_update(
+        self, password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        """Verifies a password and rehashes it if its hash is outdated.
+
+        Args:
+            password (str): The plain text password.
+            hashed_password (str): The stored hash.
+
+        Returns:
+            tuple[bool, str | None]: Whether the password matches, and the
+                new hash to store if the stored one is outdated.
+
+        Raises:
+            PasswordHasherBusyError: If the queue is full.
+        """
+        return await self._run(verify_and_update_password, password, hashed_password)
+
+    def stats(self) -> dict:
+        """Reports the load of the pool.
+
+        Returns:
+            dict: The pool size, pending and rejected operation counts, and
+                the queue wait histogram.
+        """
+        with self._lock:
+            pending, rejected = self._pending, self._rejected
+        return {
+            "workers": self.max_workers,
+            "max_queued": self.max_queued,
+            "pending": pending,
+            "rejected": rejected,
+            "queue_wait_seconds": self.queue_wait.snapshot(),
+        }
+
+    def shutdown(self) -> None:
+        """Stops the threads after the running operations finish."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,315 @@
+"""Re-classification of existing items after the tagging setup changed."""
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from app.core.utils import (
+    CANDIDATE_LABELS,
+    CLASSIFIER_MODEL,
+    ITEM_HYPOTHESIS_TEMPLATE,
+    scores_version,
+    select_item_tags,
+)
+from app.crud.item_repo import get_items_after, lock_existing_items
+from app.crud.job_repo import delete_checkpoint, get_checkpoint, save_checkpoint
+from app.crud.tag_repo import replace_item_tags, save_item_scores
+
+logger = logging.getLogger(__name__)
+
+RETAG_BATCH_SIZE = 256
+INFERENCE_BATCH_SIZE = 32
+
+
+class RetagWorkerBusyError(RuntimeError):
+    """Raised when the re-tagging queue is full."""
+
+
+class RetagJob:
+    """Classifies existing items again and rewrites their scores and tags.
+
+    Items are scanned in ID order in batches, skipping items already scored
+    by the current model and labels. The descriptions of a batch are
+    classified in one batched inference call, the scores of all labels are
+    stored and only the links that differ from the stored ones are written.
+    No transaction or connection is held while the classifier runs: each
+    batch is read in one short session and written in another, together
+    with a checkpoint, so an interrupted run resumes after the last
+    finished batch. Items deleted while their batch was classified are
+    skipped. A checkpoint written under another scores version is
+    discarded and the scan starts over.
+
+    Threshold changes do not need this job; `rebuild_item_tags` derives the
+    links from the stored scores instead.
+
+    Attributes:
+        name (str): The unique name of the job, used for its checkpoint.
+        fingerprint (str): The scores version of this run.
+    """
+
+    _running: set[str] = set()
+    _running_lock = threading.Lock()
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        ai_service,
+        owner_id: int | None = None,
+        batch_size: int = RETAG_BATCH_SIZE,
+        inference_batch_size: int = INFERENCE_BATCH_SIZE,
+        model_name: str = CLASSIFIER_MODEL,
+    ):
+        """Initializes the job without running it.
+
+        Args:
+            session_factory (Callable[[], Session]): Creates database sessions.
+            ai_service (AIService): The classifier.
+            owner_id (int | None): Only re-tag the items of this user.
+            batch_size (int): The number of items per transaction.
+            inference_batch_size (int): The number of premise/hypothesis
+                pairs per forward pass of the model.
+            model_name (str): The name of the classifier model.
+        """
+        self.session_factory = session_factory
+        self.ai_service = ai_service
+        self.owner_id = owner_id
+        self.batch_size = batch_size
+        self.inference_batch_size = inference_batch_size
+        self.name = "retag" if owner_id is None else f"retag:user:{owner_id}"
+        self.fingerprint = scores_version(model_name)
+
+    @classmethod
+    def is_running(cls, name: str) -> bool:
+        """Tells whether a job of the given name runs in this process.
+
+        Args:
+            name (str): The name of the job.
+
+        Returns:
+            bool: True if the job is running.
+        """
+        with cls._running_lock:
+            return name in cls._running
+
+    def classify(self, descriptions: list[str]) -> list[dict[str, int]]:
+        """Scores several descriptions against all candidate labels.
+
+        Identical descriptions are classified once.
+
+        Args:
+            descriptions (list[str]): The item descriptions.
+
+        Returns:
+            list[dict[str, int]]: The scores of every label of each
+                description, in input order.
+        """
+        unique = list(dict.fromkeys(descriptions))
+        results = self.ai_service.classify_batch(
+            unique,
+            CANDIDATE_LABELS,
+            hypothesis_template=ITEM_HYPOTHESIS_TEMPLATE,
+            batch_size=self.inference_batch_size,
+        )
+        scores = dict(zip(unique, results))
+        return [scores[text] for text in descriptions]
+
+    def run(
+        self,
+        restart: bool = False,
+        max_batches: int | None = None,
+        progress: Callable[[int, int], None] | None = None,
+    ) -> dict:
+        """Re-tags the items, resuming from the checkpoint if there is one.
+
+        Args:
+            restart (bool): Ignore the checkpoint and scan from the start.
+            max_batches (int | None): Stop after this many batches, leaving
+                the checkpoint for the next run.
+            progress (Callable[[int, int], None] | None): Called after each
+                batch with the items processed and changed so far.
+
+        Returns:
+            dict: The number of items `processed` and `changed` by this run,
+                and whether the scan `finished`.
+
+        Raises:
+            RuntimeError: If the job is already running in this process.
+        """
+        with self._running_lock:
+            if self.name in self._running:
+                raise RuntimeError(f"Job {self.name} is already running")
+            self._running.add(self.name)
+        try:
+            return self._run(restart, max_batches, progress)
+        finally:
+            with self._running_lock:
+                self._running.discard(self.name)
+
+    def _run(
+        self,
+        restart: bool,
+        max_batches: int | None,
+        progress: Callable[[int, int], None] | None,
+    ) -> dict:
+        """Runs the batches of the scan.
+
+        Args:
+            restart (bool): Ignore the checkpoint.
+            max_batches (int | None): The maximum number of batches to run.
+            progress (Callable[[int, int], None] | None): The progress callback.
+
+        Returns:
+            dict: The `processed` and `changed` counts and `finished`.
+        """
+        last_id, done = 0, 0
+        with self.session_factory() as db:
+            checkpoint = get_checkpoint(db, self.name)
+        if checkpoint is not None:
+            if restart or checkpoint.fingerprint != self.fingerprint:
+                logger.info("Discarding checkpoint of %s", self.name)
+            else:
+                last_id, done = checkpoint.last_id, checkpoint.processed
+                logger.info("Resuming %s after item %d", self.name, last_id)
+
+        processed, changed, batches = 0, 0, 0
+        while max_batches is None or batches < max_batches:
+            with self.session_factory() as db:
+                rows = get_items_after(
+                    db, last_id, self.batch_size, self.owner_id, self.fingerprint
+                )
+                if not rows:
+                    delete_checkpoint(db, self.name)
+                    db.commit()
+                    return {
+                        "processed": processed,
+                        "changed": changed,
+                        "finished": True,
+                    }
+
+            scores = self.classify([row.description for row in rows])
+            with self.session_factory() as db:
+                try:
+                    existing = lock_existing_items(db, [row.id for row in rows])
+                    scored = [
+                        (row, item_scores)
+                        for row, item_scores in zip(rows, scores)
+                        if row.id in existing
+                    ]
+                    save_item_scores(
+                        db,
+                        {
+                            row.id: (row.description, item_scores)
+                            for row, item_scores in scored
+                        },
+                        self.fingerprint,
+                    )
+                    tags = {
+                        row.id: select_item_tags(row.description, item_scores)
+                        for row, item_scores in scored
+                    }
+                    changed += len(replace_item_tags(db, tags))
+                    last_id = rows[-1].id
+                    processed += len(rows)
+                    save_checkpoint(
+                        db, self.name, self.fingerprint, last_id, done + processed
+                    )
+                    db.commit()
+                except Exception:
+                    db.rollback()
+                    raise
+
+            batches += 1
+            if progress is not None:
+                progress(processed, changed)
+        return {"processed": processed, "changed": changed, "finished": False}
+
+
+class RetagWorker:
+    """Runs the re-tagging jobs requested through the API on its own threads.
+
+    Inference is expensive, so at most `max_workers` jobs run at once across
+    all users and at most `max_queued` more wait; further jobs are rejected
+    immediately. A job that is already queued or running is not queued
+    again.
+
+    Attributes:
+        executor (ThreadPoolExecutor): The pool running the jobs.
+        max_workers (int): The number of jobs running at once.
+        max_queued (int): The number of jobs allowed to wait.
+    """
+
+    def __init__(self, max_workers: int, max_queued: int):
+        """Initializes the thread pool.
+
+        Args:
+            max_workers (int): The number of jobs running at once.
+            max_queued (int): The number of jobs allowed to wait.
+        """
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="retag"
+        )
+        self._pending: set[str] = set()
+        self._lock = threading.Lock()
+
+    def is_pending(self, name: str) -> bool:
+        """Tells whether a job of the given name is queued or running.
+
+        Args:
+            name (str): The name of the job.
+
+        Returns:
+            bool: True if the job is queued or running.
+        """
+        with self._lock:
+            return name in self._pending or RetagJob.is_running(name)
+
+    def submit(self, job: RetagJob) -> Future:
+        """Queues a job.
+
+        Args:
+            job (RetagJob): The job to run.
+
+        Returns:
+            Future: The result of `RetagJob.run`.
+
+        Raises:
+            RuntimeError: If the job is already queued or running.
+            RetagWorkerBusyError: If the queue is full.
+        """
+        with self._lock:
+            if job.name in self._pending:
+                raise RuntimeError(f"Job {job.name} is already queued")
+            if len(self._pending) >= self.max_workers + self.max_queued:
+                raise RetagWorkerBusyError("Re-tagging queue is full")
+            self._pending.add(job.name)
+
+        try:
+            future = self.executor.submit(job.run)
+        except BaseException:
+            self._discard(job.name)
+            raise
+        future.add_done_callback(lambda done: self._finished(done, job.name))
+        return future
+
+    def _discard(self, name: str) -> None:
+        """Forgets a job that is no longer pending."""
+        with self._lock:
+            self._pending.discard(name)
+
+    def _finished(self, future: Future, name: str) -> None:
+        """Forgets a finished job and logs its failure."""
+        self._discard(name)
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            logger.error("Job %s failed", name, exc_info=error)
+
+    def shutdown(self) -> None:
+        """Stops the threads after the running jobs finish."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
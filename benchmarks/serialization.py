@@ -0,0 +1,154 @@
+"""Measures the CPU cost of encoding closet and recommendation responses.
+
+Usage:
+    python -m benchmarks.serialization --items 1000
+
+Compares the previous response path, where FastAPI validated the closet
+page against `ClosetPage` and passed recommendations through
+`jsonable_encoder` and `json.dumps`, with encoding the same data directly
+through `FastJSONResponse`. Building the item dictionaries is the same on
+both paths and is left out.
+"""
+
+import argparse
+import json
+import time
+from typing import Callable
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.core.responses import FastJSONResponse
+from app.schemas.item import ClosetPage
+from app.schemas.weather import WeatherData
+
+VARIANT_WIDTHS = (160, 480, 960)
+TAGS = ("Cold", "Rain", "Windy", "Snow", "Hot")
+
+
+def sample_items(count: int) -> list[dict]:
+    """Builds serialized items shaped like the closet listing's.
+
+    Args:
+        count (int): The number of items.
+
+    Returns:
+        list[dict]: The items, each with tags and image variants.
+    """
+    return [
+        {
+            "id": i,
+            "owner_id": 1,
+            "description": f"Waterproof hiking jacket number {i}",
+            "image_filename": f"{i:032x}.jpg",
+            "variants": [
+                {"width": width, "url": f"/static/images/{i:032x}_{width}.webp"}
+                for width in VARIANT_WIDTHS
+            ],
+            "placeholder_url": f"/static/images/{i:032x}_placeholder.webp",
+            "tags": list(TAGS[: i % len(TAGS) + 1]),
+        }
+        for i in range(count)
+    ]
+
+
+def starlette_json(content: object) -> bytes:
+    """Encodes content like Starlette's `JSONResponse`.
+
+    Args:
+        content (object): The JSON-compatible data.
+
+    Returns:
+        bytes: The encoded document.
+    """
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode()
+
+
+def cpu_seconds(encode: Callable[[], bytes], repeat: int) -> float:
+    """Measures the median process CPU time of one encoding.
+
+    Args:
+        encode (Callable[[], bytes]): The encoding to run.
+        repeat (int): The number of runs.
+
+    Returns:
+        float: The median CPU time in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.process_time()
+        encode()
+        timings.append(time.process_time() - started)
+    return sorted(timings)[len(timings) // 2]
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Runs the benchmark and prints CPU time per 1,000 items.
+
+    Args:
+        argv (list[str] | None): Command line arguments, defaulting to
+            `sys.argv`.
+
+    Returns:
+        int: The process exit code.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--items",
+        type=int,
+        default=1000,
+        help="items per response (default: 1000)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=50,
+        help="runs per measurement (default: 50)",
+    )
+    args = parser.parse_args(argv)
+
+    items = sample_items(max(1, args.items))
+    page = {"items": items, "next_cursor": None}
+    weather = WeatherData(
+        description="light rain",
+        temperature=8.5,
+        feels_like=6.0,
+        wind_speed=5.1,
+        humidity=87,
+        location="London",
+    )
+    tags = {"Rain": 97, "Cold": 88}
+    closet_page = TypeAdapter(ClosetPage)
+
+    paths = {
+        "closet": (
+            lambda: closet_page.dump_json(
+                closet_page.validate_python(page), exclude_unset=True
+            ),
+            lambda: FastJSONResponse(page).body,
+        ),
+        "recommend": (
+            lambda: starlette_json(
+                jsonable_encoder({"weather": weather, "tags": tags, "items": items})
+            ),
+            lambda: FastJSONResponse(
+                {"weather": weather.model_dump(), "tags": tags, "items": items}
+            ).body,
+        ),
+    }
+
+    per_thousand = 1000 / len(items)
+    for name, (before, after) in paths.items():
+        old = cpu_seconds(before, max(1, args.repeat)) * per_thousand * 1000
+        new = cpu_seconds(after, max(1, args.repeat)) * per_thousand * 1000
+        print(
+            f"{name:<10} before {old:7.2f} ms  after {new:7.2f} ms  "
+            f"per 1,000 items ({old / new:.1f}x)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
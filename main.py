@@ -1,16 +1,48 @@
 """Main application entry point and configuration."""
 
+import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.responses import RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from sqlalchemy.exc import SQLAlchemyError
 
-from app.routers import auth, closet, pages, recommendation
+from app.core.config import settings
+from app.core.responses import FastJSONResponse
+from app.core.utils import CANDIDATE_LABELS
+from app.crud.tag_repo import load_tag_registry
+from app.database.query_stats import QueryStatsMiddleware
+from app.database.session import (
+    SessionLocal,
+    dispose_async_engine,
+    get_replica_set,
+)
+from app.routers import auth, closet, images, metrics, pages, recommendation
 from app.services.ai_service import AIService
+from app.services.image_reaper import ImageReaper
+from app.services.image_service import ImageService
+from app.services.login_throttle import LoginThrottle
+from app.services.password_service import PasswordHasher
+from app.services.retag_job import RetagWorker
 from app.services.weather_service import WeatherService
 
+logger = logging.getLogger(__name__)
+
+
+def warm_tag_registry() -> None:
+    """Seeds the candidate labels and loads all weather tags into memory.
+
+    A database that is unreachable at startup is not fatal: the registry
+    then fills itself lazily on the first lookups.
+    """
+    try:
+        with SessionLocal() as db:
+            load_tag_registry(db, CANDIDATE_LABELS)
+    except SQLAlchemyError:
+        logger.warning("Could not preload weather tags", exc_info=True)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -19,22 +51,63 @@ async def lifespan(app: FastAPI):
     Args:
         app (FastAPI): The application instance.
     """
+    warm_tag_registry()
     app.state.ai_service = AIService()
     app.state.weather_service = WeatherService()
+    app.state.image_service = ImageService(max_workers=settings.image_workers)
+    app.state.password_hasher = PasswordHasher(
+        max_workers=settings.password_workers,
+        max_queued=settings.password_queue_limit,
+    )
+    app.state.retag_worker = RetagWorker(
+        max_workers=settings.retag_workers,
+        max_queued=settings.retag_queue_limit,
+    )
+    app.state.login_throttle = LoginThrottle(
+        max_per_account=settings.login_attempts_per_account,
+        max_per_ip=settings.login_attempts_per_ip,
+        window=settings.login_throttle_window_seconds,
+    )
+    app.state.image_reaper = ImageReaper(
+        closet.image_store,
+        SessionLocal,
+        reconcile_interval=settings.image_reconcile_interval,
+    )
+    await app.state.image_reaper.start()
+    await get_replica_set().start()
     yield
+    await get_replica_set().stop()
+    await app.state.image_reaper.stop()
+    app.state.image_service.shutdown()
+    app.state.password_hasher.shutdown()
+    app.state.retag_worker.shutdown()
+    await dispose_async_engine()
     app.state.ai_service = None
     app.state.weather_service = None
+    app.state.image_service = None
+    app.state.image_reaper = None
+    app.state.password_hasher = None
+    app.state.retag_worker = None
+    app.state.login_throttle = None
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=FastJSONResponse)
 
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 templates = Jinja2Templates(directory="templates")
 
+app.add_middleware(
+    QueryStatsMiddleware,
+    max_statements=settings.query_log_threshold,
+    repeat_threshold=settings.query_repeat_threshold,
+)
+
 app.include_router(auth.router)
 app.include_router(pages.router)
 app.include_router(closet.router)
+app.include_router(images.router)
+app.include_router(metrics.router)
 app.include_router(recommendation.router)
 
 
@@ -19,6 +19,41 @@ function requireAuth() {
     }
 }
 
+async function fetchWithValidator(url, options = {}) {
+    const cacheKey = `validated:${url}`;
+    let cached = null;
+    try { cached = JSON.parse(sessionStorage.getItem(cacheKey)); } catch (e) { cached = null; }
+
+    const headers = new Headers(options.headers || {});
+    if (cached) headers.set('If-None-Match', cached.etag);
+
+    const res = await fetch(url, { ...options, headers, cache: 'no-store' });
+    if (res.status === 304 && cached) {
+        return new Response(cached.body, { status: 200, headers: { 'Content-Type': 'application/json' } });
+    }
+
+    const etag = res.headers.get('ETag');
+    if (res.ok && etag) {
+        const body = await res.clone().text();
+        try { sessionStorage.setItem(cacheKey, JSON.stringify({ etag, body })); } catch (e) { /* storage full */ }
+    } else {
+        sessionStorage.removeItem(cacheKey);
+    }
+    return res;
+}
+
+function itemImageHtml(item, sizes, style = '', attributes = '') {
+    const variants = Array.isArray(item.variants) ? item.variants : [];
+    if (variants.length === 0) {
+        return `<img src="/images/${item.image_filename}" loading="lazy" decoding="async" style="${style}" ${attributes}>`;
+    }
+    const srcset = variants.map(v => `${v.url} ${v.width}w`).join(', ');
+    const placeholder = item.placeholder_url
+        ? `background: url('${item.placeholder_url}') center / cover no-repeat;`
+        : '';
+    return `<img src="${variants[variants.length - 1].url}" srcset="${srcset}" sizes="${sizes}" loading="lazy" decoding="async" style="${placeholder} ${style}" ${attributes}>`;
+}
+
 document.addEventListener('DOMContentLoaded', () => {
     const logoutBtn = document.getElementById('logout-btn');
     if (logoutBtn) {
@@ -1,39 +1,158 @@
 """Pytest fixtures for test configuration."""
 
+from contextlib import contextmanager
+
 import pytest
-from sqlalchemy import create_engine
+import pytest_asyncio
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool
 
+from app.crud.tag_registry import tag_registry
+from app.crud.user_cache import user_cache
 from app.database.models import Base
+from app.database.query_stats import QueryStats
+from app.database.session import recent_writes, to_async_url
+
+
+@pytest.fixture(scope="session")
+def database_url(tmp_path_factory):
+    """Provides the URL of a SQLite database file shared by all tests.
+
+    A file rather than an in-memory database is used so that the sync and
+    the asyncio engine see the same data.
+
+    Args:
+        tmp_path_factory: The pytest temporary directory factory.
+
+    Returns:
+        str: The database URL.
+    """
+    return f"sqlite:///{tmp_path_factory.mktemp('db') / 'test.db'}"
+
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+@pytest.fixture(scope="session")
+def engine(database_url):
+    """Provides the synchronous engine of the test database.
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
-)
+    Args:
+        database_url (str): The URL of the test database.
 
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Yields:
+        Engine: The SQLAlchemy engine.
+    """
+    engine = create_engine(database_url, connect_args={"check_same_thread": False})
+    yield engine
+    engine.dispose()
 
 
 @pytest.fixture(scope="function")
-def db_session():
+def db_session(engine):
     """Provides a fresh database session for each test function.
 
     This fixture creates all tables before yielding the session and drops
     them after the test completes, ensuring isolation.
 
+    Args:
+        engine (Engine): The synchronous engine of the test database.
+
     Yields:
         Session: The SQLAlchemy database session.
     """
     Base.metadata.create_all(bind=engine)
+    tag_registry.clear()
+    user_cache.clear()
+    recent_writes.clear()
 
-    session = TestingSessionLocal()
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
 
     try:
         yield session
     finally:
         session.close()
-        Base.metadata.drop_all(bind=engine)
\ No newline at end of file
+        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="function")
+def async_session_factory(db_session, database_url):
+    """Provides a factory of asyncio sessions on the test database.
+
+    Connections are not pooled, because each request of a `TestClient` runs
+    in its own event loop.
+
+    Args:
+        db_session (Session): The synchronous session, which creates the tables.
+        database_url (str): The URL of the test database.
+
+    Yields:
+        async_sessionmaker: The asyncio session factory.
+    """
+    engine = create_async_engine(to_async_url(database_url), poolclass=NullPool)
+    yield async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+    engine.sync_engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def async_db(async_session_factory):
+    """Provides an override for the `get_async_db` dependency.
+
+    Every request gets its own asyncio session on the test database.
+
+    Args:
+        async_session_factory (async_sessionmaker): The asyncio session factory.
+
+    Returns:
+        Callable: The dependency override.
+    """
+
+    async def get_test_async_db():
+        async with async_session_factory() as session:
+            yield session
+
+    return get_test_async_db
+
+
+@pytest_asyncio.fixture(scope="function")
+async def async_db_session(async_session_factory):
+    """Provides an asyncio session on the test database.
+
+    Args:
+        async_session_factory (async_sessionmaker): The asyncio session factory.
+
+    Yields:
+        AsyncSession: The SQLAlchemy asyncio session.
+    """
+    async with async_session_factory() as session:
+        yield session
+
+
+@pytest.fixture(scope="function")
+def max_queries():
+    """Provides a check of how many SQL statements a block of code runs.
+
+    All engines of the process are watched, because a `TestClient` serves
+    requests in another thread. Use it as
+    `with max_queries(3): client.get(...)`; the block fails when it runs
+    more statements than allowed.
+
+    Returns:
+        Callable: A context manager taking the allowed number of statements
+            and yielding the collected `QueryStats`.
+    """
+
+    @contextmanager
+    def check(limit: int):
+        stats = QueryStats()
+
+        def record(conn, cursor, statement, *args):
+            stats.record(statement, 0.0)
+
+        event.listen(Engine, "after_cursor_execute", record)
+        try:
+            yield stats
+        finally:
+            event.remove(Engine, "after_cursor_execute", record)
+        assert stats.count <= limit, stats.summary()
+
+    return check
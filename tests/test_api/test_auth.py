@@ -1,32 +1,51 @@
 """Integration tests for authentication endpoints."""
 
+import shutil
+from unittest.mock import AsyncMock, MagicMock
+
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
-
-from app.crud.user_repo import create_user
-from app.database.session import get_db
+from passlib.hash import bcrypt
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.security import pwd_context
+from app.crud.user_cache import user_cache
+from app.crud.user_repo import create_user, get_user_by_email
+from app.database.session import (
+    get_async_db,
+    get_async_read_db,
+    recent_writes,
+    to_async_url,
+)
 from app.routers import auth
 from app.schemas.user import UserCreate
+from app.services.login_throttle import LoginThrottle
+from app.services.password_service import PasswordHasher, PasswordHasherBusyError
 
 
-def setup_app(db_session):
+def setup_app(async_db):
     """Configures a test FastAPI app with dependency overrides.
 
     Args:
-        db_session: The database session fixture.
+        async_db: The asyncio database dependency override.
 
     Returns:
         TestClient: A configured test client.
     """
     app = FastAPI()
     app.include_router(auth.router)
-    app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_async_db] = async_db
+    app.state.password_hasher = PasswordHasher(max_workers=1, max_queued=4)
+    app.state.login_throttle = LoginThrottle(
+        max_per_account=3, max_per_ip=10, window=60
+    )
     return TestClient(app)
 
 
-def test_signup_new_user(db_session):
+def test_signup_new_user(db_session, async_db):
     """Verifies that a new user can successfully sign up."""
-    client = setup_app(db_session)
+    client = setup_app(async_db)
     payload = {"email": "api_user@test.com", "password": "StrongPassword1!"}
 
     response = client.post("/signup", json=payload)
@@ -38,9 +57,9 @@ def test_signup_new_user(db_session):
     assert "password" not in data
 
 
-def test_signup_duplicate_email(db_session):
+def test_signup_duplicate_email(db_session, async_db):
     """Verifies that signing up with a duplicate email fails."""
-    client = setup_app(db_session)
+    client = setup_app(async_db)
     payload = {"email": "duplicate@test.com", "password": "StrongPassword1!"}
 
     client.post("/signup", json=payload)
@@ -50,14 +69,14 @@ def test_signup_duplicate_email(db_session):
     assert response.json()["detail"] == "Email already registered"
 
 
-def test_login_access_token(db_session):
+def test_login_access_token(db_session, async_db):
     """Verifies that logging in with valid credentials returns a token."""
     email = "login_test@example.com"
     password = "StrongPassword1!"
     user_in = UserCreate(email=email, password=password)
     create_user(db_session, user_in)
 
-    client = setup_app(db_session)
+    client = setup_app(async_db)
 
     login_data = {"username": email, "password": password}
 
@@ -69,18 +88,127 @@ def test_login_access_token(db_session):
     assert data["token_type"] == "bearer"
 
 
-def test_login_incorrect_password(db_session):
+def test_login_incorrect_password(db_session, async_db):
     """Verifies that logging in with incorrect credentials fails."""
     email = "wrong_pass@example.com"
     password = "StrongPassword1!"
     user_in = UserCreate(email=email, password=password)
     create_user(db_session, user_in)
 
-    client = setup_app(db_session)
+    client = setup_app(async_db)
 
     login_data = {"username": email, "password": "WrongPassword123!"}
 
     response = client.post("/login", data=login_data)
 
     assert response.status_code == 401
-    assert response.json()["detail"] == "Incorrect username or password"
\ No newline at end of file
+    assert response.json()["detail"] == "Incorrect username or password"
+
+
+def test_login_rehashes_outdated_password_hash(db_session, async_db):
+    """Verifies that a hash with an outdated bcrypt cost is replaced on login."""
+    email = "rehash@example.com"
+    password = "StrongPassword1!"
+    outdated = bcrypt.using(rounds=4).hash(password)
+    create_user(
+        db_session, UserCreate(email=email, password=password), hashed_password=outdated
+    )
+
+    client = setup_app(async_db)
+
+    response = client.post("/login", data={"username": email, "password": password})
+
+    assert response.status_code == 200
+    db_session.expire_all()
+    stored = get_user_by_email(db_session, email).hashed_password
+    assert stored != outdated
+    assert not pwd_context.needs_update(stored)
+
+
+def test_logout_all_revokes_tokens(db_session, async_db):
+    """Verifies that logging out everywhere invalidates issued tokens."""
+    email = "logout_test@example.com"
+    password = "StrongPassword1!"
+    create_user(db_session, UserCreate(email=email, password=password))
+    client = setup_app(async_db)
+
+    token = client.post(
+        "/login", data={"username": email, "password": password}
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert client.post("/logout/all", headers=headers).status_code == 204
+    assert client.post("/logout/all", headers=headers).status_code == 401
+
+
+def test_revoked_token_rejected_despite_replica_lag(
+    db_session, async_db, database_url, tmp_path
+):
+    """Verifies that a lagging replica cannot revive a revoked token.
+
+    The replica is a copy of the database taken before the revocation, and
+    the user cache and recent writes are cleared as on another worker.
+    """
+    email = "lagging_replica@example.com"
+    password = "StrongPassword1!"
+    create_user(db_session, UserCreate(email=email, password=password))
+    client = setup_app(async_db)
+
+    token = client.post(
+        "/login", data={"username": email, "password": password}
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    replica_path = tmp_path / "replica.db"
+    shutil.copy(database_url.removeprefix("sqlite:///"), replica_path)
+    replica = create_async_engine(
+        to_async_url(f"sqlite:///{replica_path}"), poolclass=NullPool
+    )
+
+    async def get_lagging_read_db():
+        async with async_sessionmaker(replica, expire_on_commit=False)() as session:
+            yield session
+
+    client.app.dependency_overrides[get_async_read_db] = get_lagging_read_db
+
+    assert client.post("/logout/all", headers=headers).status_code == 204
+    user_cache.clear()
+    recent_writes.clear()
+
+    assert client.post("/logout/all", headers=headers).status_code == 401
+    replica.sync_engine.dispose()
+
+
+def test_login_is_throttled_after_repeated_failures(db_session, async_db):
+    """Verifies that an account is locked out before verifying passwords."""
+    email = "throttle_test@example.com"
+    password = "StrongPassword1!"
+    create_user(db_session, UserCreate(email=email, password=password))
+    client = setup_app(async_db)
+
+    for _ in range(3):
+        response = client.post(
+            "/login", data={"username": email, "password": "WrongPassword1!"}
+        )
+        assert response.status_code == 401
+
+    response = client.post("/login", data={"username": email, "password": password})
+
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) > 0
+
+
+def test_signup_rejected_when_hasher_is_busy(db_session, async_db):
+    """Verifies that a full password queue is reported as unavailable."""
+    client = setup_app(async_db)
+    busy_hasher = MagicMock()
+    busy_hasher.hash = AsyncMock(side_effect=PasswordHasherBusyError)
+    client.app.dependency_overrides[auth.get_password_hasher] = lambda: busy_hasher
+
+    response = client.post(
+        "/signup",
+        json={"email": "busy@example.com", "password": "StrongPassword1!"},
+    )
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
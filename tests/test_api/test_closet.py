@@ -1,29 +1,43 @@
 """Integration tests for closet management endpoints."""
 
 import io
-from unittest.mock import MagicMock, mock_open, patch
+import json
+import threading
+from unittest.mock import MagicMock, patch
 
 from fastapi.testclient import TestClient
-
-from app.database.models import Item, User
-from app.database.session import get_db
-from app.routers.auth import get_current_user
+from sqlalchemy import event, select
+from sqlalchemy.orm import sessionmaker
+
+from app.database.models import ClothingWeather, Item, ItemTagScore, User, WeatherTag
+from app.database.session import get_async_db, get_session_factory, recent_writes
+from app.routers.auth import get_current_user, get_user_read_db
+from app.routers.closet import get_image_store
+from app.services.image_storage import LocalImageStore
+from app.services.retag_job import RetagWorker
 from main import app
 
 
-def setup_app(db_session, mock_user, mock_ai_service=None):
+def setup_app(async_db, mock_user, mock_ai_service=None, image_dir=None):
     """Configures the app with database, user, and AI service mocks.
 
     Args:
-        db_session: The database session fixture.
+        async_db: The asyncio database dependency override.
         mock_user: The mock user instance.
         mock_ai_service: The mock AI service instance (optional).
+        image_dir: Directory backing the image store (optional).
 
     Returns:
         TestClient: Configured test client.
     """
-    app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_async_db] = async_db
+    app.dependency_overrides[get_user_read_db] = async_db
     app.dependency_overrides[get_current_user] = lambda: mock_user
+    app.dependency_overrides.pop(get_image_store, None)
+
+    if image_dir:
+        store = LocalImageStore(image_dir)
+        app.dependency_overrides[get_image_store] = lambda: store
 
     if mock_ai_service:
         app.state.ai_service = mock_ai_service
@@ -31,11 +45,16 @@ def setup_app(db_session, mock_user, mock_ai_service=None):
     return TestClient(app)
 
 
-def test_upload_item_success(db_session):
+JPEG_BYTES = b"\xff\xd8\xff\xe0" + b"fake_image_bytes"
+
+
+def test_upload_item_success(db_session, tmp_path, async_db):
     """Verifies successful item upload and AI classification.
 
     Args:
         db_session: The database session fixture.
+        async_db: The asyncio database dependency override.
+        tmp_path: Temporary directory used as the upload directory.
     """
     mock_user = User(id=1, email="test@owner.com", hashed_password="pw")
 
@@ -45,34 +64,32 @@ def test_upload_item_success(db_session):
         "scores": [0.99, 0.10],
     }
 
-    with patch("pathlib.Path.open", mock_open()) as mocked_file, patch(
-        "app.routers.closet.shutil.copyfileobj"
-    ) as mock_copy:
+    client = setup_app(async_db, mock_user, mock_ai, image_dir=tmp_path)
 
-        client = setup_app(db_session, mock_user, mock_ai)
+    files = {"file": ("test_image.jpg", io.BytesIO(JPEG_BYTES), "image/jpeg")}
+    data = {"description": "Thick winter coat"}
 
-        file_content = b"fake_image_bytes"
-        files = {
-            "file": ("test_image.jpg", io.BytesIO(file_content), "image/jpeg")
-        }
-        data = {"description": "Thick winter coat"}
+    response = client.post("/closet/upload", files=files, data=data)
 
-        response = client.post("/closet/upload", files=files, data=data)
+    assert response.status_code == 200
+    json_data = response.json()
+    assert json_data["description"] == "Thick winter coat"
+    assert json_data["owner_id"] == 1
 
-        assert response.status_code == 200
-        json_data = response.json()
-        assert json_data["description"] == "Thick winter coat"
-        assert json_data["owner_id"] == 1
+    stored = tmp_path / json_data["image_filename"]
+    assert stored.read_bytes() == JPEG_BYTES
+    assert not list(tmp_path.glob(".*.part"))
 
 
-def test_upload_invalid_file_type(db_session):
+def test_upload_invalid_file_type(db_session, async_db):
     """Verifies that uploading invalid file types returns an error.
 
     Args:
         db_session: The database session fixture.
+        async_db: The asyncio database dependency override.
     """
     mock_user = User(id=1, email="test@owner.com", hashed_password="pw")
-    client = setup_app(db_session, mock_user)
+    client = setup_app(async_db, mock_user)
 
     files = {"file": ("notes.txt", io.BytesIO(b"text content"), "text/plain")}
     data = {"description": "Wrong file type"}
@@ -83,11 +100,158 @@ def test_upload_invalid_file_type(db_session):
     assert response.json()["detail"] == "Invalid image type."
 
 
-def test_get_closet_items(db_session):
+def test_upload_rejects_spoofed_content_type(db_session, tmp_path, async_db):
+    """Verifies that the content type header alone does not pass validation.
+
+    Args:
+        db_session: The database session fixture.
+        async_db: The asyncio database dependency override.
+        tmp_path: Temporary directory used as the upload directory.
+    """
+    mock_user = User(id=1, email="test@owner.com", hashed_password="pw")
+
+    client = setup_app(async_db, mock_user, image_dir=tmp_path)
+    files = {"file": ("evil.jpg", io.BytesIO(b"<?php echo 1; ?>"), "image/jpeg")}
+
+    response = client.post(
+        "/closet/upload", files=files, data={"description": "Spoofed"}
+    )
+
+    assert response.status_code == 400
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_upload_rejects_oversized_file(db_session, tmp_path, async_db):
+    """Verifies that uploads above the configured size limit are rejected.
+
+    Args:
+        db_session: The database session fixture.
+        async_db: The asyncio database dependency override.
+        tmp_path: Temporary directory used as the upload directory.
+    """
+    mock_user = User(id=1, email="test@owner.com", hashed_password="pw")
+
+    with patch("app.routers.closet.settings.max_upload_bytes", 8):
+        client = setup_app(async_db, mock_user, image_dir=tmp_path)
+        files = {"file": ("big.jpg", io.BytesIO(JPEG_BYTES), "image/jpeg")}
+
+        response = client.post(
+            "/closet/upload", files=files, data={"description": "Too big"}
+        )
+
+    assert response.status_code == 413
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_duplicate_uploads_share_one_blob(db_session, tmp_path, async_db):
+    """Verifies deduplication and that blobs are kept while still referenced.
+
+    Args:
+        db_session: The database session fixture.
+        async_db: The asyncio database dependency override.
+        tmp_path: Temporary directory used as the upload directory.
+    """
+    mock_user = User(id=1, email="test@owner.com", hashed_password="pw")
+    db_session.add(mock_user)
+    db_session.commit()
+    client = setup_app(async_db, mock_user, image_dir=tmp_path)
+
+    ids = []
+    for description in ["Red scarf", "Red scarf again"]:
+        files = {"file": ("scarf.jpg", io.BytesIO(JPEG_BYTES), "image/jpeg")}
+        response = client.post(
+            "/closet/upload", files=files, data={"description": description}
+        )
+        ids.append(response.json()["id"])
+        key = response.json()["image_filename"]
+
+    blob = tmp_path / key
+    assert len([p for p in tmp_path.rglob("*") if p.is_file()]) == 1
+
+    assert client.delete(f"/closet/{ids[0]}").status_code == 204
+    assert blob.exists()
+
+    assert client.delete(f"/closet/{ids[1]}").status_code == 204
+    assert not blob.exists()
+
+
+def test_upload_batch_reports_partial_failures(db_session, tmp_path, async_db):
+    """Verifies batched classification and per-file results.
+
+    Args:
+        db_session: The database session fixture.
+        async_db: The asyncio database dependency override.
+        tmp_path: Temporary directory used as the upload directory.
+    """
+    mock_user = User(id=1, email="test@owner.com", hashed_password="pw")
+    db_session.add(mock_user)
+    db_session.commit()
+
+    mock_ai = MagicMock()
+    mock_ai.classify_batch.return_value = [
+        {"Cold": 95, "Hot": 10},
+        {"Hot": 90, "Cold": 5},
+    ]
+    client = setup_app(async_db, mock_user, mock_ai, image_dir=tmp_path)
+
+    files = [
+        ("files", ("coat.jpg", io.BytesIO(JPEG_BYTES), "image/jpeg")),
+        ("files", ("notes.txt", io.BytesIO(b"not an image"), "text/plain")),
+        ("files", ("tee.jpg", io.BytesIO(JPEG_BYTES + b"tee"), "image/jpeg")),
+    ]
+    data = {"descriptions": ["Wool coat", "Notes", "Linen tee"]}
+
+    response = client.post("/closet/upload/batch", files=files, data=data)
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["index"] for r in results] == [0, 1, 2]
+    assert results[0]["item"]["tags"] == ["Cold"]
+    assert results[1]["item"] is None
+    assert results[1]["error"] == "Invalid image type."
+    assert results[2]["item"]["tags"] == ["Hot"]
+
+    mock_ai.classify_batch.assert_called_once()
+    assert mock_ai.classify_batch.call_args.args[0] == ["Wool coat", "Linen tee"]
+    assert db_session.query(Item).count() == 2
+    scores = db_session.execute(
+        select(Item.description, WeatherTag.name, ItemTagScore.score)
+        .join(ItemTagScore, ItemTagScore.item_id == Item.id)
+        .join(WeatherTag, WeatherTag.id == ItemTagScore.tag_id)
+        .order_by(Item.id, WeatherTag.name)
+    ).all()
+    assert [tuple(row) for row in scores] == [
+        ("Wool coat", "Cold", 95),
+        ("Wool coat", "Hot", 10),
+        ("Linen tee", "Cold", 5),
+        ("Linen tee", "Hot", 90),
+    ]
+
+
+def test_upload_batch_requires_matching_descriptions(db_session, async_db):
+    """Verifies that every file must come with a description.
+
+    Args:
+        db_session: The database session fixture.
+        async_db: The asyncio database dependency override.
+    """
+    mock_user = User(id=1, email="test@owner.com", hashed_password="pw")
+    client = setup_app(async_db, mock_user)
+
+    files = [("files", ("a.jpg", io.BytesIO(JPEG_BYTES), "image/jpeg"))]
+    data = {"descriptions": ["One", "Two"]}
+
+    response = client.post("/closet/upload/batch", files=files, data=data)
+
+    assert response.status_code == 400
+
+
+def test_get_closet_items(db_session, async_db):
     """Verifies retrieval of items from the closet.
 
     Args:
         db_session: The database session fixture.
+        async_db: The asyncio database dependency override.
     """
     mock_user = User(id=1, email="test@owner.com", hashed_password="pw")
     db_session.add(mock_user)
@@ -98,20 +262,112 @@ def test_get_closet_items(db_session):
     db_session.add_all([item1, item2])
     db_session.commit()
 
-    client = setup_app(db_session, mock_user)
+    client = setup_app(async_db, mock_user)
     response = client.get("/closet")
 
     assert response.status_code == 200
     data = response.json()
-    assert len(data) == 2
-    assert data[0]["description"] == "Item 1"
+    assert len(data["items"]) == 2
+    assert data["items"][0]["description"] == "Item 1"
+    assert data["next_cursor"] is None
+
+
+def test_get_closet_keyset_pagination(db_session, async_db):
+    """Verifies that pages follow each other without gaps or overlaps.
+
+    Args:
+        db_session: The database session fixture.
+        async_db: The asyncio database dependency override.
+    """
+    mock_user = User(id=1, email="test@owner.com", hashed_password="pw")
+    db_session.add(mock_user)
+    db_session.add_all(
+        [Item(description=f"Item {i}", owner_id=1) for i in range(5)]
+    )
+    db_session.commit()
+
+    client = setup_app(async_db, mock_user)
+
+    first = client.get("/closet", params={"limit": 2}).json()
+    second = client.get(
+        "/closet", params={"limit": 2, "cursor": first["next_cursor"]}
+    ).json()
+    last = client.get(
+        "/closet", params={"limit": 2, "cursor": second["next_cursor"]}
+    ).json()
 
+    descriptions = [
+        item["description"]
+        for page in (first, second, last)
+        for item in page["items"]
+    ]
+    assert descriptions == [f"Item {i}" for i in range(5)]
+    assert last["next_cursor"] is None
+    assert client.get("/closet", params={"limit": 1000}).status_code == 422
 
-def test_delete_item_success(db_session):
+
+def test_get_closet_sparse_fields_and_tag_filter(db_session, async_db):
+    """Verifies field selection and filtering by weather tag.
+
+    Args:
+        db_session: The database session fixture.
+        async_db: The asyncio database dependency override.
+    """
+    mock_user = User(id=1, email="test@owner.com", hashed_password="pw")
+    coat = Item(description="Coat", image_filename="coat.jpg", owner=mock_user)
+    tee = Item(description="Tee", image_filename="tee.jpg", owner=mock_user)
+    tag = WeatherTag(name="Cold")
+    db_session.add_all([mock_user, coat, tee, tag])
+    db_session.add(ClothingWeather(item=coat, tag=tag, confidence=90))
+    db_session.commit()
+
+    client = setup_app(async_db, mock_user)
+
+    response = client.get("/closet", params={"fields": "tags", "tag": "Cold"})
+
+    assert response.status_code == 200
+    assert response.json()["items"] == [
+        {"id": coat.id, "owner_id": 1, "tags": ["Cold"]}
+    ]
+    assert client.get("/closet", params={"fields": "secret"}).status_code == 400
+
+
+def test_get_closet_query_count_does_not_grow_with_items(
+    db_session, async_db, max_queries
+):
+    """Verifies that listing a closet runs no statement per item.
+
+    Args:
+        db_session: The database session fixture.
+        async_db: The asyncio database dependency override.
+        max_queries: The statement count check.
+    """
+    mock_user = User(id=1, email="test@owner.com", hashed_password="pw")
+    tags = [WeatherTag(name="Cold"), WeatherTag(name="Rain")]
+    db_session.add_all([mock_user, *tags])
+    for i in range(10):
+        item = Item(description=f"Item {i}", owner=mock_user)
+        db_session.add(item)
+        db_session.add_all(
+            ClothingWeather(item=item, tag=tag, confidence=50) for tag in tags
+        )
+    db_session.commit()
+    client = setup_app(async_db, mock_user)
+
+    with max_queries(3) as stats:
+        response = client.get("/closet")
+
+    assert response.status_code == 200
+    assert all(item["tags"] == ["Cold", "Rain"] for item in response.json()["items"])
+    assert stats.repeated(3) == []
+
+
+def test_delete_item_success(db_session, async_db):
     """Verifies that an item can be deleted via the API.
 
     Args:
         db_session: The database session fixture.
+        async_db: The asyncio database dependency override.
     """
     mock_user = User(id=1, email="test@owner.com", hashed_password="pw")
     db_session.add(mock_user)
@@ -121,7 +377,7 @@ def test_delete_item_success(db_session):
     db_session.commit()
     item_id = item.id
 
-    client = setup_app(db_session, mock_user)
+    client = setup_app(async_db, mock_user)
 
     # Mock os.remove to avoid filesystem errors
     with patch("os.remove") as mock_remove:
@@ -129,19 +385,315 @@ def test_delete_item_success(db_session):
             response = client.delete(f"/closet/{item_id}")
     
     assert response.status_code == 204
+    assert recent_writes.is_recent(mock_user.id)
     
     # Check DB
     assert db_session.query(Item).filter_by(id=item_id).first() is None
 
 
-def test_delete_item_not_found(db_session):
+def test_delete_item_not_found(db_session, async_db):
     """Verifies 404 error when deleting a non-existent item.
 
     Args:
         db_session: The database session fixture.
+        async_db: The asyncio database dependency override.
     """
     mock_user = User(id=1, email="test@owner.com", hashed_password="pw")
-    client = setup_app(db_session, mock_user)
+    client = setup_app(async_db, mock_user)
 
     response = client.delete("/closet/9999")
-    assert response.status_code == 404
\ No newline at end of file
+    assert response.status_code == 404
+
+def test_bulk_delete_items(db_session, tmp_path, async_db):
+    """Verifies that several items are deleted in one request.
+
+    Args:
+        db_session: The database session fixture.
+        async_db: The asyncio database dependency override.
+        tmp_path: Temporary directory used as the upload directory.
+    """
+    mock_user = User(id=1, email="test@owner.com", hashed_password="pw")
+    other_user = User(id=2, email="other@owner.com", hashed_password="pw")
+    db_session.add_all([mock_user, other_user])
+    db_session.commit()
+    client = setup_app(async_db, mock_user, image_dir=tmp_path)
+
+    ids = []
+    for description in ["Coat", "Scarf"]:
+        files = {"file": ("img.jpg", io.BytesIO(JPEG_BYTES), "image/jpeg")}
+        response = client.post(
+            "/closet/upload", files=files, data={"description": description}
+        )
+        ids.append(response.json()["id"])
+    foreign = Item(description="Not mine", image_filename="x.jpg", owner_id=2)
+    db_session.add(foreign)
+    db_session.commit()
+    foreign_id = foreign.id
+
+    response = client.request(
+        "DELETE", "/closet", json={"ids": ids + [foreign_id, 9999]}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"deleted": sorted(ids)}
+    assert [item.id for item in db_session.query(Item)] == [foreign_id]
+    assert [p for p in tmp_path.rglob("*") if p.is_file()] == []
+
+    response = client.request("DELETE", "/closet", json={"ids": []})
+    assert response.status_code == 422
+
+
+def test_get_closet_conditional_request(db_session, async_db):
+    """Verifies ETag revalidation of the closet listing.
+
+    Args:
+        db_session: The database session fixture.
+        async_db: The asyncio database dependency override.
+    """
+    mock_user = User(id=1, email="test@owner.com", hashed_password="pw")
+    db_session.add(mock_user)
+    db_session.add_all(
+        [Item(description=f"Item {i}", owner_id=1) for i in range(3)]
+    )
+    db_session.commit()
+    client = setup_app(async_db, mock_user)
+
+    first = client.get("/closet", params={"limit": 2})
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        cached = client.get(
+            "/closet", params={"limit": 2}, headers={"If-None-Match": etag}
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+    assert not any("FROM items" in statement for statement in statements)
+
+    headers = {"If-None-Match": etag}
+    other_page = client.get("/closet", params={"limit": 1}, headers=headers)
+    assert other_page.status_code == 200
+
+    item_id = first.json()["items"][0]["id"]
+    assert client.delete(f"/closet/{item_id}").status_code == 204
+    changed = client.get("/closet", params={"limit": 2}, headers=headers)
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+def test_get_closet_omits_etag_while_variants_are_pending(
+    db_session, tmp_path, async_db
+):
+    """Verifies that pages with unprocessed images are not given a validator.
+
+    Args:
+        db_session: The database session fixture.
+        async_db: The asyncio database dependency override.
+        tmp_path: Temporary directory used as the upload directory.
+    """
+    mock_user = User(id=1, email="test@owner.com", hashed_password="pw")
+    db_session.add(mock_user)
+    db_session.add(Item(description="Coat", image_filename="coat.jpg", owner_id=1))
+    db_session.commit()
+    client = setup_app(async_db, mock_user, image_dir=tmp_path)
+
+    assert "ETag" not in client.get("/closet").headers
+    assert "ETag" in client.get("/closet", params={"fields": "tags"}).headers
+
+
+def test_search_closet(db_session, async_db):
+    """Verifies closet search with offset pagination.
+
+    Args:
+        db_session: The database session fixture.
+        async_db: The asyncio database dependency override.
+    """
+    mock_user = User(id=1, email="test@owner.com", hashed_password="pw")
+    db_session.add(mock_user)
+    db_session.add_all(
+        [
+            Item(description="Wool coat", owner_id=1),
+            Item(description="Wool hat", owner_id=1),
+            Item(description="Sandals", owner_id=1),
+        ]
+    )
+    db_session.commit()
+    client = setup_app(async_db, mock_user)
+
+    first = client.get("/closet/search", params={"q": "woo", "limit": 1})
+    assert first.status_code == 200
+    assert [item["description"] for item in first.json()["items"]] == ["Wool hat"]
+    assert first.json()["next_offset"] == 1
+
+    second = client.get(
+        "/closet/search", params={"q": "woo", "limit": 1, "offset": 1}
+    )
+    assert [item["description"] for item in second.json()["items"]] == ["Wool coat"]
+    assert second.json()["next_offset"] is None
+
+    assert client.get("/closet/search", params={"q": ""}).status_code == 422
+
+
+def test_export_and_import_closet(db_session, async_db, tmp_path):
+    """Verifies that an export can be imported into another closet.
+
+    Args:
+        db_session: The database session fixture.
+        async_db: The asyncio database dependency override.
+        tmp_path: Temporary directory used as the image directory.
+    """
+    owner = User(id=1, email="test@owner.com", hashed_password="pw")
+    receiver = User(id=2, email="test@receiver.com", hashed_password="pw")
+    cold = WeatherTag(name="Cold")
+    coat = Item(description="Coat", image_filename="coat.jpg", owner=owner)
+    tee = Item(description="Tee", owner=owner)
+    db_session.add_all([owner, receiver, cold, coat, tee])
+    db_session.add(ClothingWeather(item=coat, tag=cold, confidence=90))
+    db_session.commit()
+
+    client = setup_app(async_db, owner, image_dir=tmp_path)
+    response = client.get("/closet/export")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = response.text.splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {
+            "id": coat.id,
+            "description": "Coat",
+            "image_filename": "coat.jpg",
+            "tags": {"Cold": 90},
+        },
+        {"id": tee.id, "description": "Tee", "image_filename": None, "tags": {}},
+    ]
+
+    mock_ai = MagicMock()
+    mock_ai.classify_batch.return_value = [{"Rain": 95, "Cold": 5}]
+    body = "\n".join(
+        [*lines, '{"description": "Umbrella"}', "not json", '{"tags": {}}']
+    )
+    client = setup_app(async_db, receiver, mock_ai, image_dir=tmp_path)
+    response = client.post("/closet/import", content=body.encode())
+
+    assert response.status_code == 200
+    result = response.json()
+    assert result["imported"] == 3
+    assert result["rejected"] == 2
+    assert [error["line"] for error in result["errors"]] == [4, 5]
+    mock_ai.classify_batch.assert_called_once()
+    assert mock_ai.classify_batch.call_args.args[0] == ["Umbrella"]
+
+    db_session.expire_all()
+    imported = db_session.scalars(
+        select(Item).where(Item.owner_id == receiver.id).order_by(Item.id)
+    ).all()
+    assert [(item.description, item.tag_names) for item in imported] == [
+        ("Coat", ["Cold"]),
+        ("Tee", []),
+        ("Umbrella", ["Rain"]),
+    ]
+    assert imported[0].image_filename is None
+    assert recent_writes.is_recent(receiver.id)
+
+
+def test_retag_closet_runs_on_the_worker(db_session, async_db):
+    """Verifies that re-tagging is queued and rewrites the user's items.
+
+    Args:
+        db_session: The database session fixture.
+        async_db: The asyncio database dependency override.
+    """
+    owner = User(id=1, email="test@owner.com", hashed_password="pw")
+    other = User(id=2, email="test@other.com", hashed_password="pw")
+    hot = WeatherTag(name="Hot")
+    coat = Item(description="Coat", owner=owner, tag_names=["Hot"])
+    vest = Item(description="Vest", owner=other, tag_names=["Hot"])
+    db_session.add_all([owner, other, hot, coat, vest])
+    db_session.add_all(
+        [
+            ClothingWeather(item=coat, tag=hot, confidence=80),
+            ClothingWeather(item=vest, tag=hot, confidence=80),
+        ]
+    )
+    db_session.commit()
+
+    factory = sessionmaker(bind=db_session.get_bind(), autoflush=False)
+    app.dependency_overrides[get_session_factory] = lambda: factory
+    mock_ai = MagicMock()
+    mock_ai.classify_batch.return_value = [{"Cold": 95, "Hot": 5}]
+    client = setup_app(async_db, owner, mock_ai)
+    app.state.retag_worker = RetagWorker(max_workers=1, max_queued=0)
+
+    response = client.post("/closet/retag")
+
+    assert response.status_code == 202
+    assert response.json() == {"job": "retag:user:1"}
+    app.state.retag_worker.executor.shutdown(wait=True)
+    db_session.expire_all()
+    assert db_session.get(Item, coat.id).tag_names == ["Cold"]
+    assert db_session.get(Item, vest.id).tag_names == ["Hot"]
+
+    app.state.ai_service = None
+    assert client.post("/closet/retag").status_code == 503
+    app.state.retag_worker = None
+    app.dependency_overrides.pop(get_session_factory)
+
+
+def test_retag_closet_rejects_jobs_while_busy(db_session, async_db):
+    """Verifies 409 for a job already running and 429 when the queue is full.
+
+    Args:
+        db_session: The database session fixture.
+        async_db: The asyncio database dependency override.
+    """
+    owner = User(id=1, email="test@owner.com", hashed_password="pw")
+    other = User(id=2, email="test@other.com", hashed_password="pw")
+    db_session.add_all(
+        [
+            owner,
+            other,
+            Item(description="Coat", owner=owner),
+            Item(description="Vest", owner=other),
+        ]
+    )
+    db_session.commit()
+
+    started, release = threading.Event(), threading.Event()
+
+    def classify(texts, *args, **kwargs):
+        started.set()
+        release.wait(5)
+        return [{"Cold": 95} for _ in texts]
+
+    factory = sessionmaker(bind=db_session.get_bind(), autoflush=False)
+    app.dependency_overrides[get_session_factory] = lambda: factory
+    mock_ai = MagicMock()
+    mock_ai.classify_batch.side_effect = classify
+    client = setup_app(async_db, owner, mock_ai)
+    app.state.retag_worker = RetagWorker(max_workers=1, max_queued=0)
+
+    try:
+        assert client.post("/closet/retag").status_code == 202
+        assert started.wait(5)
+        assert client.post("/closet/retag").status_code == 409
+
+        app.dependency_overrides[get_current_user] = lambda: other
+        response = client.post("/closet/retag")
+        assert response.status_code == 429
+        assert "Retry-After" in response.headers
+    finally:
+        release.set()
+        app.state.retag_worker.executor.shutdown(wait=True)
+        app.state.retag_worker = None
+        app.dependency_overrides.pop(get_session_factory)
@@ -2,16 +2,21 @@
 
 import pytest
 from fastapi import HTTPException
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.security import create_access_token
-from app.crud.user_repo import create_user
+from app.crud.user_cache import user_cache
+from app.crud.user_repo import create_user, revoke_tokens
 from app.routers.auth import get_current_user
 from app.schemas.user import UserCreate
 
 
 @pytest.mark.asyncio
-async def test_get_current_user_valid(db_session: Session):
+async def test_get_current_user_valid(
+    db_session: Session, async_db_session: AsyncSession
+):
     """Verifies that a valid token returns the correct user instance."""
     email = "valid_user@test.com"
     password = "StrongPassword1!"
@@ -20,28 +25,85 @@ async def test_get_current_user_valid(db_session: Session):
 
     token = create_access_token(subject=email)
 
-    current_user = await get_current_user(token=token, db=db_session)
+    current_user = await get_current_user(token=token, db=async_db_session)
 
     assert current_user.id == user.id
     assert current_user.email == email
 
 
 @pytest.mark.asyncio
-async def test_get_current_user_invalid_token(db_session: Session):
+async def test_get_current_user_invalid_token(
+    db_session: Session, async_db_session: AsyncSession
+):
     """Verifies that an invalid token raises an HTTPException."""
     with pytest.raises(HTTPException) as exc:
-        await get_current_user(token="invalid.token.string", db=db_session)
+        await get_current_user(token="invalid.token.string", db=async_db_session)
 
     assert exc.value.status_code == 401
     assert exc.value.detail == "Could not validate credentials"
 
 
 @pytest.mark.asyncio
-async def test_get_current_user_user_not_found(db_session: Session):
+async def test_get_current_user_user_not_found(
+    db_session: Session, async_db_session: AsyncSession
+):
     """Verifies that a token for a non-existent user raises an HTTPException."""
     token = create_access_token(subject="ghost@test.com")
 
     with pytest.raises(HTTPException) as exc:
-        await get_current_user(token=token, db=db_session)
+        await get_current_user(token=token, db=async_db_session)
 
-    assert exc.value.status_code == 401
\ No newline at end of file
+    assert exc.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_uses_cache(
+    db_session: Session, async_db_session: AsyncSession
+):
+    """Verifies that tokens with a user ID authenticate without queries."""
+    user = create_user(
+        db_session, UserCreate(email="cached@test.com", password="StrongPassword1!")
+    )
+    token = create_access_token(user.email, user_id=user.id, token_version=0)
+    user_id = user.id
+
+    await get_current_user(token=token, db=async_db_session)
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = async_db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        current_user = await get_current_user(token=token, db=async_db_session)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert current_user.id == user_id
+    assert current_user.email == "cached@test.com"
+    assert statements == []
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_rejects_revoked_token(
+    db_session: Session, async_db_session: AsyncSession
+):
+    """Verifies that bumping the token version revokes issued tokens."""
+    user = create_user(
+        db_session, UserCreate(email="revoked@test.com", password="StrongPassword1!")
+    )
+    token = create_access_token(user.email, user_id=user.id, token_version=0)
+    user_id = user.id
+
+    revoke_tokens(db_session, user_id)
+    user_cache.invalidate(user_id)
+
+    with pytest.raises(HTTPException) as exc:
+        await get_current_user(token=token, db=async_db_session)
+    assert exc.value.status_code == 401
+
+    forged = create_access_token("other@test.com", user_id=user_id, token_version=1)
+    with pytest.raises(HTTPException):
+        await get_current_user(token=forged, db=async_db_session)
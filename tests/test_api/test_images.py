@@ -0,0 +1,78 @@
+"""Integration tests for image serving endpoints."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.routers import images
+from app.routers.closet import get_image_store
+from app.services.image_storage import LocalImageStore
+
+DIGEST = "ab" * 32
+KEY = f"ab/ab/{DIGEST}.jpg"
+CONTENT = b"\xff\xd8\xff" + bytes(range(256)) * 4
+
+
+def setup_app(tmp_path):
+    """Configures a test app serving images from a temporary store.
+
+    Args:
+        tmp_path: Temporary directory backing the image store.
+
+    Returns:
+        TestClient: A configured test client.
+    """
+    store = LocalImageStore(tmp_path)
+    blob = store.path(KEY)
+    blob.parent.mkdir(parents=True)
+    blob.write_bytes(CONTENT)
+
+    app = FastAPI()
+    app.include_router(images.router)
+    app.dependency_overrides[get_image_store] = lambda: store
+    return TestClient(app)
+
+
+def test_image_served_with_immutable_caching(tmp_path):
+    """Verifies caching headers and the content-derived ETag."""
+    client = setup_app(tmp_path)
+
+    response = client.get(f"/images/{KEY}")
+
+    assert response.status_code == 200
+    assert response.content == CONTENT
+    assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+    assert response.headers["etag"] == f'"{DIGEST}.jpg"'
+    assert response.headers["content-type"] == "image/jpeg"
+
+
+def test_conditional_request_returns_not_modified(tmp_path):
+    """Verifies that a matching If-None-Match yields an empty 304."""
+    client = setup_app(tmp_path)
+    etag = client.get(f"/images/{KEY}").headers["etag"]
+
+    response = client.get(f"/images/{KEY}", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_byte_range_request(tmp_path):
+    """Verifies partial content responses for byte ranges."""
+    client = setup_app(tmp_path)
+
+    response = client.get(f"/images/{KEY}", headers={"Range": "bytes=0-9"})
+
+    assert response.status_code == 206
+    assert response.content == CONTENT[:10]
+    assert response.headers["content-range"] == f"bytes 0-9/{len(CONTENT)}"
+
+
+def test_missing_and_escaping_paths_are_not_found(tmp_path):
+    """Verifies that unknown keys and traversal attempts return 404."""
+    client = setup_app(tmp_path)
+    (tmp_path.parent / "secret.txt").write_text("secret")
+
+    assert client.get("/images/ab/ab/missing.jpg").status_code == 404
+    assert client.get("/images/ab").status_code == 404
+    assert client.get("/images/..%2Fsecret.txt").status_code == 404
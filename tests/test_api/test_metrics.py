@@ -0,0 +1,98 @@
+"""Integration tests for metrics endpoints."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.database import session
+from app.routers import metrics
+from app.services.login_throttle import LoginThrottle
+from app.services.password_service import PasswordHasher
+
+TOKEN = "metrics-secret"
+AUTH = {"Authorization": f"Bearer {TOKEN}"}
+
+
+@pytest.fixture(autouse=True)
+def metrics_token(monkeypatch):
+    """Configures the token that the metrics endpoints require.
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr(settings, "metrics_token", TOKEN)
+
+
+def test_auth_metrics():
+    """Verifies that the password pool and throttle statistics are exposed."""
+    app = FastAPI()
+    app.include_router(metrics.router)
+    app.state.password_hasher = PasswordHasher(max_workers=2, max_queued=8)
+    app.state.login_throttle = LoginThrottle(
+        max_per_account=5, max_per_ip=50, window=60
+    )
+    app.state.login_throttle.record_failure("user@test.com", "1.1.1.1")
+
+    response = TestClient(app).get("/metrics/auth", headers=AUTH)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["password_hasher"]["workers"] == 2
+    assert data["password_hasher"]["queue_wait_seconds"]["count"] == 0
+    assert data["login_throttle"] == {"tracked_accounts": 1, "tracked_ips": 1}
+    app.state.password_hasher.shutdown()
+
+
+def test_db_pool_metrics():
+    """Verifies that the connection pool statistics are exposed."""
+    app = FastAPI()
+    app.include_router(metrics.router)
+
+    response = TestClient(app).get("/metrics/db-pool", headers=AUTH)
+
+    assert response.status_code == 200
+    sync = response.json()["sync"]
+    assert sync["size"] == 2
+    assert set(sync) >= {"checkouts", "timeouts", "invalidations", "wait_seconds"}
+
+
+def test_db_pool_metrics_omit_replica_hosts(monkeypatch):
+    """Verifies that replica pools are reported without their host names.
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture.
+    """
+    replica = MagicMock()
+    replica.url.host = "replica-1.internal"
+    replica.pool.stats.return_value = {"size": 3}
+    replicas = MagicMock(engines=[replica])
+    monkeypatch.setattr(session, "get_replica_set", MagicMock(return_value=replicas))
+    session.get_replica_set.cache_info.return_value.currsize = 1
+    app = FastAPI()
+    app.include_router(metrics.router)
+
+    response = TestClient(app).get("/metrics/db-pool", headers=AUTH)
+
+    assert response.json()["replicas"] == [{"size": 3}]
+    assert "replica-1.internal" not in response.text
+
+
+def test_metrics_require_token(monkeypatch):
+    """Verifies that metrics are hidden from clients without the token.
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture.
+    """
+    app = FastAPI()
+    app.include_router(metrics.router)
+    client = TestClient(app)
+
+    assert client.get("/metrics/auth").status_code == 401
+    wrong = {"Authorization": "Bearer guess"}
+    assert client.get("/metrics/db-pool", headers=wrong).status_code == 401
+
+    monkeypatch.setattr(settings, "metrics_token", None)
+    assert client.get("/metrics/auth", headers=AUTH).status_code == 404
@@ -8,13 +8,13 @@ from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 from app.database.models import ClothingWeather, Item, User, WeatherTag
-from app.database.session import get_db
+from app.database.session import get_async_db
 from app.routers import recommendation
-from app.routers.auth import get_current_user
+from app.routers.auth import get_current_user, get_user_read_db
 from app.schemas.weather import WeatherData
 
 
-def test_recommend_endpoint(db_session: Session):
+def test_recommend_endpoint(db_session: Session, async_db):
     """Verifies successful recommendation generation flow."""
     user = User(email="rec_test@example.com", hashed_password="pw")
     db_session.add(user)
@@ -53,7 +53,8 @@ def test_recommend_endpoint(db_session: Session):
     app.dependency_overrides[recommendation.get_weather_service] = (
         lambda: mock_weather_service
     )
-    app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_async_db] = async_db
+    app.dependency_overrides[get_user_read_db] = async_db
     app.dependency_overrides[get_current_user] = lambda: user
 
     client = TestClient(app)
@@ -66,8 +67,18 @@ def test_recommend_endpoint(db_session: Session):
     assert len(data["items"]) == 1
     assert data["items"][0]["description"] == "Heavy Raincoat"
 
+    etag = response.headers["ETag"]
+    cached = client.get("/recommend/London", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
 
-def test_recommend_city_not_found(db_session: Session):
+    db_session.add(Item(description="Rain boots", owner=user))
+    user.closet_version += 1
+    db_session.commit()
+    changed = client.get("/recommend/London", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+
+
+def test_recommend_city_not_found(db_session: Session, async_db):
     """Verifies that a non-existent city returns a 404 error."""
     app = FastAPI()
     app.include_router(recommendation.router)
@@ -84,7 +95,8 @@ def test_recommend_city_not_found(db_session: Session):
     app.dependency_overrides[recommendation.get_weather_service] = (
         lambda: mock_weather_service
     )
-    app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_async_db] = async_db
+    app.dependency_overrides[get_user_read_db] = async_db
     app.dependency_overrides[get_current_user] = lambda: user
 
     client = TestClient(app)
@@ -94,7 +106,7 @@ def test_recommend_city_not_found(db_session: Session):
     assert response.json()["detail"] == "City 'Atlantis' not found."
 
 
-def test_recommend_ai_service_unavailable(db_session: Session):
+def test_recommend_ai_service_unavailable(db_session: Session, async_db):
     """Verifies that unavailable AI service returns a 503 error."""
     app = FastAPI()
     app.include_router(recommendation.router)
@@ -115,7 +127,8 @@ def test_recommend_ai_service_unavailable(db_session: Session):
     app.dependency_overrides[recommendation.get_weather_service] = (
         lambda: mock_weather_service
     )
-    app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_async_db] = async_db
+    app.dependency_overrides[get_user_read_db] = async_db
     app.dependency_overrides[get_current_user] = lambda: user
 
     app.state.ai_service = None
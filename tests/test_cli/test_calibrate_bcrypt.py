@@ -0,0 +1,38 @@
+"""Unit tests for the bcrypt calibration tool."""
+
+from app.cli import calibrate_bcrypt
+
+
+def fake_timings(monkeypatch, base_seconds):
+    """Replaces the benchmark with timings that double per round.
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture.
+        base_seconds (float): The simulated duration at 10 rounds.
+    """
+    monkeypatch.setattr(
+        calibrate_bcrypt,
+        "measure_rounds",
+        lambda rounds, samples: base_seconds * 2 ** (rounds - 10),
+    )
+
+
+def test_calibrate_picks_highest_cost_within_target(monkeypatch):
+    """Verifies that the last cost factor under the target is recommended."""
+    fake_timings(monkeypatch, 0.05)
+
+    recommended, timings = calibrate_bcrypt.calibrate(0.25, 10, 1)
+
+    assert recommended == 12
+    assert list(timings) == [10, 11, 12, 13]
+
+
+def test_main_prints_setting_and_falls_back_to_minimum(monkeypatch, capsys):
+    """Verifies the output when even the minimum cost is too slow."""
+    fake_timings(monkeypatch, 0.5)
+
+    assert calibrate_bcrypt.main(["--target-ms", "100", "--min-rounds", "10"]) == 0
+
+    output = capsys.readouterr().out
+    assert "exceeds" in output
+    assert output.strip().endswith("BCRYPT_ROUNDS=10")
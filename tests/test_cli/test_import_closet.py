@@ -0,0 +1,38 @@
+"""Unit tests for the closet import tool."""
+
+import io
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.cli.import_closet import import_stream
+from app.crud.item_repo import get_items_by_user
+from app.database.models import User
+from app.services.image_storage import LocalImageStore
+
+
+def test_import_stream_inserts_items_in_batches(db_session: Session, tmp_path):
+    """Verifies that items are committed batch by batch and errors reported."""
+    user = User(email="cli@example.com", hashed_password="pw")
+    db_session.add(user)
+    db_session.commit()
+    commits = []
+    event.listen(db_session, "after_commit", lambda session: commits.append(1))
+    source = io.BytesIO(
+        b"".join(
+            b'{"description": "Item %d", "tags": {"Cold": 60}}\n' % i
+            for i in range(5)
+        )
+        + b"broken\n"
+    )
+
+    imported, closet_import = import_stream(
+        db_session, user.id, source, LocalImageStore(tmp_path), batch_size=2
+    )
+
+    assert imported == 5
+    assert len(commits) == 3
+    assert [error["line"] for error in closet_import.errors] == [6]
+    items = get_items_by_user(db_session, user.id)
+    assert [item.description for item in items] == [f"Item {i}" for i in range(5)]
+    assert all(item.tag_names == ["Cold"] for item in items)
@@ -0,0 +1,18 @@
+"""Unit tests for ETag helpers."""
+
+from app.core.etags import etag_matches, weak_etag
+
+
+def test_weak_etag_is_stable_and_distinct():
+    """Verifies that equal inputs give equal tags and different ones differ."""
+    assert weak_etag(1, 2, "a") == weak_etag(1, 2, "a")
+    assert weak_etag(1, 2, "a") != weak_etag(1, 3, "a")
+    assert weak_etag(1).startswith('W/"')
+
+
+def test_etag_matches_uses_weak_comparison():
+    """Verifies matching of lists, wildcards and weak/strong forms."""
+    assert etag_matches('"a", W/"b"', '"b"')
+    assert etag_matches('"b"', 'W/"b"')
+    assert etag_matches("*", '"x"')
+    assert not etag_matches('"a"', '"b"')
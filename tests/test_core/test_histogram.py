@@ -0,0 +1,17 @@
+"""Unit tests for in-process metrics."""
+
+from app.core.metrics import Histogram
+
+
+def test_histogram_buckets_are_cumulative():
+    """Verifies counts, sum, max and cumulative buckets."""
+    histogram = Histogram(buckets=(0.01, 0.1))
+    for value in (0.005, 0.05, 0.5):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+
+    assert snapshot["count"] == 3
+    assert snapshot["max"] == 0.5
+    assert abs(snapshot["sum"] - 0.555) < 1e-9
+    assert snapshot["buckets"] == {"0.01": 1, "0.1": 2, "+Inf": 3}
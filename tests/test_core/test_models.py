@@ -42,6 +42,25 @@ def test_clothing_weather_confidence_score(db_session: Session):
     assert item.weather_links[0].confidence == 0.98
 
 
+def test_item_tag_names_follow_orm_link_changes(db_session: Session):
+    """Verifies that tag links written through the ORM update `tag_names`."""
+    user = User(email="names@example.com", hashed_password="pw")
+    item = Item(description="Boots", owner=user)
+    rain, cold = WeatherTag(name="Rain"), WeatherTag(name="Cold")
+    db_session.add_all([user, item, rain, cold])
+    db_session.commit()
+    assert item.tag_names == []
+
+    db_session.add(ClothingWeather(item=item, tag=rain, confidence=80))
+    db_session.add(ClothingWeather(item_id=item.id, tag_id=cold.id, confidence=60))
+    db_session.commit()
+    assert item.tag_names == ["Rain", "Cold"]
+
+    db_session.delete(db_session.get(ClothingWeather, (item.id, rain.id)))
+    db_session.commit()
+    assert item.tag_names == ["Cold"]
+
+
 def test_user_email_must_be_unique(db_session: Session):
     """Verifies uniqueness constraint on user email."""
     user1 = User(email="duplicate@example.com", hashed_password="pw1")
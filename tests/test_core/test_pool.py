@@ -0,0 +1,112 @@
+"""Unit tests for connection pool instrumentation and sizing."""
+
+import sqlite3
+
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from app.database.pool import InstrumentedQueuePool, ping_idle_connections, pool_sizing
+
+
+class FlakyConnection:
+    """A SQLite connection whose cursors fail once it is marked dead."""
+
+    def __init__(self):
+        """Opens an in-memory database."""
+        self.connection = sqlite3.connect(":memory:", check_same_thread=False)
+        self.alive = True
+
+    def cursor(self):
+        """Opens a cursor, failing like a dropped server connection."""
+        if not self.alive:
+            raise sqlite3.OperationalError("server has gone away")
+        return self.connection.cursor()
+
+    def __getattr__(self, name):
+        """Delegates everything else to the SQLite connection."""
+        return getattr(self.connection, name)
+
+
+def flaky_engine(connections: list, **kwargs):
+    """Creates an instrumented engine over `FlakyConnection`s.
+
+    Args:
+        connections (list): Receives every connection the pool opens.
+        **kwargs: Extra `create_engine` arguments.
+
+    Returns:
+        Engine: The engine.
+    """
+
+    def creator():
+        connection = FlakyConnection()
+        connections.append(connection)
+        return connection
+
+    return create_engine(
+        "sqlite://",
+        creator=creator,
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        **kwargs,
+    )
+
+
+def test_pool_sizing_follows_worker_count():
+    """Verifies that the node budget is split across workers."""
+    assert pool_sizing(34, 1, reserved=4) == (15, 15)
+    assert pool_sizing(34, 4, reserved=4) == (2, 2)
+    assert pool_sizing(10, 16) == (1, 1)
+
+
+def test_instrumented_pool_counts_checkouts_and_timeouts():
+    """Verifies the checkout counters, timeouts and wait histogram."""
+    engine = flaky_engine([], pool_timeout=0.01)
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+
+    stats = engine.pool.stats()
+    assert stats["size"] == 1
+    assert stats["checked_out"] == 0
+    assert stats["checkouts"] == 1
+    assert stats["timeouts"] == 1
+    assert stats["connects"] == 1
+    assert stats["wait_seconds"]["count"] == 2
+    assert stats["wait_seconds"]["max"] >= 0.01
+    assert stats["checkout_seconds"]["count"] == 2
+
+
+def test_metrics_survive_pool_recreation():
+    """Verifies that disposing the engine keeps the accumulated metrics."""
+    engine = flaky_engine([])
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+    engine.dispose()
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+    assert engine.pool.stats()["checkouts"] == 2
+
+
+def test_idle_ping_replaces_dead_connections():
+    """Verifies that an idle dead connection is replaced on checkout."""
+    connections = []
+    engine = flaky_engine(connections)
+    ping_idle_connections(engine, idle_seconds=0)
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+    connections[0].alive = False
+
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT 1")).scalar() == 1
+
+    stats = engine.pool.stats()
+    assert len(connections) == 2
+    assert stats["connects"] == 2
+    assert stats["invalidations"] == 1
@@ -0,0 +1,121 @@
+"""Unit tests for per-request SQL statement tracking."""
+
+import logging
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.database import query_stats
+from app.database.query_stats import (
+    QueryStats,
+    QueryStatsMiddleware,
+    install_query_tracking,
+    log_query_stats,
+    track_queries,
+)
+
+
+def test_track_queries_counts_statements_of_the_context(tmp_path):
+    """Verifies counting, timing and that untracked statements are ignored."""
+    install_query_tracking()
+    engine = create_engine(f"sqlite:///{tmp_path / 'stats.db'}")
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        with track_queries() as stats:
+            for i in range(3):
+                connection.execute(text("SELECT :i"), {"i": i})
+            connection.execute(text("SELECT 2"))
+        connection.execute(text("SELECT 3"))
+
+    assert stats.count == 4
+    assert stats.seconds > 0
+    assert stats.repeated(3) == [("SELECT ?", 3)]
+    assert stats.repeated(4) == []
+    engine.dispose()
+
+
+def test_track_queries_keeps_nothing_on_connections_after_errors(tmp_path):
+    """Verifies that failing statements leave no state on the connection."""
+    install_query_tracking()
+    engine = create_engine(f"sqlite:///{tmp_path / 'stats.db'}")
+
+    with engine.connect() as connection, track_queries() as stats:
+        for _ in range(3):
+            with pytest.raises(OperationalError):
+                connection.execute(text("SELECT * FROM missing"))
+        connection.execute(text("SELECT 1"))
+        assert "query_started" not in connection.info
+
+    assert stats.count == 1
+    assert stats.repeated(1) == [("SELECT 1", 1)]
+    engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_track_queries_follows_asyncio_sessions(tmp_path):
+    """Verifies that statements of the asyncio engine reach the context."""
+    install_query_tracking()
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'stats.db'}")
+
+    with track_queries() as stats:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    assert stats.count >= 1
+    assert "SELECT 1" in dict(stats.repeated(1))
+    await engine.dispose()
+
+
+def test_log_query_stats(caplog):
+    """Verifies warnings for too many and for repeated statements."""
+    stats = QueryStats()
+    for _ in range(3):
+        stats.record("SELECT * FROM tags WHERE id = ?", 0.001)
+    stats.record("SELECT 1", 0.001)
+
+    with caplog.at_level(logging.WARNING):
+        log_query_stats("GET", "/closet", stats, max_statements=10, repeat_threshold=5)
+    assert caplog.records == []
+
+    with caplog.at_level(logging.WARNING):
+        log_query_stats("GET", "/closet", stats, max_statements=3, repeat_threshold=3)
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages[0].startswith("GET /closet ran 4 statements")
+    assert "N+1" in messages[1]
+    assert "SELECT * FROM tags WHERE id = ?" in messages[1]
+
+
+def test_middleware_logs_after_streamed_body(tmp_path):
+    """Verifies that statements run while streaming a body are counted."""
+    install_query_tracking()
+    engine = create_engine(f"sqlite:///{tmp_path / 'stats.db'}")
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware, max_statements=0, repeat_threshold=2)
+
+    def rows():
+        with engine.connect() as connection:
+            for i in range(3):
+                yield str(connection.execute(text("SELECT :i"), {"i": i}).scalar())
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(rows())
+
+    logged = []
+
+    def record(method, path, stats, **thresholds):
+        logged.append((method, path, stats.count, dict(stats.repeated(3))))
+
+    with patch.object(query_stats, "log_query_stats", side_effect=record):
+        response = TestClient(app).get("/stream")
+
+    assert response.text == "012"
+    assert logged == [("GET", "/stream", 3, {"SELECT ?": 3})]
+    engine.dispose()
@@ -0,0 +1,99 @@
+"""Unit tests for read replica routing."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.database import session
+from app.database.replicas import RecentWrites, ReplicaSet
+
+
+def test_replica_set_round_robin_skips_failed_replicas():
+    """Verifies rotation order and that failed replicas are left out."""
+    first, second, third = MagicMock(), MagicMock(), MagicMock()
+    replicas = ReplicaSet([first, second, third], retry_interval=60)
+
+    assert [replicas.choose() for _ in range(4)] == [first, second, third, first]
+
+    replicas.mark_down(second)
+    assert [replicas.choose() for _ in range(3)] == [third, first, third]
+
+    replicas.mark_down(first)
+    replicas.mark_down(third)
+    assert replicas.choose() is None
+    assert ReplicaSet([]).choose() is None
+
+
+def test_replica_set_retries_after_interval():
+    """Verifies that a failed replica rejoins once its retry interval ends."""
+    replica = MagicMock()
+    replicas = ReplicaSet([replica], retry_interval=0)
+
+    replicas.mark_down(replica)
+
+    assert replicas.choose() is replica
+
+
+@pytest.mark.asyncio
+async def test_replica_set_health_check(tmp_path):
+    """Verifies that the health check takes unreachable replicas out."""
+    healthy = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    broken = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'replica.db'}"
+    )
+    replicas = ReplicaSet([broken, healthy], retry_interval=60)
+
+    await replicas.check()
+
+    assert [replicas.choose() for _ in range(2)] == [healthy, healthy]
+    await healthy.dispose()
+    await broken.dispose()
+
+
+def test_recent_writes_window():
+    """Verifies that writes are remembered for the configured window."""
+    recent = RecentWrites(window=60)
+    recent.record(1)
+
+    assert recent.is_recent(1)
+    assert not recent.is_recent(2)
+
+    expired = RecentWrites(window=0)
+    expired.record(1)
+    assert not expired.is_recent(1)
+
+
+@pytest.mark.asyncio
+async def test_read_session_routing(tmp_path, monkeypatch):
+    """Verifies replica reads, read-your-writes and failure handling."""
+    primary = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}")
+    replica = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    replicas = ReplicaSet([replica], retry_interval=60)
+    recent = RecentWrites(window=60)
+
+    monkeypatch.setattr(session, "get_async_engine", lambda: primary)
+    monkeypatch.setattr(
+        session, "get_async_sessionmaker", lambda: async_sessionmaker(primary)
+    )
+    monkeypatch.setattr(session, "get_replica_set", lambda: replicas)
+    monkeypatch.setattr(session, "recent_writes", recent)
+
+    recent.record(7)
+    async with session.read_session() as db:
+        assert db.bind is replica
+    async with session.read_session(8) as db:
+        assert db.bind is replica
+    async with session.read_session(7) as db:
+        assert db.bind is primary
+
+    with pytest.raises(OperationalError):
+        async with session.read_session(8):
+            raise OperationalError("SELECT 1", {}, Exception("gone away"))
+
+    async with session.read_session(8) as db:
+        assert db.bind is primary
+
+    await primary.dispose()
+    await replica.dispose()
@@ -0,0 +1,16 @@
+"""Unit tests for the orjson response class."""
+
+from app.core.responses import FastJSONResponse
+
+
+def test_fast_json_response_renders_compact_json():
+    """Verifies the encoding, media type and headers of the response."""
+    content = {"items": [{"id": 1, "tags": ["Cold"]}], "next": None, 2: "é"}
+
+    response = FastJSONResponse(content, headers={"ETag": 'W/"1"'})
+
+    assert response.media_type == "application/json"
+    assert response.headers["ETag"] == 'W/"1"'
+    assert response.body == (
+        '{"items":[{"id":1,"tags":["Cold"]}],"next":null,"2":"é"}'.encode()
+    )
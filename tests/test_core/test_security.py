@@ -1,9 +1,15 @@
 """Unit tests for security utilities."""
 
 from jose import jwt
+from passlib.hash import bcrypt
 
 from app.core.config import settings
-from app.core.security import create_access_token, get_password_hash, verify_password
+from app.core.security import (
+    create_access_token,
+    get_password_hash,
+    verify_and_update_password,
+    verify_password,
+)
 
 
 def test_password_hashing():
@@ -34,4 +40,32 @@ def test_access_token_creation():
     payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
 
     assert payload["sub"] == email
-    assert "exp" in payload
\ No newline at end of file
+    assert "exp" in payload
+
+
+def test_access_token_carries_user_id_and_version():
+    """Verifies the claims used by the stateless authentication path."""
+    token = create_access_token("test@example.com", user_id=7, token_version=3)
+
+    payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+
+    assert payload["uid"] == 7
+    assert payload["ver"] == 3
+    assert "uid" not in jwt.decode(
+        create_access_token("test@example.com"),
+        settings.secret_key,
+        algorithms=[settings.algorithm],
+    )
+
+
+def test_verify_and_update_rehashes_outdated_cost():
+    """Verifies that hashes with a different bcrypt cost are upgraded."""
+    outdated = bcrypt.using(rounds=4).hash("securepassword")
+
+    valid, new_hash = verify_and_update_password("securepassword", outdated)
+
+    assert valid
+    assert new_hash is not None and new_hash != outdated
+    assert verify_password("securepassword", new_hash)
+    assert verify_and_update_password("securepassword", new_hash) == (True, None)
+    assert verify_and_update_password("wrongpassword", outdated) == (False, None)
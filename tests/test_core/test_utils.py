@@ -6,6 +6,7 @@ from app.core.utils import (
     get_humidity_label,
     get_temperature_label,
     get_wind_label,
+    select_item_tags,
 )
 
 
@@ -50,4 +51,11 @@ def test_get_humidity_label(humidity, expected_label):
 )
 def test_get_wind_label(speed, expected_label):
     """Verifies correct wind speed label mapping."""
-    assert get_wind_label(speed) == expected_label
\ No newline at end of file
+    assert get_wind_label(speed) == expected_label
+
+
+def test_select_item_tags():
+    """Verifies threshold and incompatible keyword filtering of item tags."""
+    scores = {"Cold": 95, "Freezing": 90, "Rain": 70, "Hot": 20}
+
+    assert select_item_tags("Silk scarf", scores) == {"Cold": 95}
@@ -1,9 +1,24 @@
 """Unit tests for Item repository operations."""
 
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.crud.item_repo import create_item, delete_item, get_items_by_user
+from app.crud.item_repo import (
+    count_items_by_image,
+    create_item,
+    delete_item,
+    delete_items,
+    get_items_by_user,
+    get_items_page,
+    iter_items_by_user,
+    iter_items_by_user_async,
+    search_items,
+    unreferenced_images,
+)
+from app.crud.tag_repo import create_item_with_tags
 from app.crud.user_repo import create_user
+from app.database.models import ClothingWeather, Item
 from app.schemas.item import ItemCreate
 from app.schemas.user import UserCreate
 
@@ -113,4 +128,175 @@ def test_delete_item_failure_wrong_owner(db_session: Session):
     assert result is False
 
     items = get_items_by_user(db_session, owner.id)
-    assert len(items) == 1
\ No newline at end of file
+    assert len(items) == 1
+
+
+def test_count_items_by_image(db_session: Session):
+    """Verifies counting of items sharing a stored image.
+
+    Args:
+        db_session (Session): The database session fixture.
+    """
+    user = create_user(
+        db_session, UserCreate(email="count@example.com", password="Password1!")
+    )
+    for description in ["Shared 1", "Shared 2"]:
+        create_item(
+            db_session,
+            ItemCreate(description=description, image_filename="ab/cd/abcd.jpg"),
+            user.id,
+        )
+
+    assert count_items_by_image(db_session, "ab/cd/abcd.jpg") == 2
+    assert count_items_by_image(db_session, "missing.jpg") == 0
+
+
+def test_get_items_page(db_session: Session):
+    """Verifies that pages are ordered by ID and start after the cursor.
+
+    Args:
+        db_session (Session): The database session fixture.
+    """
+    user = create_user(
+        db_session, UserCreate(email="page@example.com", password="Password1!")
+    )
+    items = [
+        create_item(db_session, ItemCreate(description=f"Item {i}"), user.id)
+        for i in range(3)
+    ]
+
+    first = get_items_page(db_session, user.id, limit=2)
+    rest = get_items_page(db_session, user.id, limit=2, after_id=first[-1].id)
+
+    assert [item.id for item in first] == [items[0].id, items[1].id]
+    assert [item.id for item in rest] == [items[2].id]
+
+
+def test_delete_items_removes_owned_items_and_links(db_session: Session):
+    """Verifies bulk deletion of items and their tag links.
+
+    Args:
+        db_session (Session): The database session fixture.
+    """
+    owner = create_user(
+        db_session, UserCreate(email="bulk@example.com", password="Password1!")
+    )
+    other = create_user(
+        db_session, UserCreate(email="other@example.com", password="Password1!")
+    )
+    coat = create_item_with_tags(
+        db_session,
+        owner.id,
+        ItemCreate(description="Coat", image_filename="coat.jpg"),
+        {"Cold": 90},
+    )
+    scarf = create_item(
+        db_session, ItemCreate(description="Scarf", image_filename="s.jpg"), owner.id
+    )
+    foreign = create_item(
+        db_session, ItemCreate(description="Hat", image_filename="h.jpg"), other.id
+    )
+    ids = [coat.id, scarf.id, foreign.id, 9999]
+    foreign_id = foreign.id
+
+    deleted, keys = delete_items(db_session, owner.id, ids)
+
+    assert deleted == sorted(ids[:2])
+    assert keys == {"coat.jpg", "s.jpg"}
+    assert db_session.query(ClothingWeather).count() == 0
+    assert [item.id for item in db_session.query(Item)] == [foreign_id]
+
+
+def test_unreferenced_images(db_session: Session):
+    """Verifies detection of image keys without items.
+
+    Args:
+        db_session (Session): The database session fixture.
+    """
+    user = create_user(
+        db_session, UserCreate(email="refs@example.com", password="Password1!")
+    )
+    create_item(
+        db_session, ItemCreate(description="Kept", image_filename="kept.jpg"), user.id
+    )
+
+    assert unreferenced_images(db_session, ["kept.jpg", "gone.jpg"]) == {"gone.jpg"}
+    assert unreferenced_images(db_session, []) == set()
+
+
+def test_search_items_matches_all_terms(db_session: Session):
+    """Verifies search-as-you-type matching and pagination.
+
+    Args:
+        db_session (Session): The database session fixture.
+    """
+    user = create_user(
+        db_session, UserCreate(email="search@example.com", password="Password1!")
+    )
+    other = create_user(
+        db_session, UserCreate(email="nosy@example.com", password="Password1!")
+    )
+    for owner_id, description in [
+        (user.id, "Grey wool coat"),
+        (user.id, "Wool scarf"),
+        (user.id, "Rain coat"),
+        (other.id, "Wool coat"),
+    ]:
+        create_item(
+            db_session,
+            ItemCreate(description=description, image_filename="x.jpg"),
+            owner_id,
+        )
+
+    def descriptions(items):
+        return [item.description for item in items]
+
+    assert descriptions(search_items(db_session, user.id, "WOOL", 10)) == [
+        "Wool scarf",
+        "Grey wool coat",
+    ]
+    assert descriptions(search_items(db_session, user.id, "wo co", 10)) == [
+        "Grey wool coat"
+    ]
+    assert descriptions(search_items(db_session, user.id, "coat", 1, offset=1)) == [
+        "Grey wool coat"
+    ]
+    assert search_items(db_session, user.id, "100%_", 10) == []
+    assert search_items(db_session, user.id, "  -- ", 10) == []
+
+
+@pytest.mark.asyncio
+async def test_iter_items_by_user(
+    db_session: Session, async_db_session: AsyncSession
+):
+    """Verifies that a closet is streamed in ordered batches.
+
+    Args:
+        db_session (Session): The database session fixture.
+        async_db_session (AsyncSession): The asyncio database session fixture.
+    """
+    user = create_user(
+        db_session, UserCreate(email="stream@test.com", password="Password1!")
+    )
+    other = create_user(
+        db_session, UserCreate(email="other@test.com", password="Password1!")
+    )
+    db_session.add_all(
+        [Item(description=f"Item {i}", owner_id=user.id) for i in range(5)]
+        + [Item(description="Other", owner_id=other.id)]
+    )
+    db_session.commit()
+
+    batches = list(iter_items_by_user(db_session, user.id, batch_size=2))
+    async_batches = [
+        batch
+        async for batch in iter_items_by_user_async(
+            async_db_session, user.id, batch_size=2
+        )
+    ]
+
+    for result in (batches, async_batches):
+        assert [len(batch) for batch in result] == [2, 2, 1]
+        assert [item.description for batch in result for item in batch] == [
+            f"Item {i}" for i in range(5)
+        ]
@@ -0,0 +1,227 @@
+"""Query plan regression tests for the repository functions.
+
+Every statement a repository function sends to the database is explained
+with `EXPLAIN QUERY PLAN`, and the test fails if SQLite would read a whole
+table instead of searching an index.
+"""
+
+import re
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.crud.item_repo import (
+    count_items_by_image,
+    create_item,
+    delete_item,
+    delete_items,
+    get_items_after,
+    get_items_by_user,
+    get_items_page,
+    iter_items_by_user,
+    lock_existing_items,
+    search_items,
+    unreferenced_images,
+)
+from app.crud.tag_registry import tag_registry
+from app.crud.tag_repo import (
+    create_item_with_tags,
+    get_items_by_tags,
+    get_or_create_tags,
+    iter_items_by_tags,
+    link_item_to_tag,
+    rebuild_item_tags,
+    replace_item_tags,
+    save_item_scores,
+)
+from app.crud.user_repo import (
+    create_user,
+    get_closet_version,
+    get_user_by_email,
+    get_user_by_id,
+    revoke_tokens,
+)
+from app.schemas.item import ItemCreate
+from app.schemas.user import UserCreate
+
+EXPLAINED_STATEMENTS = ("SELECT", "UPDATE", "DELETE")
+FULL_SCAN = re.compile(r"^SCAN (\w+)(?: AS \w+)?$")
+
+REPO_CALLS = {
+    "get_items_by_user": lambda db, ctx: get_items_by_user(db, ctx["user_id"]),
+    "get_items_page": lambda db, ctx: get_items_page(db, ctx["user_id"], 10),
+    "get_items_page_after": lambda db, ctx: get_items_page(
+        db, ctx["user_id"], 10, after_id=ctx["item_ids"][0]
+    ),
+    "get_items_page_by_tag": lambda db, ctx: get_items_page(
+        db, ctx["user_id"], 10, tag_name="Rain"
+    ),
+    "get_items_after": lambda db, ctx: get_items_after(db, 0, 10),
+    "get_items_after_stale": lambda db, ctx: get_items_after(
+        db, ctx["item_ids"][0], 10, owner_id=ctx["user_id"], stale_for="v1"
+    ),
+    "lock_existing_items": lambda db, ctx: lock_existing_items(
+        db, ctx["item_ids"] + [0]
+    ),
+    "search_items": lambda db, ctx: search_items(db, ctx["user_id"], "rain co", 10),
+    "get_items_by_tags": lambda db, ctx: get_items_by_tags(
+        db, ctx["user_id"], ["Rain", "Cold"]
+    ),
+    "iter_items_by_user": lambda db, ctx: list(
+        iter_items_by_user(db, ctx["user_id"])
+    ),
+    "iter_items_by_tags": lambda db, ctx: list(
+        iter_items_by_tags(db, ctx["user_id"], ["Rain", "Cold"])
+    ),
+    "count_items_by_image": lambda db, ctx: count_items_by_image(db, "coat.jpg"),
+    "unreferenced_images": lambda db, ctx: unreferenced_images(
+        db, {"coat.jpg", "gone.jpg"}
+    ),
+    "create_item": lambda db, ctx: create_item(
+        db, ItemCreate(description="Scarf", image_filename=None), ctx["user_id"]
+    ),
+    "create_item_with_tags": lambda db, ctx: create_item_with_tags(
+        db, ctx["user_id"], ItemCreate(description="Boots"), {"Rain": 90, "Snow": 80}
+    ),
+    "create_item_with_tags_scored": lambda db, ctx: create_item_with_tags(
+        db,
+        ctx["user_id"],
+        ItemCreate(description="Boots"),
+        {"Rain": 90},
+        {"Rain": 90, "Snow": 40},
+    ),
+    "rebuild_item_tags": lambda db, ctx: rebuild_item_tags(
+        db, label_thresholds={"Snow": 30}, owner_id=ctx["user_id"]
+    ),
+    "save_item_scores": lambda db, ctx: save_item_scores(
+        db, {ctx["item_ids"][0]: ("Rain coat", {"Rain": 95, "Cold": 40})}
+    ),
+    "replace_item_tags": lambda db, ctx: replace_item_tags(
+        db, {ctx["item_ids"][0]: {"Cold": 80}, ctx["item_ids"][1]: {"Hot": 95}}
+    ),
+    "link_item_to_tag": lambda db, ctx: link_item_to_tag(
+        db, ctx["item_ids"][1], get_or_create_tags(db, {"Cold"})["Cold"], 70
+    ),
+    "delete_item": lambda db, ctx: delete_item(db, ctx["item_ids"][1], ctx["user_id"]),
+    "delete_items": lambda db, ctx: delete_items(db, ctx["user_id"], ctx["item_ids"]),
+    "get_user_by_email": lambda db, ctx: get_user_by_email(db, "plans@example.com"),
+    "get_user_by_id": lambda db, ctx: get_user_by_id(db, ctx["user_id"]),
+    "get_closet_version": lambda db, ctx: get_closet_version(db, ctx["user_id"]),
+    "revoke_tokens": lambda db, ctx: revoke_tokens(db, ctx["user_id"]),
+}
+
+
+@contextmanager
+def captured_statements(db: Session):
+    """Records the statements sent through a session's engine.
+
+    Args:
+        db (Session): The database session.
+
+    Yields:
+        list[tuple[str, tuple]]: The explainable statements and their
+            parameters, filled in as they are executed.
+    """
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith(
+            EXPLAINED_STATEMENTS
+        ):
+            statements.append((statement, parameters))
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def full_table_scans(db: Session, statements: list[tuple[str, tuple]]) -> list[str]:
+    """Explains statements and collects the tables they read in full.
+
+    Args:
+        db (Session): The database session.
+        statements (list[tuple[str, tuple]]): The statements and parameters.
+
+    Returns:
+        list[str]: One description per full table scan found.
+    """
+    scans = []
+    connection = db.connection()
+    for statement, parameters in statements:
+        plan = connection.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        )
+        for row in plan:
+            match = FULL_SCAN.match(row.detail)
+            if match:
+                scans.append(f"{match.group(1)}: {' '.join(statement.split())}")
+    return scans
+
+
+@pytest.fixture
+def closet(db_session: Session) -> dict:
+    """Seeds a user with tagged items.
+
+    Args:
+        db_session (Session): The database session fixture.
+
+    Returns:
+        dict: The user ID and the IDs of the user's items.
+    """
+    user = create_user(
+        db_session,
+        UserCreate(email="plans@example.com", password="StrongPassword1!"),
+        hashed_password="hash",
+    )
+    coat = create_item_with_tags(
+        db_session,
+        user.id,
+        ItemCreate(description="Rain coat", image_filename="coat.jpg"),
+        {"Rain": 95},
+    )
+    shirt = create_item_with_tags(
+        db_session,
+        user.id,
+        ItemCreate(description="Linen shirt", image_filename="shirt.jpg"),
+        {"Hot": 90},
+    )
+    tag_registry.clear()
+    return {"user_id": user.id, "item_ids": [coat.id, shirt.id]}
+
+
+@pytest.mark.parametrize("name", sorted(REPO_CALLS))
+def test_repository_queries_use_indexes(db_session: Session, closet: dict, name):
+    """Verifies that no repository query reads a whole table.
+
+    Args:
+        db_session (Session): The database session fixture.
+        closet (dict): The seeded user and items.
+        name (str): The repository call to check.
+    """
+    with captured_statements(db_session) as statements:
+        REPO_CALLS[name](db_session, closet)
+
+    assert statements
+    assert full_table_scans(db_session, statements) == []
+
+
+def test_full_table_scan_is_detected(db_session: Session, closet: dict):
+    """Verifies that the check flags a query without a usable index.
+
+    Args:
+        db_session (Session): The database session fixture.
+        closet (dict): The seeded user and items.
+    """
+    with captured_statements(db_session) as statements:
+        db_session.connection().exec_driver_sql(
+            "SELECT id FROM items WHERE description = ?", ("Rain coat",)
+        )
+
+    assert full_table_scans(db_session, statements) == [
+        "items: SELECT id FROM items WHERE description = ?"
+    ]
@@ -0,0 +1,92 @@
+"""Unit tests for the in-process weather tag registry."""
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.crud.item_repo import create_item
+from app.crud.tag_registry import tag_registry
+from app.crud.tag_repo import (
+    create_item_with_tags,
+    get_items_by_tags,
+    get_or_create_tags,
+    load_tag_registry,
+)
+from app.crud.user_repo import create_user
+from app.database.models import WeatherTag
+from app.schemas.item import ItemCreate
+from app.schemas.user import UserCreate
+
+
+def count_statements(db_session: Session) -> list[str]:
+    """Records the SQL statements executed on the session's engine."""
+    statements = []
+    event.listen(
+        db_session.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    return statements
+
+
+def test_load_seeds_missing_tags(db_session: Session):
+    """Verifies loading seeds the given names and registers every tag."""
+    db_session.add(WeatherTag(name="Foggy"))
+    db_session.commit()
+
+    load_tag_registry(db_session, ["Cold", "Rain"])
+
+    names = {tag.name for tag in db_session.query(WeatherTag)}
+    assert names == {"Foggy", "Cold", "Rain"}
+    for tag in db_session.query(WeatherTag):
+        assert tag_registry.id_for(tag.name) == tag.id
+        assert tag_registry.name_for(tag.id) == tag.name
+
+
+def test_lookups_do_not_query_once_loaded(db_session: Session):
+    """Verifies registered tags resolve without touching the database."""
+    load_tag_registry(db_session, ["Cold", "Rain"])
+    statements = count_statements(db_session)
+
+    tag_ids = get_or_create_tags(db_session, {"Cold", "Rain"})
+    names = tag_registry.names_for(db_session, tag_ids.values())
+
+    assert set(names.values()) == {"Cold", "Rain"}
+    assert statements == []
+
+
+def test_new_tags_are_registered_after_commit(db_session: Session):
+    """Verifies tags created by an upload are registered once committed."""
+    user = create_user(db_session, UserCreate(email="r@test.com", password="Password1!"))
+    item_in = ItemCreate(description="Coat", image_filename="coat.jpg")
+
+    create_item_with_tags(db_session, user.id, item_in, {"Snow": 90})
+
+    assert tag_registry.id_for("Snow") is not None
+
+
+def test_unregistered_tags_are_looked_up(db_session: Session):
+    """Verifies tags created elsewhere are picked up on a registry miss."""
+    tag = WeatherTag(name="Hail")
+    db_session.add(tag)
+    db_session.commit()
+
+    assert tag_registry.id_for("Hail") is None
+    assert tag_registry.ids_for(db_session, ["Hail", "Unknown"]) == {"Hail": tag.id}
+    assert tag_registry.id_for("Hail") == tag.id
+
+
+def test_get_items_by_tags_skips_tag_join(db_session: Session):
+    """Verifies recommendations filter on tag IDs without joining weather_tags."""
+    user = create_user(db_session, UserCreate(email="j@test.com", password="Password1!"))
+    item_in = ItemCreate(description="Boots", image_filename="boots.jpg")
+    item = create_item_with_tags(db_session, user.id, item_in, {"Rain": 90})
+    hat_in = ItemCreate(description="Hat", image_filename="hat.jpg")
+    create_item(db_session, hat_in, user.id)
+    user_id, item_id = user.id, item.id
+    statements = count_statements(db_session)
+
+    results = get_items_by_tags(db_session, user_id, ["Rain", "Missing"])
+
+    assert [result.id for result in results] == [item_id]
+    assert len(statements) == 2
+    assert "weather_tags" not in statements[-1]
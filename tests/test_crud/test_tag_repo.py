@@ -1,16 +1,28 @@
 """Unit tests for Tag repository operations."""
 
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.crud.item_repo import create_item
 from app.crud.tag_repo import (
+    _insert_tags_ignoring_duplicates,
+    create_item_with_tags,
+    create_items_with_tags,
     create_tag,
+    get_or_create_tags,
     get_items_by_tags,
     get_or_create_tag,
     get_tag_by_name,
+    iter_items_by_tags,
+    iter_items_by_tags_async,
     link_item_to_tag,
+    rebuild_item_tags,
+    replace_item_tags,
 )
 from app.crud.user_repo import create_user
+from app.database.models import ClothingWeather, Item, User, WeatherTag
 from app.schemas.item import ItemCreate
 from app.schemas.user import UserCreate
 
@@ -61,6 +73,8 @@ def test_link_item_to_tag(db_session: Session):
     assert link.item_id == item.id
     assert link.tag_id == tag.id
     assert link.confidence == confidence_score
+    db_session.refresh(item)
+    assert item.tag_names == ["Freezing"]
 
 
 def test_get_items_by_tags(db_session: Session):
@@ -80,4 +94,245 @@ def test_get_items_by_tags(db_session: Session):
     results = get_items_by_tags(db=db_session, user_id=user.id, tag_names=[tag.name])
 
     assert len(results) > 0
-    assert item in results
\ No newline at end of file
+    assert item in results
+
+
+def test_create_items_with_tags(db_session: Session):
+    """Verifies bulk creation of items with new and existing tags."""
+    user = create_user(
+        db_session, UserCreate(email="bulk@test.com", password="Password1!")
+    )
+    existing = create_tag(db_session, "Cold")
+
+    items = create_items_with_tags(
+        db_session,
+        user.id,
+        [
+            (ItemCreate(description="Parka"), {"Cold": 95, "Snow": 88}),
+            (ItemCreate(description="Umbrella"), {}),
+        ],
+    )
+
+    assert [item.description for item in items] == ["Parka", "Umbrella"]
+    links = {link.tag.name: link for link in items[0].weather_links}
+    assert links.keys() == {"Cold", "Snow"}
+    assert links["Cold"].tag_id == existing.id
+    assert links["Snow"].confidence == 88
+    assert items[1].weather_links == []
+    assert items[0].tag_names == ["Cold", "Snow"]
+    assert items[1].tag_names == []
+
+
+
+def test_get_or_create_tags_upserts_missing(db_session: Session):
+    """Verifies that existing tags are reused and missing ones inserted."""
+    cold = create_tag(db_session, "Cold")
+
+    tag_ids = get_or_create_tags(db_session, {"Cold", "Rain"})
+    again = get_or_create_tags(db_session, {"Rain"})
+
+    assert tag_ids["Cold"] == cold.id
+    assert again["Rain"] == tag_ids["Rain"]
+
+
+def test_create_item_with_tags_single_commit(db_session: Session):
+    """Verifies that an item and its links are written in one commit."""
+    user = create_user(
+        db_session, UserCreate(email="single@test.com", password="Password1!")
+    )
+    commits = []
+    event.listen(db_session, "after_commit", lambda session: commits.append(1))
+
+    item = create_item_with_tags(
+        db_session, user.id, ItemCreate(description="Boots"), {"Rain": 80, "Cold": 75}
+    )
+
+    assert len(commits) == 1
+    assert sorted(link.tag.name for link in item.weather_links) == ["Cold", "Rain"]
+
+
+@pytest.mark.asyncio
+async def test_iter_items_by_tags(
+    db_session: Session, async_db_session: AsyncSession
+):
+    """Verifies streaming of items matching any of several tags.
+
+    Args:
+        db_session (Session): The database session fixture.
+        async_db_session (AsyncSession): The asyncio database session fixture.
+    """
+    user = create_user(
+        db_session, UserCreate(email="stream@test.com", password="Password1!")
+    )
+    create_items_with_tags(
+        db_session,
+        user.id,
+        [
+            (ItemCreate(description="Parka"), {"Cold": 95, "Snow": 88}),
+            (ItemCreate(description="Sandals"), {"Hot": 90}),
+            (ItemCreate(description="Raincoat"), {"Rain": 92, "Cold": 70}),
+        ],
+    )
+
+    batches = list(
+        iter_items_by_tags(db_session, user.id, ["Cold", "Snow"], batch_size=1)
+    )
+    async_batches = [
+        batch
+        async for batch in iter_items_by_tags_async(
+            async_db_session, user.id, ["Cold", "Snow"], batch_size=1
+        )
+    ]
+
+    for result in (batches, async_batches):
+        assert [[item.description for item in batch] for batch in result] == [
+            ["Parka"],
+            ["Raincoat"],
+        ]
+    assert list(iter_items_by_tags(db_session, user.id, ["Unknown"])) == []
+
+
+def test_replace_item_tags_writes_only_differences(db_session: Session):
+    """Verifies that links are diffed and changed items get new tag names.
+
+    Args:
+        db_session (Session): The database session fixture.
+    """
+    user = create_user(
+        db_session, UserCreate(email="retag@test.com", password="Password1!")
+    )
+    parka, sandals, scarf = create_items_with_tags(
+        db_session,
+        user.id,
+        [
+            (ItemCreate(description="Parka"), {"Cold": 95, "Snow": 88}),
+            (ItemCreate(description="Sandals"), {"Hot": 90}),
+            (ItemCreate(description="Scarf"), {"Cold": 80}),
+        ],
+    )
+    version = db_session.get(User, user.id).closet_version
+
+    changed = replace_item_tags(
+        db_session,
+        {
+            parka.id: {"Cold": 97, "Wind": 75},
+            sandals.id: {"Hot": 90},
+            scarf.id: {"Cold": 85},
+        },
+    )
+    db_session.commit()
+
+    assert changed == [parka.id]
+    links = db_session.execute(
+        select(Item.description, ClothingWeather.confidence)
+        .join(ClothingWeather.item)
+        .order_by(Item.id, ClothingWeather.confidence)
+    ).all()
+    assert [tuple(link) for link in links] == [
+        ("Parka", 75),
+        ("Parka", 97),
+        ("Sandals", 90),
+        ("Scarf", 85),
+    ]
+    db_session.expire_all()
+    assert parka.tag_names == ["Cold", "Wind"]
+    assert scarf.tag_names == ["Cold"]
+    assert db_session.get(User, user.id).closet_version == version + 1
+    assert replace_item_tags(db_session, {}) == []
+
+
+def test_rebuild_item_tags_from_stored_scores(db_session: Session):
+    """Verifies that links are derived from scores for new thresholds.
+
+    Args:
+        db_session (Session): The database session fixture.
+    """
+    user = create_user(
+        db_session, UserCreate(email="rebuild@test.com", password="Password1!")
+    )
+    parka, tank, legacy, outdated = create_items_with_tags(
+        db_session,
+        user.id,
+        [
+            (ItemCreate(description="Parka"), {"Cold": 95}),
+            (ItemCreate(description="Tank top"), {"Hot": 90}),
+            (ItemCreate(description="Old scarf"), {"Cold": 80}),
+            (ItemCreate(description="Old boots"), {"Rain": 90}),
+        ],
+        [
+            {"Cold": 95, "Snow": 60, "Hot": 3},
+            {"Hot": 90, "Freezing": 85, "Warm": 50},
+            None,
+            {"Rain": 90, "Snow": 60},
+        ],
+    )
+    outdated.scores_version = "older-model"
+    db_session.commit()
+    version = db_session.get(User, user.id).closet_version
+
+    written = rebuild_item_tags(db_session, threshold=55, label_thresholds={"Warm": 40})
+    db_session.commit()
+
+    assert written == 4
+    db_session.expire_all()
+    assert sorted(parka.tag_names) == ["Cold", "Snow"]
+    assert sorted(tank.tag_names) == ["Hot", "Warm"]
+    assert legacy.tag_names == ["Cold"]
+    assert sorted(link.tag.name for link in legacy.weather_links) == ["Cold"]
+    assert outdated.tag_names == ["Rain"]
+    assert db_session.get(User, user.id).closet_version == version + 1
+
+    rebuild_item_tags(db_session, threshold=99)
+    db_session.commit()
+    db_session.expire_all()
+    assert parka.tag_names == [] and parka.weather_links == []
+    assert legacy.tag_names == ["Cold"]
+
+
+def test_rebuild_item_tags_without_json_aggregate(
+    db_session: Session, monkeypatch
+):
+    """Verifies that tag names are collected in Python on other dialects.
+
+    Args:
+        db_session (Session): The database session fixture.
+        monkeypatch: The pytest monkeypatch fixture.
+    """
+    user = create_user(
+        db_session, UserCreate(email="fallback@test.com", password="Password1!")
+    )
+    parka, sandals = create_items_with_tags(
+        db_session,
+        user.id,
+        [
+            (ItemCreate(description="Parka"), {"Cold": 95}),
+            (ItemCreate(description="Sandals"), {"Hot": 90}),
+        ],
+        [{"Cold": 95, "Snow": 80}, {"Hot": 60}],
+    )
+    monkeypatch.setattr(db_session.get_bind().dialect, "name", "unknown")
+
+    assert rebuild_item_tags(db_session, threshold=70) == 2
+    db_session.commit()
+
+    db_session.expire_all()
+    assert sorted(parka.tag_names) == ["Cold", "Snow"]
+    assert sandals.tag_names == []
+
+
+def test_insert_tags_falls_back_to_savepoints(db_session: Session, monkeypatch):
+    """Verifies duplicate-tolerant inserts on dialects without an upsert.
+
+    Args:
+        db_session (Session): The database session fixture.
+        monkeypatch: The pytest monkeypatch fixture.
+    """
+    create_tag(db_session, "Cold")
+    monkeypatch.setattr(db_session.get_bind().dialect, "name", "unknown")
+
+    _insert_tags_ignoring_duplicates(db_session, {"Cold", "Hot"})
+    db_session.commit()
+
+    assert get_tag_by_name(db_session, "Hot") is not None
+    names = db_session.scalars(select(WeatherTag.name).order_by(WeatherTag.name))
+    assert names.all() == ["Cold", "Hot"]
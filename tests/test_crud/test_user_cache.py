@@ -0,0 +1,57 @@
+"""Unit tests for the in-process user cache."""
+
+from unittest.mock import patch
+
+from sqlalchemy import inspect
+
+from app.crud.user_cache import UserCache
+from app.database.models import User
+
+
+def make_user(user_id: int) -> User:
+    """Builds a user with every cached column set."""
+    return User(
+        id=user_id,
+        email=f"user{user_id}@test.com",
+        hashed_password="pw",
+        closet_version=0,
+        token_version=0,
+    )
+
+
+def test_get_returns_detached_copies():
+    """Verifies that every hit returns a separate detached instance."""
+    cache = UserCache(ttl=60, max_size=10)
+    cache.put(make_user(1))
+
+    first, second = cache.get(1), cache.get(1)
+
+    assert first.email == "user1@test.com"
+    assert first is not second
+    assert inspect(first).detached
+
+
+def test_entries_expire_after_ttl():
+    """Verifies that entries are dropped once their TTL has passed."""
+    cache = UserCache(ttl=60, max_size=10)
+    with patch("app.crud.user_cache.time.monotonic", return_value=100.0):
+        cache.put(make_user(1))
+    with patch("app.crud.user_cache.time.monotonic", return_value=159.0):
+        assert cache.get(1) is not None
+    with patch("app.crud.user_cache.time.monotonic", return_value=161.0):
+        assert cache.get(1) is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    """Verifies the size bound and invalidation."""
+    cache = UserCache(ttl=60, max_size=2)
+    cache.put(make_user(1))
+    cache.put(make_user(2))
+    cache.get(1)
+    cache.put(make_user(3))
+
+    assert cache.get(2) is None
+    assert cache.get(1) is not None
+
+    cache.invalidate(1)
+    assert cache.get(1) is None
@@ -2,10 +2,22 @@
 
 import pytest
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.security import verify_password
-from app.crud.user_repo import create_user, get_user_by_email
+from app.crud.item_repo import create_item, delete_items
+from app.crud.tag_repo import create_item_with_tags
+from app.crud.user_repo import (
+    create_user,
+    create_user_async,
+    get_closet_version,
+    get_closet_version_async,
+    get_user_by_email,
+    get_user_by_email_async,
+    revoke_tokens_async,
+)
+from app.schemas.item import ItemCreate
 from app.schemas.user import UserCreate
 
 
@@ -52,4 +64,57 @@ def test_get_user_by_email_success(db_session: Session):
 def test_get_user_by_email_not_found(db_session: Session):
     """Verifies that non-existent users return None."""
     user = get_user_by_email(db_session, "ghost@test.com")
-    assert user is None
\ No newline at end of file
+    assert user is None
+
+
+def test_closet_version_bumps_on_item_changes(db_session: Session):
+    """Verifies that every write to a closet bumps its version."""
+    user = create_user(
+        db_session, UserCreate(email="version@example.com", password="Password1!")
+    )
+    user_id = user.id
+    assert get_closet_version(db_session, user_id) == 0
+
+    item_in = ItemCreate(description="A", image_filename="a.jpg")
+    item = create_item(db_session, item_in, user_id)
+    assert get_closet_version(db_session, user_id) == 1
+
+    create_item_with_tags(
+        db_session,
+        user_id,
+        ItemCreate(description="B", image_filename="b.jpg"),
+        {"Cold": 90},
+    )
+    assert get_closet_version(db_session, user_id) == 2
+
+    delete_items(db_session, user_id, [item.id])
+    assert get_closet_version(db_session, user_id) == 3
+
+    delete_items(db_session, user_id, [9999])
+    assert get_closet_version(db_session, user_id) == 3
+    assert get_closet_version(db_session, 9999) is None
+
+
+@pytest.mark.asyncio
+async def test_async_user_operations(
+    db_session: Session, async_db_session: AsyncSession
+):
+    """Verifies the asyncio counterparts against the synchronous session.
+
+    Args:
+        db_session (Session): The database session fixture.
+        async_db_session (AsyncSession): The asyncio database session fixture.
+    """
+    user_in = UserCreate(email="async@example.com", password="StrongPassword1!")
+    user = await create_user_async(async_db_session, user_in)
+
+    assert verify_password("StrongPassword1!", user.hashed_password)
+    assert get_user_by_email(db_session, "async@example.com").id == user.id
+
+    await revoke_tokens_async(async_db_session, user.id)
+    async_db_session.expire_all()
+
+    found = await get_user_by_email_async(async_db_session, "async@example.com")
+    assert found.token_version == 1
+    assert await get_closet_version_async(async_db_session, user.id) == 0
+    assert await get_user_by_email_async(async_db_session, "none@example.com") is None
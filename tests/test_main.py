@@ -10,12 +10,16 @@ from main import app
 
 def test_app_lifespan_and_root():
     """Verifies lifecycle events and root endpoint."""
-    with patch("main.AIService") as mock_service_cls:
+    with (
+        patch("main.AIService") as mock_service_cls,
+        patch("main.load_tag_registry") as mock_load_tags,
+    ):
         mock_instance = MagicMock()
         mock_service_cls.return_value = mock_instance
 
         with TestClient(app) as client:
             mock_service_cls.assert_called_once()
+            mock_load_tags.assert_called_once()
 
             assert app.state.ai_service == mock_instance
 
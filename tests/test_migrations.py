@@ -1,10 +1,32 @@
 """Integration tests for database migrations."""
 
+import importlib.util
+import json
 import os
 from unittest.mock import patch
 
 from alembic import command
 from alembic.config import Config
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import create_engine, text
+
+
+def load_revision(filename: str):
+    """Imports a migration script as a module.
+
+    Args:
+        filename (str): The file name in `alembic/versions`.
+
+    Returns:
+        ModuleType: The migration module.
+    """
+    spec = importlib.util.spec_from_file_location(
+        filename.removesuffix(".py"), os.path.join("alembic", "versions", filename)
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
 
 
 def test_migrations_stairway():
@@ -20,4 +42,41 @@ def test_migrations_stairway():
             command.upgrade(alembic_cfg, "head")
         finally:
             if os.path.exists("migration_test.db"):
-                os.remove("migration_test.db")
\ No newline at end of file
+                os.remove("migration_test.db")
+
+def test_tag_names_backfill_without_json_aggregate(tmp_path):
+    """Verifies the item by item backfill of dialects without an aggregate."""
+    migration = load_revision("b7d3e91c4a26_add_items_tag_names.py")
+    engine = create_engine(f"sqlite:///{tmp_path / 'backfill.db'}")
+
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+        connection.execute(
+            text("CREATE TABLE weather_tags (id INTEGER PRIMARY KEY, name TEXT)")
+        )
+        connection.execute(
+            text("CREATE TABLE clothing_weather (item_id INTEGER, tag_id INTEGER)")
+        )
+        connection.execute(text("INSERT INTO items (id) VALUES (1), (2)"))
+        connection.execute(
+            text("INSERT INTO weather_tags (id, name) VALUES (1, 'Cold'), (2, 'Rain')")
+        )
+        connection.execute(
+            text("INSERT INTO clothing_weather VALUES (1, 1), (1, 2)")
+        )
+
+        with (
+            Operations.context(MigrationContext.configure(connection)),
+            patch.dict(migration.JSON_ARRAY_AGGREGATES, clear=True),
+        ):
+            migration.upgrade()
+
+        rows = connection.execute(
+            text("SELECT id, tag_names FROM items ORDER BY id")
+        ).all()
+
+    assert [(item_id, sorted(json.loads(names))) for item_id, names in rows] == [
+        (1, ["Cold", "Rain"]),
+        (2, []),
+    ]
+    engine.dispose()
@@ -34,4 +34,23 @@ def test_classify_description_formatting():
 
         assert output["Rain"] == 99
         assert output["Cold"] == 45
-        assert output["Sunny"] == 0
\ No newline at end of file
+        assert output["Sunny"] == 0
+
+
+def test_classify_batch_keeps_input_order():
+    """Verifies that batch classification returns one mapping per text."""
+    mock_hf_results = [
+        {"labels": ["Rain", "Sunny"], "scores": [0.9, 0.1]},
+        {"labels": ["Sunny", "Rain"], "scores": [0.8, 0.2]},
+    ]
+
+    with patch("app.services.ai_service.pipeline") as mock_pipeline:
+        mock_instance = MagicMock()
+        mock_instance.return_value = mock_hf_results
+        mock_pipeline.return_value = mock_instance
+
+        service = AIService()
+        output = service.classify_batch(["raincoat", "sandals"], ["Rain", "Sunny"])
+
+        assert output == [{"Rain": 90, "Sunny": 10}, {"Sunny": 80, "Rain": 20}]
+        assert mock_instance.call_args.args[0] == ["raincoat", "sandals"]
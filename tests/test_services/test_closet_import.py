@@ -0,0 +1,78 @@
+"""Unit tests for incremental closet import parsing."""
+
+from unittest.mock import MagicMock
+
+from app.schemas.item import ItemImport
+from app.services.closet_import import ClosetImport, prepare_entries
+from app.services.image_storage import LocalImageStore
+
+
+def test_closet_import_splits_lines_across_chunks():
+    """Verifies parsing of lines that span chunks and batch boundaries."""
+    closet_import = ClosetImport(batch_size=2)
+    data = b'{"description": "Coat"}\n\n{"description": "Tee"}\n{"descr'
+
+    batches = [
+        batch
+        for i in range(0, len(data), 5)
+        for batch in closet_import.feed(data[i : i + 5])
+    ]
+    batches += closet_import.feed(b'iption": "Hat"}')
+    batches += closet_import.finish()
+
+    assert [[record.description for record in batch] for batch in batches] == [
+        ["Coat", "Tee"],
+        ["Hat"],
+    ]
+    assert closet_import.lines == 4
+    assert closet_import.rejected == 0
+
+
+def test_closet_import_rejects_invalid_and_overlong_lines():
+    """Verifies that bad lines are reported without stopping the import."""
+    closet_import = ClosetImport(max_line_bytes=40)
+
+    closet_import.feed(b'{"description": "' + b"x" * 100 + b'"}\n')
+    closet_import.feed(b'{"description": ""}\n[1, 2]\n')
+    batches = closet_import.feed(b'{"description": "Coat"}\n')
+    batches += closet_import.finish()
+
+    assert [record.description for record in batches[0]] == ["Coat"]
+    assert closet_import.rejected == 3
+    assert [error["line"] for error in closet_import.errors] == [1, 2, 3]
+    assert "longer than 40 bytes" in closet_import.errors[0]["error"]
+    assert closet_import.errors[1]["error"].startswith("description:")
+
+
+def test_prepare_entries(tmp_path):
+    """Verifies tag filtering, bulk classification and image key checks."""
+    store = LocalImageStore(tmp_path)
+    key = "ab/cd/" + "ab" * 32 + ".jpg"
+    store.path(key).parent.mkdir(parents=True)
+    store.path(key).write_bytes(b"image")
+    ai_service = MagicMock()
+    ai_service.classify_batch.return_value = [
+        {"Rain": 95, "Cold": 10},
+        {"Cold": 90, "Rain": 5},
+    ]
+
+    entries, scores = prepare_entries(
+        [
+            ItemImport(description="Coat", tags={"Cold": 80, "Party": 99}),
+            ItemImport(description="Umbrella", image_filename=key),
+            ItemImport(description="Scarf", image_filename="../../etc/passwd"),
+        ],
+        store,
+        ai_service,
+    )
+
+    assert [
+        (item.description, item.image_filename, tags) for item, tags in entries
+    ] == [
+        ("Coat", None, {"Cold": 80}),
+        ("Umbrella", key, {"Rain": 95}),
+        ("Scarf", None, {"Cold": 90}),
+    ]
+    assert scores == [None, {"Rain": 95, "Cold": 10}, {"Cold": 90, "Rain": 5}]
+    ai_service.classify_batch.assert_called_once()
+    assert ai_service.classify_batch.call_args.args[0] == ["Umbrella", "Scarf"]
@@ -0,0 +1,127 @@
+"""Unit tests for the background image reaper."""
+
+import asyncio
+import io
+import os
+from unittest.mock import patch
+
+import pytest
+from fastapi import UploadFile
+from sqlalchemy.orm import Session
+
+from app.database.models import Item, User
+from app.services import image_reaper as reaper_module
+from app.services.image_reaper import ImageReaper, find_orphaned_images
+from app.services.image_storage import LocalImageStore
+
+
+def make_blob(store: LocalImageStore, key: str, data: bytes = b"data", age=0):
+    """Writes a blob into the store, optionally backdating it."""
+    path = store.path(key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    if age:
+        mtime = path.stat().st_mtime - age
+        os.utime(path, (mtime, mtime))
+
+
+def add_item(db_session: Session, key: str) -> None:
+    """Adds an item referencing an image key."""
+    if db_session.get(User, 1) is None:
+        db_session.add(User(id=1, email="reaper@test.com", hashed_password="pw"))
+    db_session.add(Item(description=key, image_filename=key, owner_id=1))
+    db_session.commit()
+
+
+def test_find_orphaned_images(db_session: Session, tmp_path):
+    """Verifies that old unreferenced and empty blobs are reported."""
+    store = LocalImageStore(tmp_path)
+    hour = 60 * 60
+    make_blob(store, "used.jpg", age=2 * hour)
+    make_blob(store, "orphan.jpg", age=2 * hour)
+    make_blob(store, "empty.jpg", b"", age=2 * hour)
+    make_blob(store, "broken.jpg", b"", age=2 * hour)
+    make_blob(store, "fresh.jpg")
+    add_item(db_session, "used.jpg")
+    add_item(db_session, "broken.jpg")
+
+    orphaned, empty_referenced = find_orphaned_images(db_session, store)
+
+    assert orphaned == ["empty.jpg", "orphan.jpg"]
+    assert empty_referenced == ["broken.jpg"]
+
+
+@pytest.mark.asyncio
+async def test_reaper_deletes_unreferenced_images(db_session: Session, tmp_path):
+    """Verifies that queued images are deleted unless referenced again."""
+    store = LocalImageStore(tmp_path)
+    for key in ["a.jpg", "a.w320.webp", "b.jpg"]:
+        make_blob(store, key, age=60 * 60)
+    add_item(db_session, "b.jpg")
+
+    reaper = ImageReaper(store, lambda: db_session)
+    await reaper.start()
+    reaper.enqueue(["a.jpg", "b.jpg"])
+    await asyncio.sleep(0.1)
+    await reaper.stop()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["b.jpg"]
+
+
+@pytest.mark.asyncio
+async def test_reaper_retries_failed_deletions(db_session: Session, tmp_path):
+    """Verifies that a failed deletion is retried later."""
+    store = LocalImageStore(tmp_path)
+    make_blob(store, "a.jpg", age=60 * 60)
+    failures = [OSError("busy")]
+    original_delete = store.delete
+
+    def flaky_delete(key):
+        if failures:
+            raise failures.pop()
+        original_delete(key)
+
+    reaper = ImageReaper(store, lambda: db_session)
+    with (
+        patch.object(store, "delete", side_effect=flaky_delete),
+        patch.object(reaper_module, "RETRY_DELAY_SECONDS", 0.01),
+    ):
+        await reaper.start()
+        reaper.enqueue(["a.jpg"])
+        await asyncio.sleep(0.2)
+        await reaper.stop()
+
+    assert not store.exists("a.jpg")
+
+
+@pytest.mark.asyncio
+async def test_reaper_keeps_images_reused_by_pending_uploads(
+    db_session: Session, tmp_path
+):
+    """Verifies that deleting the last item does not remove a deduped blob.
+
+    An upload of the same image dedups onto the existing blob while the
+    item still referencing it is deleted; the blob must survive until the
+    upload's item is committed.
+    """
+    store = LocalImageStore(tmp_path)
+    data = b"\xff\xd8\xff\xe0" + b"photo"
+    key = await store.save(UploadFile(file=io.BytesIO(data)), 1024)
+    mtime = store.path(key).stat().st_mtime - 2 * 60 * 60
+    os.utime(store.path(key), (mtime, mtime))
+    add_item(db_session, key)
+    reaper = ImageReaper(store, lambda: db_session)
+
+    assert await store.save(UploadFile(file=io.BytesIO(data)), 1024) == key
+    db_session.query(Item).delete()
+    db_session.commit()
+    failed, recent = reaper._reap([key])
+
+    assert (failed, recent) == ([], [key])
+    assert store.exists(key)
+
+    add_item(db_session, key)
+    old = store.path(key).stat().st_mtime - 2 * 60 * 60
+    os.utime(store.path(key), (old, old))
+    assert reaper._reap([key]) == ([], [])
+    assert store.exists(key)
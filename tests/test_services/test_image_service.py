@@ -0,0 +1,112 @@
+"""Unit tests for image variant service."""
+
+import threading
+from unittest.mock import patch
+
+from PIL import Image
+
+from app.services import image_service
+from app.services.image_service import (
+    VARIANT_WIDTHS,
+    ImageService,
+    generate_variants,
+    image_variants,
+    placeholder_filename,
+    variant_filename,
+)
+from app.services.image_storage import LocalImageStore
+
+
+def make_photo(path, size=(2000, 1500)):
+    """Writes a JPEG with EXIF metadata to disk.
+
+    Args:
+        path: The destination path.
+        size: The image dimensions.
+    """
+    exif = Image.Exif()
+    exif[0x010F] = "SecretCamera"
+    Image.new("RGB", size, color=(200, 30, 30)).save(path, exif=exif)
+
+
+def test_generate_variants_resizes_and_strips_metadata(tmp_path):
+    """Verifies variant widths, formats and removal of EXIF data."""
+    source = tmp_path / "photo.jpg"
+    make_photo(source)
+
+    generated = generate_variants(source)
+
+    assert len(generated) == len(VARIANT_WIDTHS) + 1
+    for width in VARIANT_WIDTHS:
+        with Image.open(tmp_path / variant_filename("photo.jpg", width)) as variant:
+            assert variant.format == "WEBP"
+            assert variant.width == width
+            assert variant.height == round(1500 * width / 2000)
+            assert not variant.getexif()
+
+    with Image.open(tmp_path / placeholder_filename("photo.jpg")) as placeholder:
+        assert placeholder.width == 16
+        assert not placeholder.getexif()
+
+
+def test_generate_variants_does_not_upscale(tmp_path):
+    """Verifies that small originals are not enlarged."""
+    source = tmp_path / "small.jpg"
+    make_photo(source, size=(400, 300))
+
+    generate_variants(source)
+
+    with Image.open(tmp_path / variant_filename("small.jpg", 1024)) as variant:
+        assert variant.width == 400
+
+
+def test_image_variants_reports_urls_once_generated(tmp_path):
+    """Verifies that variant URLs are only exposed after generation."""
+    source = tmp_path / "photo.jpg"
+    make_photo(source)
+
+    store = LocalImageStore(tmp_path)
+    assert image_variants("photo.jpg", store) == {
+        "variants": [],
+        "placeholder_url": None,
+    }
+
+    generate_variants(source)
+    result = image_variants("photo.jpg", store)
+
+    assert [v["width"] for v in result["variants"]] == list(VARIANT_WIDTHS)
+    assert result["variants"][0]["url"] == "/images/photo.w320.webp"
+    assert result["placeholder_url"] == "/images/photo.placeholder.jpg"
+
+
+def test_image_service_runs_in_process_pool(tmp_path):
+    """Verifies that scheduled jobs complete in the worker pool."""
+    source = tmp_path / "photo.jpg"
+    make_photo(source, size=(800, 600))
+
+    service = ImageService(max_workers=1)
+    try:
+        generated = service.schedule_variants(source).result(timeout=60)
+    finally:
+        service.shutdown()
+
+    assert placeholder_filename("photo.jpg") in generated
+
+
+def test_image_service_logs_failed_jobs(tmp_path):
+    """Verifies that errors of unawaited jobs are logged."""
+    source = tmp_path / "corrupt.jpg"
+    source.write_bytes(b"not an image")
+
+    service = ImageService(max_workers=1)
+    with patch.object(image_service.logger, "error") as log_error:
+        try:
+            finished = threading.Event()
+            future = service.schedule_variants(source)
+            future.add_done_callback(lambda _: finished.set())
+            assert finished.wait(timeout=60)
+        finally:
+            service.shutdown()
+
+    log_error.assert_called_once()
+    assert log_error.call_args.args[1] == source
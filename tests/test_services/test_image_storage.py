@@ -0,0 +1,120 @@
+"""Unit tests for image storage service."""
+
+import hashlib
+import io
+
+import pytest
+from fastapi import UploadFile
+
+from app.services.image_storage import (
+    ImageTooLargeError,
+    InvalidImageError,
+    LocalImageStore,
+    content_key,
+    sniff_image_type,
+)
+
+PNG_HEADER = b"\x89PNG\r\n\x1a\n"
+
+
+@pytest.mark.parametrize(
+    "head, expected",
+    [
+        (b"\xff\xd8\xff\xe0rest", "jpg"),
+        (PNG_HEADER + b"rest", "png"),
+        (b"RIFF\x00\x00\x00\x00WEBPVP8 ", "webp"),
+        (b"GIF89a", None),
+        (b"", None),
+    ],
+)
+def test_sniff_image_type(head, expected):
+    """Verifies detection of image formats from magic bytes.
+
+    Args:
+        head (bytes): The leading file bytes.
+        expected (str | None): The expected extension.
+    """
+    assert sniff_image_type(head) == expected
+
+
+def test_content_key_is_sharded():
+    """Verifies that keys nest blobs by digest prefix."""
+    digest = "abcdef" + "0" * 58
+
+    assert content_key(digest, "png") == f"ab/cd/{digest}.png"
+
+
+@pytest.mark.asyncio
+async def test_save_streams_large_file_to_content_address(tmp_path):
+    """Verifies that multi-chunk uploads are stored under their digest."""
+    content = PNG_HEADER + b"x" * (200 * 1024)
+    store = LocalImageStore(tmp_path)
+
+    key = await store.save(UploadFile(file=io.BytesIO(content)), 1024 * 1024)
+
+    assert key == content_key(hashlib.sha256(content).hexdigest(), "png")
+    assert store.path(key).read_bytes() == content
+    assert store.url(key) == f"/images/{key}"
+
+
+@pytest.mark.asyncio
+async def test_save_deduplicates_identical_content(tmp_path):
+    """Verifies that identical uploads resolve to a single blob."""
+    content = PNG_HEADER + b"same"
+    store = LocalImageStore(tmp_path)
+
+    first = await store.save(UploadFile(file=io.BytesIO(content)), 1024)
+    second = await store.save(UploadFile(file=io.BytesIO(content)), 1024)
+
+    assert first == second
+    assert [p for p in tmp_path.rglob("*") if p.is_file()] == [store.path(first)]
+
+
+@pytest.mark.asyncio
+async def test_save_rejects_before_writing(tmp_path):
+    """Verifies that non-images are rejected without touching the disk."""
+    store = LocalImageStore(tmp_path)
+
+    with pytest.raises(InvalidImageError):
+        await store.save(UploadFile(file=io.BytesIO(b"plain text")), 1024)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_save_enforces_limit_while_streaming(tmp_path):
+    """Verifies that the size limit is enforced for streams of unknown size."""
+    store = LocalImageStore(tmp_path)
+    upload = UploadFile(file=io.BytesIO(PNG_HEADER + b"x" * (200 * 1024)))
+
+    with pytest.raises(ImageTooLargeError):
+        await store.save(upload, 100 * 1024)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_delete_removes_blob_and_variants(tmp_path):
+    """Verifies that deleting a key also removes its derived files."""
+    store = LocalImageStore(tmp_path)
+    blob = store.path("ab/cd/abcd.jpg")
+    blob.parent.mkdir(parents=True)
+    for name in ["abcd.jpg", "abcd.w320.webp", "abcd.placeholder.jpg", "abce.jpg"]:
+        (blob.parent / name).write_bytes(b"data")
+
+    store.delete("ab/cd/abcd.jpg")
+
+    assert [p.name for p in blob.parent.iterdir()] == ["abce.jpg"]
+    assert not store.exists("ab/cd/abcd.jpg")
+
+
+def test_keys_lists_blobs_only(tmp_path):
+    """Verifies that listing skips variants and in-progress uploads."""
+    store = LocalImageStore(tmp_path)
+    shard = tmp_path / "ab" / "cd"
+    shard.mkdir(parents=True)
+    for name in ["abcd.jpg", "abcd.w320.webp", "abcd.placeholder.jpg"]:
+        (shard / name).write_bytes(b"data")
+    (tmp_path / "legacy.jpg").write_bytes(b"")
+    (tmp_path / ".upload-1234.part").write_bytes(b"data")
+
+    assert sorted(store.keys()) == ["ab/cd/abcd.jpg", "legacy.jpg"]
@@ -0,0 +1,46 @@
+"""Unit tests for the login throttle."""
+
+from unittest.mock import patch
+
+from app.services.login_throttle import LoginThrottle
+
+
+def at(seconds: float):
+    """Freezes the throttle's clock."""
+    return patch("app.services.login_throttle.time.monotonic", return_value=seconds)
+
+
+def test_account_limit_and_window():
+    """Verifies that an account is blocked until its failures expire."""
+    throttle = LoginThrottle(max_per_account=2, max_per_ip=100, window=60)
+
+    with at(0):
+        throttle.record_failure("User@test.com", "1.1.1.1")
+    with at(10):
+        assert throttle.retry_after("user@test.com", "2.2.2.2") is None
+        throttle.record_failure("user@test.com", "2.2.2.2")
+        assert throttle.retry_after("user@test.com", "3.3.3.3") == 50
+    with at(61):
+        assert throttle.retry_after("user@test.com", "3.3.3.3") is None
+
+
+def test_ip_limit_spans_accounts():
+    """Verifies that one address guessing many accounts is blocked."""
+    throttle = LoginThrottle(max_per_account=100, max_per_ip=3, window=60)
+
+    with at(0):
+        for i in range(3):
+            throttle.record_failure(f"user{i}@test.com", "1.1.1.1")
+        assert throttle.retry_after("fresh@test.com", "1.1.1.1") == 60
+        assert throttle.retry_after("fresh@test.com", "2.2.2.2") is None
+
+
+def test_reset_clears_account_failures():
+    """Verifies that a successful login forgets the account's failures."""
+    throttle = LoginThrottle(max_per_account=1, max_per_ip=100, window=60)
+    throttle.record_failure("user@test.com", None)
+
+    throttle.reset("USER@test.com")
+
+    assert throttle.retry_after("user@test.com", None) is None
+    assert throttle.stats() == {"tracked_accounts": 0, "tracked_ips": 0}
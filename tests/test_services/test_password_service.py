@@ -0,0 +1,43 @@
+"""Unit tests for the password hashing pool."""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.services.password_service import PasswordHasher, PasswordHasherBusyError
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify():
+    """Verifies hashing round-trips and records queue wait."""
+    hasher = PasswordHasher(max_workers=1, max_queued=1)
+    try:
+        hashed = await hasher.hash("StrongPassword1!")
+
+        assert await hasher.verify("StrongPassword1!", hashed)
+        assert not await hasher.verify("WrongPassword1!", hashed)
+        stats = hasher.stats()
+        assert stats["queue_wait_seconds"]["count"] == 3
+        assert stats["pending"] == 0
+    finally:
+        hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_queue_is_full():
+    """Verifies that work beyond the pool and queue size is refused."""
+    hasher = PasswordHasher(max_workers=1, max_queued=0)
+    release = threading.Event()
+    try:
+        blocked = asyncio.ensure_future(hasher._run(release.wait))
+        await asyncio.sleep(0)
+
+        with pytest.raises(PasswordHasherBusyError):
+            await hasher.hash("StrongPassword1!")
+
+        release.set()
+        await blocked
+        assert hasher.stats()["rejected"] == 1
+    finally:
+        hasher.shutdown()
@@ -0,0 +1,305 @@
+"""Unit tests for the re-tagging job."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.crud.item_repo import delete_items
+from app.crud.job_repo import get_checkpoint
+from app.crud.tag_repo import create_items_with_tags
+from app.database.models import ClothingWeather, Item, ItemTagScore, User
+from app.schemas.item import ItemCreate
+from app.services import retag_job
+from app.services.retag_job import RetagJob, RetagWorker, RetagWorkerBusyError
+
+
+def scores_for(texts, *args, **kwargs):
+    """Scores descriptions by keyword, like a tiny classifier."""
+    return [
+        {
+            "Cold": 90 if "coat" in text.lower() else 10,
+            "Rain": 80 if "rain" in text.lower() else 5,
+        }
+        for text in texts
+    ]
+
+
+@pytest.fixture
+def closet(db_session: Session):
+    """Creates a user whose items carry outdated tags.
+
+    Args:
+        db_session (Session): The database session fixture.
+
+    Returns:
+        User: The owner of the items.
+    """
+    user = User(email="retag@example.com", hashed_password="pw")
+    db_session.add(user)
+    db_session.commit()
+    create_items_with_tags(
+        db_session,
+        user.id,
+        [
+            (ItemCreate(description="Wool coat"), {"Hot": 80}),
+            (ItemCreate(description="Rain coat"), {"Cold": 90, "Rain": 80}),
+            (ItemCreate(description="Wool coat"), {}),
+            (ItemCreate(description="Sandals"), {"Hot": 85}),
+            (ItemCreate(description="Rain boots"), {}),
+        ],
+    )
+    return user
+
+
+def make_job(db_session: Session, **kwargs) -> tuple[RetagJob, MagicMock]:
+    """Builds a job on the test database with a mock classifier."""
+    ai_service = MagicMock()
+    ai_service.classify_batch.side_effect = scores_for
+    factory = sessionmaker(bind=db_session.get_bind(), autoflush=False)
+    return RetagJob(factory, ai_service, batch_size=2, **kwargs), ai_service
+
+
+def tags_by_description(db_session: Session) -> list[tuple[str, list[str]]]:
+    """Reads the tag names of all items in ID order."""
+    db_session.expire_all()
+    items = db_session.query(Item).order_by(Item.id).all()
+    return [(item.description, item.tag_names) for item in items]
+
+
+def test_retag_job_rewrites_tags_in_batches(db_session: Session, closet: User):
+    """Verifies that all items are re-tagged and duplicates classified once.
+
+    Args:
+        db_session (Session): The database session fixture.
+        closet (User): The owner of the items.
+    """
+    job, ai_service = make_job(db_session)
+    progress = []
+
+    result = job.run(progress=lambda *counts: progress.append(counts))
+
+    assert result == {"processed": 5, "changed": 4, "finished": True}
+    assert progress == [(2, 1), (4, 3), (5, 4)]
+    assert ai_service.classify_batch.call_args_list[1].args[0] == [
+        "Wool coat",
+        "Sandals",
+    ]
+    assert tags_by_description(db_session) == [
+        ("Wool coat", ["Cold"]),
+        ("Rain coat", ["Cold", "Rain"]),
+        ("Wool coat", ["Cold"]),
+        ("Sandals", []),
+        ("Rain boots", ["Rain"]),
+    ]
+    assert get_checkpoint(db_session, job.name) is None
+
+    ai_service.classify_batch.reset_mock()
+    assert job.classify(["Wool coat", "Sandals", "Wool coat"]) == scores_for(
+        ["Wool coat", "Sandals", "Wool coat"]
+    )
+    assert ai_service.classify_batch.call_args.args[0] == ["Wool coat", "Sandals"]
+
+
+def test_retag_job_stores_scores_and_skips_scored_items(
+    db_session: Session, closet: User
+):
+    """Verifies that all label scores are kept and not computed twice.
+
+    Args:
+        db_session (Session): The database session fixture.
+        closet (User): The owner of the items.
+    """
+    job, ai_service = make_job(db_session)
+    job.run()
+
+    scores = db_session.scalars(
+        select(ItemTagScore).order_by(ItemTagScore.item_id)
+    ).all()
+    assert len(scores) == 10
+    items = db_session.scalars(select(Item)).all()
+    assert {item.scores_version for item in items} == {job.fingerprint}
+
+    ai_service.classify_batch.reset_mock()
+    assert job.run()["processed"] == 0
+    ai_service.classify_batch.assert_not_called()
+
+
+def test_retag_job_resumes_from_checkpoint(db_session: Session, closet: User):
+    """Verifies that an interrupted run continues after its last batch.
+
+    Args:
+        db_session (Session): The database session fixture.
+        closet (User): The owner of the items.
+    """
+    job, ai_service = make_job(db_session, owner_id=closet.id)
+
+    assert job.run(max_batches=1) == {
+        "processed": 2,
+        "changed": 1,
+        "finished": False,
+    }
+    checkpoint = get_checkpoint(db_session, f"retag:user:{closet.id}")
+    assert (checkpoint.processed, checkpoint.fingerprint) == (2, job.fingerprint)
+
+    ai_service.classify_batch.reset_mock()
+    result = job.run()
+
+    assert result == {"processed": 3, "changed": 3, "finished": True}
+    assert ai_service.classify_batch.call_args_list[0].args[0] == [
+        "Wool coat",
+        "Sandals",
+    ]
+
+
+def test_retag_job_restarts_when_the_setup_changed(
+    db_session: Session, closet: User
+):
+    """Verifies that a checkpoint of another scores version is discarded.
+
+    Args:
+        db_session (Session): The database session fixture.
+        closet (User): The owner of the items.
+    """
+    job, _ = make_job(db_session)
+    job.run(max_batches=2)
+
+    changed_job, _ = make_job(db_session, model_name="other/model")
+    assert changed_job.fingerprint != job.fingerprint
+
+    assert changed_job.run()["processed"] == 5
+
+
+def test_retag_job_refuses_to_run_twice(db_session: Session, closet: User):
+    """Verifies that a job cannot run concurrently with itself.
+
+    Args:
+        db_session (Session): The database session fixture.
+        closet (User): The owner of the items.
+    """
+    job, ai_service = make_job(db_session)
+
+    def run_again(texts, *args, **kwargs):
+        assert RetagJob.is_running(job.name)
+        with pytest.raises(RuntimeError):
+            job.run()
+        return scores_for(texts)
+
+    ai_service.classify_batch.side_effect = run_again
+    job.run(max_batches=1)
+
+    assert not RetagJob.is_running(job.name)
+
+
+def test_retag_job_holds_no_transaction_while_classifying(
+    db_session: Session, closet: User
+):
+    """Verifies that every session is closed before the classifier runs.
+
+    Args:
+        db_session (Session): The database session fixture.
+        closet (User): The owner of the items.
+    """
+    job, ai_service = make_job(db_session)
+    factory = job.session_factory
+    sessions = []
+
+    def tracked_session() -> Session:
+        session = factory()
+        sessions.append(session)
+        return session
+
+    def classify(texts, *args, **kwargs):
+        assert sessions
+        assert not any(session.in_transaction() for session in sessions)
+        return scores_for(texts)
+
+    job.session_factory = tracked_session
+    ai_service.classify_batch.side_effect = classify
+
+    assert job.run()["processed"] == 5
+
+
+def test_retag_job_skips_items_deleted_while_classifying(
+    db_session: Session, closet: User
+):
+    """Verifies that no scores or links are written for a deleted item.
+
+    Args:
+        db_session (Session): The database session fixture.
+        closet (User): The owner of the items.
+    """
+    job, ai_service = make_job(db_session)
+    deleted = db_session.scalars(select(Item.id).order_by(Item.id)).first()
+
+    def delete_first(texts, *args, **kwargs):
+        if db_session.get(Item, deleted) is not None:
+            delete_items(db_session, closet.id, [deleted])
+            db_session.commit()
+        return scores_for(texts)
+
+    ai_service.classify_batch.side_effect = delete_first
+
+    assert job.run() == {"processed": 5, "changed": 3, "finished": True}
+    for model in (ItemTagScore, ClothingWeather):
+        orphans = select(model).where(model.item_id == deleted)
+        assert db_session.scalars(orphans).all() == []
+    assert len(tags_by_description(db_session)) == 4
+
+
+def test_retag_worker_bounds_pending_jobs(db_session: Session, closet: User):
+    """Verifies that the worker refuses duplicates and jobs beyond its queue.
+
+    Args:
+        db_session (Session): The database session fixture.
+        closet (User): The owner of the items.
+    """
+    started, release = threading.Event(), threading.Event()
+
+    def blocking(texts, *args, **kwargs):
+        started.set()
+        release.wait(5)
+        return scores_for(texts)
+
+    job, ai_service = make_job(db_session, owner_id=closet.id)
+    ai_service.classify_batch.side_effect = blocking
+    other, _ = make_job(db_session)
+    worker = RetagWorker(max_workers=1, max_queued=0)
+
+    try:
+        future = worker.submit(job)
+        assert started.wait(5)
+        assert worker.is_pending(job.name)
+        with pytest.raises(RuntimeError):
+            worker.submit(job)
+        with pytest.raises(RetagWorkerBusyError):
+            worker.submit(other)
+    finally:
+        release.set()
+
+    assert future.result(5)["finished"]
+    worker.executor.shutdown(wait=True)
+    assert not worker.is_pending(job.name)
+
+
+def test_retag_worker_logs_failed_jobs(db_session: Session, closet: User):
+    """Verifies that a failed job is logged and frees its slot.
+
+    Args:
+        db_session (Session): The database session fixture.
+        closet (User): The owner of the items.
+    """
+    job, ai_service = make_job(db_session)
+    ai_service.classify_batch.side_effect = ValueError("model crashed")
+    worker = RetagWorker(max_workers=1, max_queued=0)
+
+    with patch.object(retag_job.logger, "error") as error:
+        future = worker.submit(job)
+        with pytest.raises(ValueError):
+            future.result(5)
+        worker.executor.shutdown(wait=True)
+
+    error.assert_called_once()
+    assert not worker.is_pending(job.name)